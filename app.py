@@ -1,10 +1,46 @@
-import uvicorn
-from fastapi import FastAPI, HTTPException
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+import time
+import uuid
+from fastapi import FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.routing import Match
 from pydantic import BaseModel
-from typing import Optional
-from src.graphs.graph_builder import GraphBuilder
-from src.llms.groqllm import GroqLLM
+from typing import List, Optional
+from src.api.admission import AdmissionController, AdmissionRejected
+from src.api.compression import CompressionMiddleware, negotiate_encoding
+from src.api.responses import BlogResponse, FastJSONResponse, blog_response, parse_fields, shape_state
+from src.graphs.registry import GraphRegistry
+from src.graphs.streaming import stream_graph_events, to_ndjson
+from src.cache.coalescer import RequestCoalescer
+from src.cache.response_cache import ResponseCache, make_cache_key
+from src.cache.topic_index import TopicIndex
+from src.blogs.store import FORMATS, BlogStore, make_etag
+from src.batch.runner import BatchJob, BatchRunner, BatchStats, read_jobs, to_jsonl
+from src.jobs.store import JobStore, SUCCEEDED
+from src.checkpoints.sqlite_saver import SQLiteCheckpointSaver, checkpoints_enabled
+from src.checkpoints.threads import ainvoke_in_thread, new_thread_id, thread_config
+from src.jobs.workers import JobQueue
+from src.nodes.blog_node import TranslationConfig, extract_video_id
+from src.utils.blog_parser import BlogParseError
+from src.llms.backends import get_llm_provider_class
+from src.llms.router import get_model_router, router_enabled
+from src.observability.callbacks import MetricsCallbackHandler, request_timings
+from src.observability.metrics import (
+    ADMISSION_SLOTS,
+    BLOG_STORE_READS,
+    CACHE_HIT_RATIO,
+    COALESCING_RATIO,
+    JOBS,
+    NEAR_DUPLICATE_TOPICS,
+    ROUTER_BUDGET,
+    REQUEST_DURATION,
+    REQUESTS_IN_FLIGHT,
+    metrics,
+)
 
 import os
 from dotenv import load_dotenv
@@ -16,7 +52,187 @@ try:
 except Exception:
     pass
 
-app = FastAPI()
+## LLM provider: "groq", or "fake" for the local deterministic stand-in
+LLM_BACKEND = os.getenv("LLM_BACKEND", "groq").lower()
+## route LLM calls across models by their rate-limit budgets (shared by all requests)
+MODEL_ROUTER_ENABLED = router_enabled(LLM_BACKEND)
+## optional durable checkpoints so a failed run can resume from its last completed node
+CHECKPOINTS_ENABLED = checkpoints_enabled()
+CHECKPOINT_RETENTION_SECONDS = float(os.getenv("CHECKPOINT_RETENTION_SECONDS", "86400"))
+CHECKPOINT_KEEP_COMPLETED = os.getenv("CHECKPOINT_KEEP_COMPLETED", "false").lower() in ("1", "true", "yes")
+## opened in the lifespan, like the blog and job stores
+checkpointer = None
+## compiled graphs shared by every request in this process
+graph_registry = GraphRegistry(
+    get_llm_provider_class(LLM_BACKEND),
+    router_factory=get_model_router if MODEL_ROUTER_ENABLED else None,
+)
+## cached generations keyed by (usecase, topic/video_id, language, model, prompt version)
+## identical in-flight generations share one execution, with or without the cache
+request_coalescer = RequestCoalescer.from_env()
+response_cache = ResponseCache.from_env(coalescer=request_coalescer)
+## topics already generated, so a near-duplicate topic can reuse the cached blog
+topic_index = TopicIndex.from_env()
+## generate and translate non-English blogs in one graph run, translating sections as they stream
+PIPELINED_TRANSLATION = TranslationConfig.from_env().pipeline
+## attach per-node timings to responses as a Server-Timing header
+TIMING_HEADERS_ENABLED = os.getenv("TIMING_HEADERS_ENABLED", "true").lower() not in ("0", "false", "no")
+## submit/poll job API: jobs persist in SQLite and run on background workers
+JOB_WORKERS_ENABLED = os.getenv("JOB_WORKERS_ENABLED", "true").lower() not in ("0", "false", "no")
+## upper bound on graphs a single /blogs/batch request may run at once
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "8"))
+## bounded concurrency per usecase with a fair queue; overload is rejected with 429/503 + Retry-After
+admission = AdmissionController.from_env()
+## gzip/brotli for complete response bodies of at least this many bytes (streams are never compressed)
+RESPONSE_COMPRESSION_ENABLED = os.getenv("RESPONSE_COMPRESSION_ENABLED", "true").lower() not in ("0", "false", "no")
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+## generated blogs persist in SQLite under a content-hash id, so GET /blogs/{id} re-reads them without an LLM call
+BLOG_STORE_ENABLED = os.getenv("BLOG_STORE_ENABLED", "true").lower() not in ("0", "false", "no")
+## the blog store and the job queue are opened in the lifespan, so importing the app creates no files
+blog_store = None
+job_queue = None
+
+def open_store(store_class, name: str):
+    """
+    Open a SQLite-backed store from its env settings, falling back to an
+    in-memory one when the file cannot be created (e.g. a read-only filesystem)
+    """
+    try:
+        return store_class.from_env()
+    except (OSError, sqlite3.Error) as e:
+        print(f"Could not open the {name} ({str(e)}), keeping it in memory")
+        return store_class(":memory:")
+
+def running_job_queue():
+    if job_queue is None:
+        raise HTTPException(status_code=503, detail="Job queue is not running")
+    return job_queue
+
+def collect_cache_metrics():
+    stats = response_cache.stats()
+    CACHE_HIT_RATIO.set(stats["hit_rate"])
+    COALESCING_RATIO.set(request_coalescer.stats()["coalescing_ratio"])
+
+def collect_router_metrics():
+    if graph_registry.router is None:
+        return
+    for route in graph_registry.router.status():
+        ROUTER_BUDGET.set(route["requests_available"], model=route["model"], kind="requests")
+        ROUTER_BUDGET.set(route["tokens_available"], model=route["model"], kind="tokens")
+
+def collect_job_metrics():
+    if job_queue is None:
+        return
+    for status, count in job_queue.stats().items():
+        if status in ("queued", "running", "succeeded", "failed", "cancelled"):
+            JOBS.set(count, status=status)
+
+def collect_admission_metrics():
+    for usecase, pool in admission.stats()["pools"].items():
+        ADMISSION_SLOTS.set(pool["active"], usecase=usecase, state="active")
+        ADMISSION_SLOTS.set(pool["waiting"], usecase=usecase, state="waiting")
+
+metrics.register_collector(collect_cache_metrics)
+metrics.register_collector(collect_router_metrics)
+metrics.register_collector(collect_job_metrics)
+metrics.register_collector(collect_admission_metrics)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global blog_store, checkpointer, job_queue
+    ## stores set from outside (tests, benchmarks) are left open
+    opened_checkpointer = CHECKPOINTS_ENABLED and checkpointer is None
+    if opened_checkpointer:
+        checkpointer = await asyncio.to_thread(open_store, SQLiteCheckpointSaver, "checkpoint store")
+        graph_registry.set_checkpointer(checkpointer)
+    if checkpointer is not None:
+        removed = await asyncio.to_thread(checkpointer.gc, CHECKPOINT_RETENTION_SECONDS)
+        if removed:
+            print(f"Removed checkpoints of {removed} expired threads")
+    # Compile graphs once at startup; requests compile lazily if this fails
+    try:
+        graph_registry.warmup()
+    except Exception as e:
+        print(f"Graph warmup skipped: {str(e)}")
+    opened_blog_store = BLOG_STORE_ENABLED and blog_store is None
+    if opened_blog_store:
+        blog_store = await asyncio.to_thread(open_store, BlogStore, "blog store")
+    opened_job_queue = job_queue is None
+    if opened_job_queue:
+        job_queue = JobQueue.from_env(await asyncio.to_thread(open_store, JobStore, "job store"), run_job)
+    if JOB_WORKERS_ENABLED:
+        await job_queue.start()
+    yield
+    if job_queue.started:
+        await job_queue.stop()
+    if opened_job_queue:
+        job_queue.store.close()
+        job_queue = None
+    if opened_blog_store:
+        blog_store.close()
+        blog_store = None
+    if opened_checkpointer:
+        graph_registry.set_checkpointer(None)
+        checkpointer.close()
+        checkpointer = None
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
+## added first so it sits inside the other middleware and sees each endpoint's body in one piece
+if RESPONSE_COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=RESPONSE_COMPRESSION_MIN_BYTES)
+
+def route_path(request: Request):
+    """
+    Route template for metric labels (keeps label cardinality bounded)
+    """
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return route.path
+    return "unmatched"
+
+async def in_flight_until_sent(body_iterator, path):
+    """
+    Pass the response body through, keeping the request in flight until
+    it is sent: a stream outlives the endpoint that returned it
+    """
+    try:
+        async for chunk in body_iterator:
+            yield chunk
+    finally:
+        REQUESTS_IN_FLIGHT.dec(path=path)
+
+@app.middleware("http")
+async def observe_requests(request: Request, call_next):
+    path = route_path(request)
+    timings = {}
+    token = request_timings.set(timings)
+    REQUESTS_IN_FLIGHT.inc(path=path)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    except BaseException:
+        REQUESTS_IN_FLIGHT.dec(path=path)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        REQUEST_DURATION.observe(elapsed, path=path, status=str(status))
+        request_timings.reset(token)
+    response.body_iterator = in_flight_until_sent(response.body_iterator, path)
+
+    if TIMING_HEADERS_ENABLED:
+        entries = [f"{node};dur={seconds * 1000:.1f}" for node, seconds in timings.items()]
+        entries.append(f"total;dur={elapsed * 1000:.1f}")
+        response.headers["Server-Timing"] = ", ".join(entries)
+    return response
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    ## off the event loop: collect_job_metrics counts jobs in SQLite
+    body = await asyncio.to_thread(metrics.render)
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
 
 @app.get("/")
 async def root():
@@ -24,7 +240,10 @@ async def root():
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "routes": ["/blogs/topic", "/blogs/youtube"]}
+    return {
+        "status": "healthy",
+        "routes": ["/blogs/topic", "/blogs/youtube", "/blogs/topic/stream", "/blogs/youtube/stream", "/blogs/batch", "/blogs/{blog_id}", "/jobs"],
+    }
 
 # Configure CORS
 FRONTEND_URL = os.getenv("FRONTEND_URL", "")
@@ -44,132 +263,630 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allows all methods (GET, POST, etc.)
     allow_headers=["*"],  # Allows all headers
+    expose_headers=["Server-Timing", "X-Thread-Id", "ETag"],
 )
 
 class TopicBlogRequest(BaseModel):
     topic: str
     language: Optional[str] = None
+    languages: Optional[List[str]] = None
 
 class YouTubeBlogRequest(BaseModel):
     youtube_url: str
     language: Optional[str] = None
+    languages: Optional[List[str]] = None
+
+class JobRequest(BaseModel):
+    topic: Optional[str] = None
+    youtube_url: Optional[str] = None
+    language: Optional[str] = None
+    languages: Optional[List[str]] = None
+    priority: int = 0
+    client_id: Optional[str] = None
 
-os.environ["LANGSMITH_API_KEY"]=os.getenv("LANGCHAIN_API_KEY")
+## /blogs/batch bodies read as one job per line
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl", "application/json-lines")
+
+class BatchBlogRequest(BaseModel):
+    jobs: List[dict]
+    max_concurrency: Optional[int] = None
+
+## LangSmith reads LANGSMITH_API_KEY; keep accepting the older LANGCHAIN_API_KEY name
+if os.getenv("LANGCHAIN_API_KEY") and not os.getenv("LANGSMITH_API_KEY"):
+    os.environ["LANGSMITH_API_KEY"]=os.getenv("LANGCHAIN_API_KEY")
+
+async def run_graph(usecase: str, inputs: dict):
+    """
+    Run the compiled graph for a usecase without blocking the event loop.
+    Rate limits are retried (and fall back to the secondary model) per LLM
+    call inside the nodes, so a failure never reruns completed nodes.
+    The state's `models` lists the models that actually answered.
+    """
+    graph = graph_registry.get(usecase)
+    handler = MetricsCallbackHandler()
+    config = {"callbacks": [handler]}
+    if graph.checkpointer is None:
+        state = await graph.ainvoke(inputs, config)
+        return {**state, "models": sorted(handler.models)}
+
+    thread_id = new_thread_id()
+    try:
+        state = await ainvoke_in_thread(graph, inputs, config, thread_id, usecase)
+    except Exception as e:
+        # the endpoints report this id so the client can POST /threads/{id}/resume
+        e.thread_id = thread_id
+        raise
+    if not CHECKPOINT_KEEP_COMPLETED:
+        await graph.checkpointer.adelete_thread(thread_id)
+    return {**state, "models": sorted(handler.models)}
+
+def served_by(model: str):
+    """
+    Cache predicate: keys name the default model, so output a fallback
+    model produced (even partly) is returned but not cached under them
+    """
+    return lambda state: set(state.get("models") or ()) <= {model}
+
+async def resolve_subject(usecase: str, subject: str):
+    """
+    The cache subject for a request: a previously generated topic similar
+    enough to `subject` (see TopicIndex) whose blog is still cached, else
+    `subject` itself
+    """
+    if usecase != "topic" or not response_cache.enabled:
+        return subject
+    match = topic_index.lookup(subject)
+    if match is None or match.subject == subject:
+        return subject
+    cached = await response_cache.get(make_cache_key(usecase, match.subject, "english", graph_registry.model))
+    if cached is None:
+        return subject
+    print(f"[TOPIC INDEX] '{subject}' -> '{match.subject}' (similarity {match.score:.2f})")
+    NEAR_DUPLICATE_TOPICS.inc()
+    return match.subject
+
+async def base_cached(usecase: str, subject: str):
+    return response_cache.enabled and await response_cache.get(
+        make_cache_key(usecase, subject, "english", graph_registry.model)
+    ) is not None
+
+async def generate_pipelined(usecase: str, inputs: dict, subject: str, languages: list):
+    """
+    Generate the base blog and its translations in one graph run, so
+    translation overlaps generation. The English base and every translation
+    are cached as if they had been produced separately. Returns the base
+    state and a map of language -> blog.
+    """
+    model = graph_registry.model
+    key = make_cache_key(f"{usecase}:pipelined", subject, ",".join(sorted(languages)), model)
+    state = await request_coalescer.run(
+        key, lambda: run_graph(usecase, {**inputs, "current_language": "english", "languages": languages})
+    )
+    base_state = {field: value for field, value in state.items() if field not in ("languages", "translations")}
+    translations = state["translations"]
+    if response_cache.enabled and served_by(model)(state):
+        await response_cache.set(make_cache_key(usecase, subject, "english", model), base_state)
+        for language in languages:
+            await response_cache.set(
+                make_cache_key(usecase, subject, language, model),
+                {**base_state, "current_language": language, "blog": translations[language]},
+            )
+    if usecase == "topic":
+        topic_index.add(subject)
+    return base_state, translations
+
+async def generate_blog(usecase: str, inputs: dict, subject: str, resolve=True):
+    """
+    Generate a blog through the response cache. The English base blog is
+    cached on its own, so a request for a new language only runs translation.
+    A topic close to one generated before reuses that topic's blog.
+    """
+    language = inputs.get("current_language", "english")
+    model = graph_registry.model
+    if resolve:
+        subject = await resolve_subject(usecase, subject)
+
+    if language != "english" and PIPELINED_TRANSLATION and not await base_cached(usecase, subject):
+        base_state, translations = await generate_pipelined(usecase, inputs, subject, [language])
+        return {**base_state, "current_language": language, "blog": translations[language]}
+
+    base_key = make_cache_key(usecase, subject, "english", model)
+    base_state = await response_cache.get_or_create(
+        base_key,
+        lambda: run_graph(usecase, {**inputs, "current_language": "english"}),
+        cacheable=served_by(model),
+    )
+    if usecase == "topic":
+        topic_index.add(subject)
+    if language == "english":
+        return base_state
+
+    key = make_cache_key(usecase, subject, language, model)
+    return await response_cache.get_or_create(
+        key,
+        lambda: run_graph("translation", {**base_state, "current_language": language}),
+        cacheable=served_by(model),
+    )
+
+async def generate_blog_languages(usecase: str, inputs: dict, subject: str, languages: list):
+    """
+    Generate the base blog once, then translate it into every requested
+    language in a single fan-out run of the translation graph. Returns the
+    base state with a `translations` map of language -> blog.
+    """
+    languages = list(dict.fromkeys(language.strip().lower() for language in languages))
+    subject = await resolve_subject(usecase, subject)
+    targets = [language for language in languages if language != "english"]
+    if targets and PIPELINED_TRANSLATION and not await base_cached(usecase, subject):
+        base_state, translations = await generate_pipelined(usecase, inputs, subject, targets)
+        translations = {language: translations.get(language, base_state["blog"]) for language in languages}
+        return {**base_state, "languages": languages, "translations": translations}
+
+    base_state = await generate_blog(usecase, {**inputs, "current_language": "english"}, subject, resolve=False)
+    model = graph_registry.model
+
+    translations = {}
+    missing = []
+    for language in languages:
+        if language == "english":
+            translations[language] = base_state["blog"]
+            continue
+        cached = None
+        if response_cache.enabled:
+            cached = await response_cache.get(make_cache_key(usecase, subject, language, model))
+        if cached is not None:
+            translations[language] = cached["blog"]
+        else:
+            missing.append(language)
+
+    if missing:
+        key = make_cache_key("translation", subject, ",".join(sorted(missing)), model)
+        state = await request_coalescer.run(
+            key, lambda: run_graph("translation", {**base_state, "languages": missing})
+        )
+        for language in missing:
+            translations[language] = state["translations"][language]
+            if response_cache.enabled and served_by(model)(state):
+                await response_cache.set(
+                    make_cache_key(usecase, subject, language, model),
+                    {**base_state, "current_language": language, "blog": translations[language]},
+                )
+
+    return {**base_state, "languages": languages, "translations": translations}
+
+def save_blogs(usecase: str, subject: str, state: dict, timings=None):
+    """
+    Persist the blog and translations of a state in the blog store and
+    return the state with their ids (`blog_id`, `translation_ids`)
+    """
+    model = ",".join(state.get("models") or [graph_registry.model])
+    result = dict(state)
+    if state.get("blog"):
+        result["blog_id"] = blog_store.save(
+            state["blog"], usecase, subject, state.get("current_language", "english"), model, timings
+        )
+    if state.get("languages") and state.get("translations"):
+        result["translation_ids"] = {
+            language: blog_store.save(blog, usecase, subject, language, model, timings)
+            for language, blog in state["translations"].items()
+        }
+    return result
+
+async def store_blogs(usecase: str, subject: str, state: dict):
+    """
+    save_blogs off the event loop. A failed write only costs the ids, the
+    generated blog is still returned.
+    """
+    if blog_store is None:
+        return state
+    timings = dict(request_timings.get() or {})
+    try:
+        return await asyncio.to_thread(save_blogs, usecase, subject, state, timings)
+    except Exception as e:
+        print(f"Could not store blog for {usecase} '{subject}': {str(e)}")
+        return state
+
+async def run_job(job):
+    """
+    Job queue handler: generate the blog described by a job payload through
+    the same cached path as the blocking endpoints.
+    """
+    payload = job.payload
+    if job.usecase == "topic":
+        inputs, subject = {"topic": payload["topic"]}, payload["topic"]
+    else:
+        url = payload["youtube_url"]
+        inputs, subject = {"youtube_url": url}, extract_video_id(url) or url
+    if payload.get("languages"):
+        state = await generate_blog_languages(job.usecase, inputs, subject, payload["languages"])
+    else:
+        language = (payload.get("language") or "english").lower()
+        state = await generate_blog(job.usecase, {**inputs, "current_language": language}, subject)
+    return await store_blogs(job.usecase, subject, state)
+
+async def stream_graph(usecase: str, inputs: dict, subject: str):
+    """
+    Stream graph progress and LLM tokens as NDJSON lines. Headers are already
+    sent once streaming starts, so failures are reported as an error event.
+    """
+    thread_id = None
+    try:
+        graph = graph_registry.get(usecase)
+        config = {"callbacks": [MetricsCallbackHandler()]}
+        if graph.checkpointer is not None:
+            thread_id = new_thread_id()
+            config = thread_config(config, thread_id, usecase)
+        async for event in stream_graph_events(graph, inputs, config):
+            if event["event"] == "done" and event["data"]:
+                if "video_id" in event["data"]:
+                    event["video_id"] = event["data"]["video_id"]
+                state = await store_blogs(usecase, subject, event["data"])
+                for field in ("blog_id", "translation_ids"):
+                    if field in state:
+                        event[field] = state[field]
+                event["data"] = shape_state(event["data"])
+            if thread_id:
+                event["thread_id"] = thread_id
+            yield to_ndjson(event)
+        if thread_id and not CHECKPOINT_KEEP_COMPLETED:
+            await graph.checkpointer.adelete_thread(thread_id)
+    except Exception as e:
+        print(f"Error in /blogs/{usecase}/stream: {str(e)}")
+        event = {"event": "error", "detail": str(e)}
+        if thread_id:
+            event["thread_id"] = thread_id
+        yield to_ndjson(event)
+
+async def stream_batch(jobs: list, max_concurrency: int, client_id: str = "anonymous"):
+    """
+    Stream one NDJSON result per job as it finishes, then a summary line
+    with the throughput of the whole batch. Every job takes an admission
+    slot of its usecase while it runs.
+    """
+    runner = BatchRunner(
+        graph_registry, max_concurrency=max_concurrency, admission=admission, client_id=client_id,
+        thread_prefix=f"batch-{uuid.uuid4().hex[:12]}",
+    )
+    stats = BatchStats(max_concurrency)
+    try:
+        async for record in runner.run(jobs, stats):
+            if "data" in record:
+                record = {**record, "data": shape_state(record["data"])}
+            yield to_jsonl(record)
+    except Exception as e:
+        print(f"Error in /blogs/batch: {str(e)}")
+        yield to_jsonl({"status": "error", "error": str(e)})
+    yield to_jsonl({"summary": stats.summary()})
+
+def coalesced_stream(usecase: str, inputs: dict, subject: str):
+    """
+    Identical concurrent stream requests share one graph run; clients that
+    join late receive the events sent so far, then the live ones.
+    """
+    languages = ",".join(sorted(language.lower() for language in inputs["languages"]))
+    key = make_cache_key(f"{usecase}:stream", subject, languages or inputs["current_language"], graph_registry.model)
+    return request_coalescer.stream(key, lambda: stream_graph(usecase, inputs, subject))
 
 ## API's
 
-@app.post("/blogs/topic")
-async def create_blogs_from_topic(request: TopicBlogRequest):
+def client_key(request: Request):
+    """
+    Who a request counts against for fair scheduling: its API key, the
+    X-Client-Id also used by /jobs, or the caller's address
+    """
+    headers = request.headers
+    return headers.get("x-api-key") or headers.get("x-client-id") or (request.client.host if request.client else "anonymous")
+
+async def admit(usecase: str, request: Request):
+    """
+    Wait for an admission slot, or fail fast with 429/503 and Retry-After.
+    X-Priority only counts for the keys in ADMISSION_PRIORITY_KEYS.
+    """
+    priority = admission.priority_for(request.headers.get("x-api-key"), request.headers.get("x-priority"))
+    try:
+        return await admission.acquire(usecase, client_key(request), priority)
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers={"Retry-After": str(e.retry_after)})
+
+@asynccontextmanager
+async def admitted(usecase: str, request: Request):
+    ticket = await admit(usecase, request)
+    try:
+        yield ticket
+    finally:
+        admission.release(ticket)
+
+def admitted_stream(ticket, stream):
+    return StreamingResponse(
+        admission.guard_stream(ticket, stream),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(admission.release, ticket),
+    )
+
+@app.get("/admission/stats")
+async def admission_stats():
+    return admission.stats()
+
+@app.get("/cache/stats")
+async def cache_stats():
+    return {**response_cache.stats(), "coalescing": request_coalescer.stats(), "topic_index": topic_index.stats()}
+
+def selected_fields(fields: Optional[str]):
+    try:
+        return parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+## `fields` picks the state fields to return, e.g. ?fields=blog,transcript (default: all but transcript)
+FIELDS_QUERY = Query(default=None, description="Comma-separated response fields; transcript is only sent when listed")
+
+@app.post("/blogs/topic", response_model=BlogResponse, response_model_exclude_none=True)
+async def create_blogs_from_topic(request: TopicBlogRequest, http_request: Request, fields: Optional[str] = FIELDS_QUERY):
     """
     Create a blog post from a topic.
     """
+    selected = selected_fields(fields)
     topic = request.topic
     language = request.language or 'english'
 
-    try:
-        ## get the llm object
-        groqllm = GroqLLM()
-        llm = groqllm.get_llm()
-
-        ## get the graph
-        graph_builder = GraphBuilder(llm)
-        graph = graph_builder.setup_graph(usecase="topic")
-        
+    async with admitted("topic", http_request):
         try:
-            state = graph.invoke({
-                "topic": topic,
-                "current_language": language.lower()
-            })
-        except Exception as e:
-            # Check if it's a rate limit error
-            error_str = str(e)
-            if groqllm.should_use_fallback(error_str):
-                print("Rate limit detected, retrying with fallback model...")
-                # Retry with fallback model
-                llm = groqllm.get_llm(use_fallback=True)
-                graph_builder = GraphBuilder(llm)
-                graph = graph_builder.setup_graph(usecase="topic")
-                state = graph.invoke({
+            if request.languages:
+                state = await generate_blog_languages("topic", {
+                    "topic": topic
+                }, subject=topic, languages=request.languages)
+            else:
+                state = await generate_blog("topic", {
                     "topic": topic,
                     "current_language": language.lower()
-                })
-            else:
-                raise
+                }, subject=topic)
 
-        # Include video_id in response if available
-        result = {"data": state}
-        if "video_id" in state:
-            result["video_id"] = state["video_id"]
-        return result
-    except ValueError as e:
-        print(f"ValueError in /blogs/topic: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"Error in /blogs/topic: {str(e)}")
-        print(f"Traceback: {error_trace}")
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Internal server error: {str(e)}"
-        )
+            state = await store_blogs("topic", topic, state)
+            return blog_response(state, selected)
+        except BlogParseError as e:
+            print(f"Unparsable model response in /blogs/topic: {str(e)}")
+            thread_id = getattr(e, "thread_id", None)
+            raise HTTPException(
+                status_code=502,
+                detail=str(e),
+                headers={"X-Thread-Id": thread_id} if thread_id else None,
+            )
+        except ValueError as e:
+            print(f"ValueError in /blogs/topic: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            import traceback
+            error_trace = traceback.format_exc()
+            print(f"Error in /blogs/topic: {str(e)}")
+            print(f"Traceback: {error_trace}")
+            thread_id = getattr(e, "thread_id", None)
+            raise HTTPException(
+                status_code=500, 
+                detail=f"Internal server error: {str(e)}",
+                headers={"X-Thread-Id": thread_id} if thread_id else None,
+            )
 
-@app.post("/blogs/youtube")
-async def create_blogs_from_youtube(request: YouTubeBlogRequest):
+@app.post("/blogs/youtube", response_model=BlogResponse, response_model_exclude_none=True)
+async def create_blogs_from_youtube(request: YouTubeBlogRequest, http_request: Request, fields: Optional[str] = FIELDS_QUERY):
     """
     Create a blog post from YouTube video transcript.
     """
+    selected = selected_fields(fields)
     youtube_url = request.youtube_url
     language = request.language or 'english'
+    subject = extract_video_id(youtube_url) or youtube_url
 
-    try:
-        ## get the llm object
-        groqllm = GroqLLM()
-        llm = groqllm.get_llm()
-
-        ## get the graph
-        graph_builder = GraphBuilder(llm)
-        graph = graph_builder.setup_graph(usecase="youtube")
-        
+    async with admitted("youtube", http_request):
         try:
-            state = graph.invoke({
-                "youtube_url": youtube_url,
-                "current_language": language.lower()
-            })
-        except Exception as e:
-            # Check if it's a rate limit error
-            error_str = str(e)
-            if groqllm.should_use_fallback(error_str):
-                print("Rate limit detected, retrying with fallback model...")
-                # Retry with fallback model
-                llm = groqllm.get_llm(use_fallback=True)
-                graph_builder = GraphBuilder(llm)
-                graph = graph_builder.setup_graph(usecase="youtube")
-                state = graph.invoke({
+            if request.languages:
+                state = await generate_blog_languages("youtube", {
+                    "youtube_url": youtube_url
+                }, subject=subject, languages=request.languages)
+            else:
+                state = await generate_blog("youtube", {
                     "youtube_url": youtube_url,
                     "current_language": language.lower()
-                })
-            else:
-                raise
+                }, subject=subject)
+
+            state = await store_blogs("youtube", subject, state)
+            return blog_response(state, selected)
+        except BlogParseError as e:
+            print(f"Unparsable model response in /blogs/youtube: {str(e)}")
+            thread_id = getattr(e, "thread_id", None)
+            raise HTTPException(
+                status_code=502,
+                detail=str(e),
+                headers={"X-Thread-Id": thread_id} if thread_id else None,
+            )
+        except ValueError as e:
+            print(f"ValueError in /blogs/youtube: {str(e)}")
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            import traceback
+            error_trace = traceback.format_exc()
+            print(f"Error in /blogs/youtube: {str(e)}")
+            print(f"Traceback: {error_trace}")
+            thread_id = getattr(e, "thread_id", None)
+            raise HTTPException(
+                status_code=500, 
+                detail=f"Internal server error: {str(e)}",
+                headers={"X-Thread-Id": thread_id} if thread_id else None,
+            )
+
+@app.post("/blogs/topic/stream")
+async def stream_blogs_from_topic(request: TopicBlogRequest, http_request: Request):
+    """
+    Stream a blog post generated from a topic as NDJSON events.
+    """
+    language = request.language or 'english'
+    ticket = await admit("topic", http_request)
+    return admitted_stream(ticket, coalesced_stream("topic", {
+        "topic": request.topic,
+        "current_language": language.lower(),
+        "languages": request.languages or [],
+    }, subject=request.topic))
 
-        # Include video_id in response if available
-        result = {"data": state}
-        if "video_id" in state:
-            result["video_id"] = state["video_id"]
-        return result
+@app.post("/blogs/youtube/stream")
+async def stream_blogs_from_youtube(request: YouTubeBlogRequest, http_request: Request):
+    """
+    Stream a blog post generated from a YouTube transcript as NDJSON events.
+    """
+    language = request.language or 'english'
+    ticket = await admit("youtube", http_request)
+    return admitted_stream(ticket, coalesced_stream("youtube", {
+        "youtube_url": request.youtube_url,
+        "current_language": language.lower(),
+        "languages": request.languages or [],
+    }, subject=extract_video_id(request.youtube_url) or request.youtube_url))
+
+def not_modified(if_none_match: Optional[str], etag: str):
+    """
+    Whether an If-None-Match header matches the ETag (weak comparison)
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+## content-addressed: the body behind an id never changes
+STORED_BLOG_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+@app.get("/blogs/{blog_id}")
+async def get_stored_blog(blog_id: str, request: Request, format: str = Query(default="json", description="json or html")):
+    """
+    A stored blog by id. The ETag is the content hash, so revalidation with
+    If-None-Match answers 304 without reading the body; it is weak since the
+    gzip and identity bodies carry the same one. Clients that accept
+    gzip get the stored compressed bytes as they are; others get them
+    decompressed as a stream.
+    """
+    if blog_store is None:
+        raise HTTPException(status_code=404, detail="Blog store is disabled")
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unknown format '{format}'. Choose from: {', '.join(FORMATS)}")
+    etag = make_etag(blog_id, format)
+    headers = {"ETag": etag, "Cache-Control": STORED_BLOG_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if not_modified(request.headers.get("if-none-match"), etag) and await asyncio.to_thread(blog_store.exists, blog_id):
+        BLOG_STORE_READS.inc(format=format, result="not_modified")
+        return Response(status_code=304, headers=headers)
+
+    stored = await asyncio.to_thread(blog_store.get, blog_id, format)
+    if stored is None:
+        BLOG_STORE_READS.inc(format=format, result="miss")
+        if format != "json" and await asyncio.to_thread(blog_store.exists, blog_id):
+            raise HTTPException(status_code=404, detail=f"No {format} version stored for this blog")
+        raise HTTPException(status_code=404, detail="Blog not found")
+    BLOG_STORE_READS.inc(format=format, result="hit")
+    if negotiate_encoding(request.headers.get("accept-encoding", ""), brotli_available=False) == "gzip":
+        return Response(stored.body, media_type=stored.media_type, headers={**headers, "Content-Encoding": "gzip"})
+    return StreamingResponse(
+        stored.iter_decompressed(), media_type=stored.media_type,
+        headers={**headers, "Content-Length": str(stored.size)},
+    )
+
+@app.post("/blogs/batch")
+async def create_blogs_batch(http_request: Request, max_concurrency: Optional[int] = None):
+    """
+    Generate many blogs in one request. Each job is a topic or YouTube job
+    like the single-blog endpoints; results stream back as NDJSON in the
+    order jobs complete. The body is either JSON `{"jobs": [...],
+    "max_concurrency"?}` or one job per line (`application/x-ndjson`, the
+    format of the batch CLI's input file).
+    """
+    content_type = http_request.headers.get("content-type", "").split(";")[0].strip().lower()
+    body = await http_request.body()
+    try:
+        if content_type in NDJSON_CONTENT_TYPES:
+            jobs = read_jobs(body.decode("utf-8").splitlines())
+        else:
+            request = BatchBlogRequest.model_validate_json(body)
+            jobs = [BatchJob.from_dict(job) for job in request.jobs]
+            max_concurrency = max_concurrency or request.max_concurrency
     except ValueError as e:
-        print(f"ValueError in /blogs/youtube: {str(e)}")
+        # pydantic's ValidationError and UnicodeDecodeError are ValueErrors too
         raise HTTPException(status_code=400, detail=str(e))
+    max_concurrency = min(max_concurrency or BATCH_MAX_CONCURRENCY, BATCH_MAX_CONCURRENCY)
+    return StreamingResponse(
+        stream_batch(jobs, max(1, max_concurrency), client_key(http_request)),
+        media_type="application/x-ndjson",
+    )
+
+@app.post("/threads/{thread_id}/resume", response_model=BlogResponse, response_model_exclude_none=True)
+async def resume_thread(thread_id: str, http_request: Request, fields: Optional[str] = FIELDS_QUERY):
+    """
+    Continue a failed run from its last completed node (needs CHECKPOINTS_ENABLED)
+    """
+    selected = selected_fields(fields)
+    if checkpointer is None:
+        raise HTTPException(status_code=404, detail="Checkpointing is disabled")
+    checkpoint = await checkpointer.aget_tuple({"configurable": {"thread_id": thread_id}})
+    if checkpoint is None:
+        raise HTTPException(status_code=404, detail="Thread not found")
+    usecase = checkpoint.metadata.get("usecase")
+    try:
+        graph = graph_registry.get(usecase)
+        config = {"callbacks": [MetricsCallbackHandler()]}
+        ## translation-only threads share the topic pool
+        async with admitted(usecase if usecase in admission.limits else "topic", http_request):
+            state = await ainvoke_in_thread(graph, None, config, thread_id, usecase, resume=True)
+    except HTTPException:
+        raise
+    except BlogParseError as e:
+        raise HTTPException(status_code=502, detail=str(e), headers={"X-Thread-Id": thread_id})
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"Error in /blogs/youtube: {str(e)}")
-        print(f"Traceback: {error_trace}")
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Internal server error: {str(e)}"
-        )
+        print(f"Error resuming thread {thread_id}: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}",
+                            headers={"X-Thread-Id": thread_id})
+    if not CHECKPOINT_KEEP_COMPLETED:
+        await checkpointer.adelete_thread(thread_id)
+    return blog_response(state, selected, thread_id=thread_id)
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: JobRequest, x_client_id: Optional[str] = Header(default=None)):
+    """
+    Queue a topic or YouTube blog for background generation and return its
+    id straight away. Poll GET /jobs/{job_id} and fetch /jobs/{job_id}/result.
+    """
+    if bool(request.topic) == bool(request.youtube_url):
+        raise HTTPException(status_code=400, detail="Provide exactly one of 'topic' or 'youtube_url'")
+    usecase = "topic" if request.topic else "youtube"
+    payload = request.model_dump(include={"topic", "youtube_url", "language", "languages"}, exclude_none=True)
+    client_id = request.client_id or x_client_id or "anonymous"
+    job = await running_job_queue().submit(usecase, payload, client_id=client_id, priority=request.priority)
+    return job.to_dict()
+
+@app.get("/jobs/stats")
+async def job_stats():
+    return await asyncio.to_thread(running_job_queue().stats)
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = await running_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+@app.get("/jobs/{job_id}/result", response_model=BlogResponse, response_model_exclude_none=True)
+async def get_job_result(job_id: str, fields: Optional[str] = FIELDS_QUERY):
+    selected = selected_fields(fields)
+    job = await running_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != SUCCEEDED:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    return blog_response(job.result, selected)
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    queue = running_job_queue()
+    if not await queue.cancel(job_id):
+        job = await queue.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        raise HTTPException(status_code=409, detail=f"Job is already {job.status}")
+    return (await queue.get(job_id)).to_dict()
 
 if __name__=="__main__":
+    import uvicorn
     uvicorn.run("app:app",host="0.0.0.0",port=8000,reload=True)
 
@@ -0,0 +1,160 @@
+"""
+Goodput under overload with and without admission control.
+
+A stub provider serves at most `--capacity` concurrent LLM calls and
+answers any call beyond that with a 429 (Retry-After), like a rate-limited
+API. Open-loop traffic at increasing multiples of its capacity hits
+/blogs/topic from several API keys, one of them sending most of the
+requests. A request counts toward goodput only if it succeeds within
+`--slo` seconds (clients give up after that).
+
+Without admission every request starts LLM calls at once. The retries
+pile up, latency passes the SLO, and the server keeps spending provider
+capacity on requests whose clients have already left. With admission the
+pool matches the provider, and the excess gets a fast 429/503 with
+Retry-After, so goodput stays near capacity.
+
+    python benchmarks/bench_admission.py --capacity 4 --latency 0.5 --loads 0.5 1 2 4
+"""
+import argparse
+import asyncio
+import contextlib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["LLM_BACKEND"] = "fake"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["MODEL_ROUTER_ENABLED"] = "false"
+os.environ["JOB_WORKERS_ENABLED"] = "false"
+os.environ["TRANSCRIPT_CACHE_DIR"] = ""
+
+import httpx
+
+import app as blog_app
+from src.api.admission import AdmissionController
+from src.graphs.registry import GraphRegistry
+from src.llms.fakellm import FakeChatModel, FakeLLM, FakeRateLimitError
+
+CLIENTS = ("heavy", "light-1", "light-2", "light-3")
+WEIGHTS = (0.7, 0.1, 0.1, 0.1)
+
+
+class SaturatingChatModel(FakeChatModel):
+    """
+    Fake provider with a concurrency limit: calls beyond `capacity` fail
+    at once with a 429 asking to retry after `retry_after` seconds
+    """
+
+    capacity: int = 4
+    inflight: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        if self.inflight >= self.capacity:
+            raise FakeRateLimitError(self.retry_after)
+        self.inflight += 1
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.inflight -= 1
+        return self._result(messages, self._text(messages))
+
+
+class SaturatingLLM(FakeLLM):
+    def __init__(self, model):
+        super().__init__(latency=model.latency)
+        self.model = model
+
+    def get_llm(self, use_fallback=False, model=None):
+        # primary and fallback share the provider's capacity
+        return self.model
+
+
+async def request(client, index, slo, results, abandoned):
+    key = random.choices(CLIENTS, WEIGHTS)[0]
+    start = time.perf_counter()
+    call = asyncio.create_task(
+        client.post("/blogs/topic", json={"topic": f"Load test topic {index}"}, headers={"x-api-key": key})
+    )
+    try:
+        # shielded: like a real server, the app keeps working on a request its client gave up on
+        response = await asyncio.wait_for(asyncio.shield(call), timeout=slo)
+        outcome = {200: "ok", 429: "rejected", 503: "rejected"}.get(response.status_code, "failed")
+    except asyncio.TimeoutError:
+        outcome = "timeout"
+        abandoned.append(call)
+    results.append((key, outcome, time.perf_counter() - start))
+
+
+async def run_load(rate, duration, slo):
+    transport = httpx.ASGITransport(app=blog_app.app)
+    results = []
+    abandoned = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        tasks = []
+        start = time.perf_counter()
+        for index in range(int(rate * duration)):
+            # Poisson arrivals
+            await asyncio.sleep(random.expovariate(rate))
+            tasks.append(asyncio.create_task(request(client, index, slo, results, abandoned)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+        # let the abandoned requests finish before the next run
+        await asyncio.gather(*abandoned, return_exceptions=True)
+    return results, elapsed
+
+
+def summarize(label, results, elapsed):
+    by_outcome = {outcome: sum(1 for _, o, _ in results if o == outcome) for outcome in ("ok", "rejected", "timeout", "failed")}
+    rejected = sorted(t for _, o, t in results if o == "rejected")
+    reject_ms = rejected[len(rejected) // 2] * 1000 if rejected else 0.0
+    light = [o for key, o, _ in results if key != "heavy"]
+    light_ok = sum(1 for o in light if o == "ok") / len(light) if light else 0.0
+    print(
+        f"  {label:<9} goodput={by_outcome['ok'] / elapsed:5.2f}/s  ok={by_outcome['ok']:>3} "
+        f"rejected={by_outcome['rejected']:>3} (p50 {reject_ms:4.0f}ms) timeout={by_outcome['timeout']:>3} "
+        f"failed={by_outcome['failed']:>3}  light clients ok={light_ok:5.1%}"
+    )
+
+
+async def run(args):
+    model = SaturatingChatModel(latency=args.latency, capacity=args.capacity, retry_after=args.latency)
+    blog_app.graph_registry = GraphRegistry(lambda: SaturatingLLM(model))
+    blog_app.graph_registry.warmup()
+    capacity_rate = args.capacity / args.latency
+    print(f"provider capacity {capacity_rate:.1f} requests/s ({args.capacity} concurrent x {args.latency}s), slo={args.slo}s")
+    for load in args.loads:
+        rate = capacity_rate * load
+        print(f"offered load {load}x = {rate:.1f} requests/s for {args.duration}s")
+        for label, enabled in (("no admit", False), ("admission", True)):
+            random.seed(load)
+            blog_app.admission = AdmissionController(
+                limits={"topic": args.capacity, "youtube": args.capacity},
+                max_wait=args.max_wait,
+                max_client_queue=args.client_queue,
+                service_time=args.latency,
+                enabled=enabled,
+            )
+            # the endpoints log every failed generation; keep the summary readable
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                results, elapsed = await run_load(rate, args.duration, args.slo)
+            summarize(label, results, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--capacity", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--loads", type=float, nargs="+", default=[0.5, 1, 2, 4])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--slo", type=float, default=3.0)
+    parser.add_argument("--max-wait", type=float, default=1.5)
+    parser.add_argument("--client-queue", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
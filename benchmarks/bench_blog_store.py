@@ -0,0 +1,137 @@
+"""
+Cost of viewing a generated blog again: regenerate vs. read from the blog store.
+
+Generates a few long topic blogs through /blogs/topic with the fake
+backend (response cache off, so every POST is a full generation), then
+reads each one back through GET /blogs/{id}: with gzip (the stored bytes
+as they are), without (decompressed stream), as HTML, and revalidated with
+If-None-Match (304). The store is an on-disk SQLite file.
+
+    python benchmarks/bench_blog_store.py --blogs 5 --reads 500 --latency 0.5
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["LLM_BACKEND"] = "fake"
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["TOPIC_INDEX_ENABLED"] = "false"
+os.environ["ADMISSION_ENABLED"] = "false"
+os.environ["JOB_WORKERS_ENABLED"] = "false"
+os.environ["TRANSCRIPT_CACHE_DIR"] = ""
+
+import httpx
+
+import app as blog_app
+from src.blogs.store import BlogStore, markdown
+from src.graphs.registry import GraphRegistry
+from src.llms.fakellm import FakeChatModel, FakeLLM
+
+
+def make_blog(seed, sections=12, words_per_section=150):
+    """
+    Long Markdown blog drawn from a Zipf-ish vocabulary, so it compresses
+    roughly like prose instead of a repeated phrase
+    """
+    rng = random.Random(seed)
+    letters = "etaoinshrdlucmfwyp"
+    vocabulary = ["".join(rng.choice(letters) for _ in range(rng.randint(2, 9))) for _ in range(3000)]
+    weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+    parts = [f"# Benchmark Blog {seed}\n\n"]
+    for i in range(sections):
+        body = " ".join(rng.choices(vocabulary, cum_weights=weights, k=words_per_section))
+        parts.append(f"## Section {i}\n\n{body}\n\n")
+    return "".join(parts)
+
+
+class LongBlogChatModel(FakeChatModel):
+    """
+    Fake model answering each prompt (i.e. each topic) with its own long blog
+    """
+
+    def _text(self, messages):
+        prompt = str(messages[-1].content) if messages else ""
+        return make_blog(zlib.crc32(prompt.encode("utf-8")))
+
+
+class LongBlogLLM(FakeLLM):
+    def get_llm(self, use_fallback=False, model=None):
+        return LongBlogChatModel(model_name=model or self.current_model, latency=self.latency)
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples) * 1000, samples[int(len(samples) * 0.99) - 1] * 1000
+
+
+async def timed_reads(client, ids, reads, headers=None, params=None, expect=200):
+    latencies = []
+    wire = 0
+    for i in range(reads):
+        blog_id = ids[i % len(ids)]
+        request_headers = dict(headers or {})
+        if request_headers.get("if-none-match") == "etag":
+            request_headers["if-none-match"] = f'W/"{blog_id}"'
+        start = time.perf_counter()
+        response = await client.get(f"/blogs/{blog_id}", headers=request_headers, params=params)
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == expect, response.text
+        wire += int(response.headers.get("content-length", len(response.content)))
+    return latencies, wire / reads
+
+
+async def run(args):
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-blog-store-"), "blogs.sqlite3")
+    blog_app.blog_store = BlogStore(path)
+    blog_app.graph_registry = GraphRegistry(lambda: LongBlogLLM(latency=args.latency))
+    blog_app.graph_registry.warmup()
+
+    transport = httpx.ASGITransport(app=blog_app.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        ids = []
+        generation = []
+        for index in range(args.blogs):
+            start = time.perf_counter()
+            response = await client.post("/blogs/topic", json={"topic": f"Benchmark topic {index}"})
+            generation.append(time.perf_counter() - start)
+            ids.append(response.json()["blog_id"])
+
+        stats = blog_app.blog_store.stats()
+        print(
+            f"stored {stats['blogs']} blogs: {stats['bytes'] / 1024:.0f}KB -> {stats['stored_bytes'] / 1024:.0f}KB "
+            f"on disk (ratio {stats['compression_ratio']}), html={'yes' if markdown else 'no (install markdown)'}"
+        )
+        print(f"{'view':<24} {'p50':>9} {'p99':>9} {'bytes/view':>11}")
+        print(f"{'regenerate (POST)':<24} {statistics.median(generation) * 1000:>7.1f}ms {max(generation) * 1000:>7.1f}ms {'-':>11}")
+        cases = [
+            ("GET gzip", {"accept-encoding": "gzip"}, None, 200),
+            ("GET identity (stream)", {"accept-encoding": "identity"}, None, 200),
+            ("GET If-None-Match", {"if-none-match": "etag"}, None, 304),
+        ]
+        if markdown is not None:
+            cases.append(("GET html gzip", {"accept-encoding": "gzip"}, {"format": "html"}, 200))
+        for label, headers, params, expect in cases:
+            latencies, wire = await timed_reads(client, ids, args.reads, headers, params, expect)
+            p50, p99 = percentiles(latencies)
+            print(f"{label:<24} {p50:>7.2f}ms {p99:>7.2f}ms {wire:>11.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blogs", type=int, default=5)
+    parser.add_argument("--reads", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Cost and benefit of the SQLite checkpointer, against a fake LLM.
+
+- Overhead: runs topic graphs with French translation, with and without
+  the checkpointer, and reports the time spent inside checkpoint writes as
+  a share of the run time, plus the bytes stored per run.
+- Resume: fails the translation once, resumes the thread and counts the
+  LLM calls that were not paid for again.
+
+    python benchmarks/bench_checkpointing.py --runs 20 --latency 0.2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-dummy-key")
+
+from src.llms.fakellm import FakeChatModel
+from src.checkpoints import sqlite_saver
+from src.checkpoints.sqlite_saver import SQLiteCheckpointSaver
+from src.checkpoints.threads import ainvoke_in_thread
+from src.graphs.graph_builder import GraphBuilder
+from src.llms.retry import RetryPolicy
+
+CALLS = Counter()
+
+
+class TimedSaver(SQLiteCheckpointSaver):
+    io_seconds = 0.0
+
+    def put(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().put(*args, **kwargs)
+        finally:
+            self.io_seconds += time.perf_counter() - start
+
+    def put_writes(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().put_writes(*args, **kwargs)
+        finally:
+            self.io_seconds += time.perf_counter() - start
+
+
+class FlakyFakeChatModel(FakeChatModel):
+    failures_left: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        prompt = str(messages[-1].content)
+        kind = "translation" if "Translate" in prompt else "generation"
+        CALLS[kind] += 1
+        if kind == "translation" and self.failures_left > 0:
+            self.failures_left -= 1
+            raise RuntimeError("simulated crash during translation")
+        return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+
+def build(llm, checkpointer=None):
+    builder = GraphBuilder(llm)
+    graph = builder.setup_graph("topic", checkpointer=checkpointer)
+    builder.blog_node_obj.invoker.policy = RetryPolicy(max_attempts=1)
+    builder.blog_node_obj.translation_config.retries = 0
+    return graph
+
+
+async def overhead(runs, latency, directory):
+    inputs = {"topic": "Agentic AI", "current_language": "french"}
+    graph = build(FlakyFakeChatModel(latency=latency))
+    start = time.perf_counter()
+    for _ in range(runs):
+        await graph.ainvoke(inputs)
+    plain = time.perf_counter() - start
+
+    for threshold, label in ((sqlite_saver.COMPRESS_MIN_BYTES, "zlib"), (float("inf"), "raw")):
+        sqlite_saver.COMPRESS_MIN_BYTES = threshold
+        saver = TimedSaver(os.path.join(directory, f"{label}.sqlite3"))
+        graph = build(FlakyFakeChatModel(latency=latency), saver)
+        start = time.perf_counter()
+        for index in range(runs):
+            await ainvoke_in_thread(graph, inputs, None, f"run-{index}", "topic")
+        elapsed = time.perf_counter() - start
+        stored = sum(
+            len(row[0] or b"")
+            for table, column in (("checkpoints", "checkpoint"), ("blobs", "data"), ("writes", "data"))
+            for row in saver._conn.execute(f"SELECT {column} FROM {table}")
+        )
+        print(
+            f"{label:<5} runs={runs}  plain={plain / runs * 1000:6.1f}ms/run  "
+            f"checkpointed={elapsed / runs * 1000:6.1f}ms/run  "
+            f"checkpoint writes={saver.io_seconds / runs * 1000:5.2f}ms/run "
+            f"({saver.io_seconds / elapsed:.1%} of run time)  stored={stored / runs / 1024:5.1f}KiB/run"
+        )
+
+
+async def resume(latency, directory):
+    saver = SQLiteCheckpointSaver(os.path.join(directory, "resume.sqlite3"))
+    graph = build(FlakyFakeChatModel(latency=latency, failures_left=1), saver)
+    inputs = {"topic": "Agentic AI", "current_language": "french"}
+    CALLS.clear()
+    try:
+        await ainvoke_in_thread(graph, inputs, None, "crashed", "topic")
+    except RuntimeError:
+        pass
+    first = dict(CALLS)
+    CALLS.clear()
+    await ainvoke_in_thread(graph, inputs, None, "crashed", "topic", resume=True)
+    print(f"resume  failed run calls={first}  resumed run calls={dict(CALLS)} (generation not repeated)")
+
+
+async def main(runs, latency):
+    with tempfile.TemporaryDirectory() as directory:
+        await overhead(runs, latency, directory)
+        await resume(latency, directory)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(main(args.runs, args.latency))
@@ -0,0 +1,88 @@
+"""
+Compare single-prompt vs map-reduce transcript summarization.
+
+A fake model charges a fixed latency plus a per-input-token prefill cost
+and counts every prompt token it receives. For each transcript size the
+benchmark reports wall time, total input tokens and the largest single
+prompt, and whether that prompt fits the model's context window.
+
+    python benchmarks/bench_chunked_summarization.py --sizes 2000,20000,100000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.llms.fakellm import FakeChatModel
+from src.nodes.blog_node import BlogNode
+from src.transcripts.chunking import ChunkingConfig, estimate_tokens
+from src.transcripts.store import TranscriptStore
+
+
+class MeteredFakeChatModel(FakeChatModel):
+    prefill_seconds_per_token: float = 0.00002
+    input_tokens: int = 0
+    largest_prompt: int = 0
+    calls: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        tokens = sum(estimate_tokens(str(m.content)) for m in messages)
+        self.input_tokens += tokens
+        self.largest_prompt = max(self.largest_prompt, tokens)
+        self.calls += 1
+        await asyncio.sleep(self.latency + tokens * self.prefill_seconds_per_token)
+        return self._result(messages, self._text(messages))
+
+
+def make_transcript(words):
+    vocabulary = "agents plan tools memory retrieval graph state nodes edges model".split()
+    return " ".join(vocabulary[i % len(vocabulary)] for i in range(words))
+
+
+async def measure(transcript, config, latency):
+    llm = MeteredFakeChatModel(latency=latency)
+    node = BlogNode(llm, transcript_store=TranscriptStore(directory=None), chunking_config=config)
+    start = time.perf_counter()
+    await node.agenerate_blog_from_transcript({"transcript": transcript})
+    return time.perf_counter() - start, llm
+
+
+async def run(sizes, chunk_tokens, overlap, concurrency, latency, context_window):
+    single = ChunkingConfig(threshold_tokens=10**12)
+    chunked = ChunkingConfig(
+        chunk_tokens=chunk_tokens,
+        overlap_tokens=overlap,
+        max_concurrency=concurrency,
+        threshold_tokens=chunk_tokens,
+    )
+    print(f"chunk_tokens={chunk_tokens} overlap={overlap} concurrency={concurrency}")
+    print(f"{'words':>8} {'mode':<8} {'calls':>5} {'wall_s':>7} {'input_tok':>10} {'max_prompt':>10} {'fits_ctx':>8}")
+    for words in sizes:
+        transcript = make_transcript(words)
+        for label, config in (("single", single), ("chunked", chunked)):
+            elapsed, llm = await measure(transcript, config, latency)
+            print(
+                f"{words:>8} {label:<8} {llm.calls:>5} {elapsed:>7.2f} "
+                f"{llm.input_tokens:>10} {llm.largest_prompt:>10} "
+                f"{'yes' if llm.largest_prompt <= context_window else 'NO':>8}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="2000,20000,100000")
+    parser.add_argument("--chunk-tokens", type=int, default=3000)
+    parser.add_argument("--overlap", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--context-window", type=int, default=131072)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    asyncio.run(run(sizes, args.chunk_tokens, args.overlap, args.concurrency, args.latency, args.context_window))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Request coalescing for identical in-flight generations, cache disabled.
+
+Fires bursts of identical /blogs/topic and /blogs/topic/stream requests
+(a trending topic) at app.py backed by a fake LLM, with the response
+cache off, and reports LLM calls and the coalescing ratio with request
+coalescing enabled and disabled. Every client must still get the full
+result / stream.
+
+    python benchmarks/bench_coalescing.py --clients 50 --latency 0.2
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-dummy-key")
+os.environ.setdefault("LANGCHAIN_API_KEY", "benchmark-dummy-key")
+os.environ.setdefault("JOB_WORKERS_ENABLED", "false")
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+import httpx
+
+import app as blog_app
+from src.llms.fakellm import FakeChatModel, FakeLLM
+from src.cache.coalescer import RequestCoalescer
+from src.cache.response_cache import ResponseCache
+from src.graphs.registry import GraphRegistry
+
+
+class CountingFakeChatModel(FakeChatModel):
+    calls: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        CountingFakeChatModel.calls += 1
+        return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        CountingFakeChatModel.calls += 1
+        async for chunk in super()._astream(messages, stop, run_manager, **kwargs):
+            yield chunk
+
+
+class CountingProvider(FakeLLM):
+    def get_llm(self, use_fallback=False, model=None):
+        model = model or self.current_model
+        if model not in self._clients:
+            # named like the real clients, so responses are cached under the model that served them
+            self._clients[model] = CountingFakeChatModel(model_name=model, latency=self.latency)
+        return self._clients[model]
+
+
+def setup(coalescing, latency):
+    CountingFakeChatModel.calls = 0
+    blog_app.graph_registry = GraphRegistry(lambda: CountingProvider(latency=latency))
+    blog_app.request_coalescer = RequestCoalescer(enabled=coalescing)
+    blog_app.response_cache = ResponseCache(enabled=False, coalescer=blog_app.request_coalescer)
+
+
+async def blocking_burst(client, clients):
+    payload = {"topic": "Trending topic", "language": "french"}
+    responses = await asyncio.gather(*(client.post("/blogs/topic", json=payload) for _ in range(clients)))
+    titles = {response.json()["data"]["blog"]["title"] for response in responses}
+    return all(response.status_code == 200 for response in responses) and len(titles) == 1
+
+
+async def stream_burst(client, clients):
+    payload = {"topic": "Trending topic"}
+    responses = await asyncio.gather(*(client.post("/blogs/topic/stream", json=payload) for _ in range(clients)))
+    finals = [json.loads(response.text.splitlines()[-1]) for response in responses]
+    return all(final["event"] == "done" for final in finals)
+
+
+async def run(label, burst, coalescing, clients, latency):
+    setup(coalescing, latency)
+    transport = httpx.ASGITransport(app=blog_app.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        start = time.perf_counter()
+        ok = await burst(client, clients)
+        elapsed = time.perf_counter() - start
+    stats = blog_app.request_coalescer.stats()
+    print(
+        f"{label:<9} coalescing={'on ' if coalescing else 'off'}  clients={clients}  "
+        f"llm_calls={CountingFakeChatModel.calls:4d}  ratio={stats['coalescing_ratio']:.2f}  "
+        f"wall={elapsed:.2f}s  all_ok={ok}"
+    )
+
+
+async def main(clients, latency):
+    for label, burst in (("blocking", blocking_burst), ("stream", stream_burst)):
+        for coalescing in (False, True):
+            await run(label, burst, coalescing, clients, latency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(main(args.clients, args.latency))
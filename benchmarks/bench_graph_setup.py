@@ -0,0 +1,68 @@
+"""
+Benchmark the per-request graph setup cost.
+
+"before" rebuilds GroqLLM, the ChatGroq client, GraphBuilder and the
+compiled StateGraph for every request (the old app.py behaviour).
+"after" fetches the already compiled graph from GraphRegistry.
+
+No network calls are made: only client construction and graph compilation
+are timed.
+
+    python benchmarks/bench_graph_setup.py --requests 200
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-dummy-key")
+
+from src.graphs.graph_builder import GraphBuilder
+from src.graphs.registry import GraphRegistry
+from src.llms.groqllm import GroqLLM
+
+
+def per_request_setup(usecase):
+    groqllm = GroqLLM()
+    llm = groqllm.get_llm()
+    return GraphBuilder(llm).setup_graph(usecase=usecase)
+
+
+def report(label, timings):
+    timings = sorted(timings)
+    mean = sum(timings) / len(timings)
+    p50 = timings[len(timings) // 2]
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"{label:<8} mean={mean * 1000:8.3f}ms  p50={p50 * 1000:8.3f}ms  p99={p99 * 1000:8.3f}ms")
+    return mean
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--usecase", default="topic", choices=["topic", "youtube"])
+    args = parser.parse_args()
+
+    before = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        per_request_setup(args.usecase)
+        before.append(time.perf_counter() - start)
+
+    registry = GraphRegistry(GroqLLM)
+    registry.warmup()
+    after = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        registry.get(args.usecase)
+        after.append(time.perf_counter() - start)
+
+    print(f"usecase={args.usecase} requests={args.requests}")
+    before_mean = report("before", before)
+    after_mean = report("after", after)
+    print(f"speedup  {before_mean / max(after_mean, 1e-9):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
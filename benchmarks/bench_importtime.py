@@ -0,0 +1,69 @@
+"""
+Cold-start import budget for serverless deployment.
+
+Imports `app` in fresh interpreters with `python -X importtime`, without
+GROQ_API_KEY / LANGCHAIN_API_KEY set, and reports the median cumulative
+import time and the heaviest top-level imports. Fails (exit code 1) when
+the median exceeds the budget or when a module that should load lazily
+(the Groq client, yt-dlp, youtube-transcript-api) is imported.
+
+    python benchmarks/bench_importtime.py --runs 5 --budget-ms 1500
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAZY_MODULES = ("langchain_groq", "groq", "yt_dlp", "youtube_transcript_api")
+_LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_profile(module):
+    env = {key: value for key, value in os.environ.items()
+           if key not in ("GROQ_API_KEY", "LANGCHAIN_API_KEY", "LANGSMITH_API_KEY")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{result.stderr[-2000:]}")
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            rows.append((int(match.group(2)), len(match.group(3)), match.group(4)))
+    return rows
+
+
+def main(module, runs, budget_ms):
+    totals = []
+    rows = []
+    for _ in range(runs):
+        rows = import_profile(module)
+        totals.append(next(total for total, _, name in rows if name == module) / 1000)
+    median = statistics.median(totals)
+
+    print(f"import {module}: median {median:.0f}ms over {runs} runs (budget {budget_ms:.0f}ms)")
+    top_level = sorted((row for row in rows if row[1] == 3), reverse=True)[:8]
+    for total, _, name in top_level:
+        print(f"  {total / 1000:7.1f}ms  {name}")
+
+    imported = {name for _, _, name in rows}
+    eager = [name for name in LAZY_MODULES if name in imported]
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+    if median > budget_ms:
+        print("FAIL: over budget")
+    return 1 if eager or median > budget_ms else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("IMPORT_BUDGET_MS", "1500")))
+    args = parser.parse_args()
+    raise SystemExit(main(args.module, args.runs, args.budget_ms))
@@ -0,0 +1,99 @@
+"""
+Job queue latency and throughput against a fake LLM.
+
+1. Submit latency: POST /jobs through the ASGI app while workers are busy
+   (p50/p99 in ms; the handler must not wait for generation).
+2. Throughput: drain N queued topic jobs with 1, 4 and 8 workers.
+3. Per-client cap: one client floods the queue, a second client submits
+   one job afterwards and should still start without waiting for the
+   flood to drain.
+
+    python benchmarks/bench_job_queue.py --jobs 32 --latency 0.2
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-dummy-key")
+os.environ.setdefault("LANGCHAIN_API_KEY", "benchmark-dummy-key")
+os.environ.setdefault("JOB_WORKERS_ENABLED", "false")
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "false")
+
+import httpx
+
+import app as blog_app
+from src.llms.fakellm import FakeLLM
+from src.graphs.registry import GraphRegistry
+from src.jobs.store import JobStore
+from src.jobs.workers import JobQueue
+
+
+async def wait_for(store, job_ids):
+    while any(store.get(job_id).status in ("queued", "running") for job_id in job_ids):
+        await asyncio.sleep(0.02)
+
+
+async def submit_latency(count):
+    blog_app.job_queue = JobQueue(JobStore(), blog_app.run_job, workers=4)
+    await blog_app.job_queue.start()
+    transport = httpx.ASGITransport(app=blog_app.app)
+    latencies = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for index in range(count):
+            start = time.perf_counter()
+            response = await client.post("/jobs", json={"topic": f"Topic {index}"})
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 202
+    await blog_app.job_queue.stop()
+    latencies.sort()
+    print(
+        f"submit latency  p50={statistics.median(latencies):.2f}ms  "
+        f"p99={latencies[int(len(latencies) * 0.99) - 1]:.2f}ms  ({count} requests, workers busy)"
+    )
+
+
+async def throughput(count, workers):
+    store = JobStore()
+    queue = JobQueue(store, blog_app.run_job, workers=workers, per_client_limit=0)
+    job_ids = [store.submit("topic", {"topic": f"Topic {index}"}).id for index in range(count)]
+    start = time.perf_counter()
+    await queue.start()
+    await wait_for(store, job_ids)
+    elapsed = time.perf_counter() - start
+    await queue.stop()
+    print(f"workers={workers}  {count} jobs in {elapsed:5.2f}s  {count / elapsed * 60:7.1f} blogs/min")
+
+
+async def fairness(count):
+    store = JobStore()
+    queue = JobQueue(store, blog_app.run_job, workers=4, per_client_limit=2)
+    flood = [store.submit("topic", {"topic": f"Flood {index}"}, client_id="flood").id for index in range(count)]
+    late = store.submit("topic", {"topic": "Late"}, client_id="late").id
+    start = time.perf_counter()
+    await queue.start()
+    await wait_for(store, [late])
+    late_done = time.perf_counter() - start
+    await wait_for(store, flood)
+    print(f"per-client cap  late client done after {late_done:.2f}s, flood of {count} after {time.perf_counter() - start:.2f}s")
+    await queue.stop()
+
+
+async def main(count, latency):
+    blog_app.graph_registry = GraphRegistry(lambda: FakeLLM(latency=latency))
+    blog_app.graph_registry.warmup()
+    await submit_latency(count)
+    for workers in (1, 4, 8):
+        await throughput(count, workers)
+    await fairness(count // 2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+    asyncio.run(main(args.jobs, args.latency))
@@ -0,0 +1,142 @@
+"""
+Sustained-load comparison of per-request fallback vs the shared ModelRouter.
+
+A fake provider enforces per-model request and token quotas (scaled down
+to a 1 second window so the run is short) and answers over-quota calls
+with groq.RateLimitError, like Groq does. Concurrent workers then issue
+LLM calls for a fixed duration through:
+
+  per-request   a fresh ResilientInvoker(primary, [fallback]) per call,
+                which only learns about the limit from its own 429
+  router        RoutedInvoker sharing one ModelRouter configured with
+                the same quotas
+
+and report completed calls/s, the 429 rate and how calls were split.
+
+    python benchmarks/bench_model_router.py [--workers 16] [--duration 5]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-dummy-key")
+
+import groq
+import httpx
+from langchain_core.messages import AIMessage, HumanMessage
+
+from src.llms.retry import ResilientInvoker, RetryPolicy
+from src.llms.router import ModelRoute, ModelRouter, RoutedInvoker, TokenBucket
+from src.transcripts.chunking import estimate_tokens
+
+PERIOD = 1.0
+COMPLETION_TOKENS = 200
+QUOTAS = {
+    "primary": {"priority": 0, "rpm": 8, "tpm": 2400},
+    "fallback": {"priority": 1, "rpm": 6, "tpm": 1800},
+}
+PROMPT = [HumanMessage(content="Write a short paragraph about agentic AI. " * 20)]
+
+
+def rate_limit_error(retry_after):
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": f"{retry_after:.3f}"}, request=request)
+    return groq.RateLimitError("Error code: 429 - Rate limit reached", response=response, body=None)
+
+
+class QuotaModel:
+    """
+    Fake chat model behind a provider-side request/token quota
+    """
+
+    def __init__(self, name, rpm, tpm, stats, latency=0.05):
+        self.model_name = name
+        self.requests = TokenBucket(rpm, PERIOD)
+        self.tokens = TokenBucket(tpm, PERIOD)
+        self.stats = stats
+        self.latency = latency
+
+    async def ainvoke(self, messages, **kwargs):
+        await asyncio.sleep(self.latency)
+        used = estimate_tokens(str(messages)) + COMPLETION_TOKENS
+        now = time.monotonic()
+        wait = max(self.requests.wait_time(1, now), self.tokens.wait_time(used, now))
+        if wait > 0:
+            self.stats["429"] += 1
+            raise rate_limit_error(wait)
+        self.requests.consume(1)
+        self.tokens.consume(used)
+        self.stats[self.model_name] += 1
+        return AIMessage(content="ok", usage_metadata={
+            "input_tokens": used - COMPLETION_TOKENS,
+            "output_tokens": COMPLETION_TOKENS,
+            "total_tokens": used,
+        })
+
+
+def make_models(stats):
+    return {name: QuotaModel(name, quota["rpm"], quota["tpm"], stats) for name, quota in QUOTAS.items()}
+
+
+async def drive(make_invoker, workers, duration, stats):
+    deadline = time.monotonic() + duration
+
+    async def worker():
+        while time.monotonic() < deadline:
+            try:
+                await make_invoker().ainvoke(PROMPT)
+            except Exception:
+                stats["failed"] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return time.perf_counter() - start
+
+
+def report(label, stats, elapsed):
+    done = stats["primary"] + stats["fallback"]
+    attempts = done + stats["429"]
+    print(
+        f"{label:<12} ok/s={done / elapsed:6.2f}  429 rate={stats['429'] / max(attempts, 1):6.1%}  "
+        f"primary={stats['primary']:4d}  fallback={stats['fallback']:4d}  failed={stats['failed']:3d}"
+    )
+
+
+async def main(workers, duration):
+    policy = RetryPolicy(max_attempts=3, base_delay=0.05, max_delay=2.0)
+    print(f"{workers} workers, {duration:.0f}s, quota window {PERIOD:.0f}s: {QUOTAS}")
+
+    stats = Counter()
+    models = make_models(stats)
+    with contextlib.redirect_stdout(io.StringIO()):
+        elapsed = await drive(
+            lambda: ResilientInvoker(models["primary"], [models["fallback"]], policy=policy),
+            workers, duration, stats,
+        )
+    report("per-request", stats, elapsed)
+
+    stats = Counter()
+    models = make_models(stats)
+    router = ModelRouter(
+        [ModelRoute(name, period=PERIOD, **quota) for name, quota in QUOTAS.items()],
+        cooldown=PERIOD,
+        expected_completion_tokens=COMPLETION_TOKENS,
+        max_wait=duration,
+    )
+    invoker = RoutedInvoker(router, models.__getitem__, policy=policy)
+    elapsed = await drive(lambda: invoker, workers, duration, stats)
+    report("router", stats, elapsed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.workers, args.duration))
@@ -0,0 +1,89 @@
+"""
+End-to-end latency of a non-English topic blog, with and without pipelined translation.
+
+The fake model streams the generated blog at a fixed token rate and
+"translates" by echoing each section back, so a translation call takes
+time in proportion to its section. The topic graph runs with
+TRANSLATION_PIPELINE off (translate after generation) and on (translate
+each section as soon as it is complete). The target is generation time
+plus about one section's translation time.
+
+    python benchmarks/bench_pipelined_translation.py --sections 4 8 16
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["TRANSCRIPT_CACHE_DIR"] = ""
+
+from src.graphs.graph_builder import GraphBuilder
+from src.llms.fakellm import FakeChatModel
+from src.nodes.blog_node import GenerationConfig
+
+
+def make_blog(sections, words_per_section=120):
+    parts = ["# Benchmark Blog\n\n"]
+    for i in range(sections):
+        body = " ".join(f"word{i}_{w}" for w in range(words_per_section))
+        parts.append(f"## Section {i}\n\n{body}\n\n")
+    return "".join(parts)
+
+
+def build_graph(llm, pipeline):
+    os.environ["TRANSLATION_PIPELINE"] = "true" if pipeline else "false"
+    return GraphBuilder(llm, generation_config=GenerationConfig(single_call=True)).setup_graph("topic")
+
+
+async def timed(graph, inputs):
+    start = time.perf_counter()
+    state = await graph.ainvoke(inputs)
+    return time.perf_counter() - start, state
+
+
+async def first_section(graph, inputs):
+    """
+    Seconds until the first translated section event reaches a streaming client
+    """
+    start = time.perf_counter()
+    first = None
+    async for mode, chunk in graph.astream(inputs, stream_mode=["custom", "values"]):
+        if mode == "custom" and first is None:
+            first = time.perf_counter() - start
+    return first
+
+
+async def run(section_counts, latency, tokens_per_second, concurrency):
+    os.environ["TRANSLATION_CONCURRENCY"] = str(concurrency)
+    print(f"latency={latency}s tokens/s={tokens_per_second} translation concurrency={concurrency}")
+    print(f"{'sections':>8} {'generate':>9} {'+1 section':>10} {'sequential':>10} {'pipelined':>9} {'first section':>13}")
+    for count in section_counts:
+        llm = FakeChatModel(latency=latency, tokens_per_second=tokens_per_second, content=make_blog(count))
+        english, _ = await timed(build_graph(llm, False), {"topic": "Agentic AI", "current_language": "english"})
+        section = latency + 120 / tokens_per_second
+        french = {"topic": "Agentic AI", "current_language": "french"}
+        sequential, expected = await timed(build_graph(llm, False), french)
+        pipelined_graph = build_graph(llm, True)
+        pipelined, state = await timed(pipelined_graph, french)
+        assert state["blog"] == expected["blog"], "pipelined translation differs from the sequential one"
+        first = await first_section(pipelined_graph, french)
+        print(
+            f"{count:>8} {english:>8.2f}s {english + section:>9.2f}s {sequential:>9.2f}s "
+            f"{pipelined:>8.2f}s {first:>12.2f}s"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--tokens-per-second", type=float, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(run(args.sections, args.latency, args.tokens_per_second, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark the response cache in front of the topic graph.
+
+Replays a repetitive workload (a few topics, several languages, some
+concurrent duplicates) against app.py backed by a fake LLM and reports
+LLM calls, cache hit rate and wall time with the cache enabled/disabled.
+
+    python benchmarks/bench_response_cache.py --requests 60
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-dummy-key")
+os.environ.setdefault("LANGCHAIN_API_KEY", "benchmark-dummy-key")
+
+import httpx
+
+import app as blog_app
+from src.llms.fakellm import FakeChatModel, FakeLLM
+from src.cache.coalescer import RequestCoalescer
+from src.cache.response_cache import ResponseCache
+from src.graphs.registry import GraphRegistry
+
+TOPICS = ["Agentic AI", "agentic ai", "Vector databases", "LangGraph basics"]
+LANGUAGES = ["english", "french", "hindi", "japanese"]
+
+
+class CountingFakeChatModel(FakeChatModel):
+    calls: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        CountingFakeChatModel.calls += 1
+        return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+
+class CountingProvider(FakeLLM):
+    def get_llm(self, use_fallback=False, model=None):
+        model = model or self.current_model
+        if model not in self._clients:
+            # named like the real clients, so responses are cached under the model that served them
+            self._clients[model] = CountingFakeChatModel(model_name=model, latency=self.latency)
+        return self._clients[model]
+
+
+async def run_workload(enabled, requests, latency, seed):
+    CountingFakeChatModel.calls = 0
+    blog_app.graph_registry = GraphRegistry(lambda: CountingProvider(latency=latency))
+    blog_app.response_cache = ResponseCache(enabled=enabled, coalescer=RequestCoalescer(enabled=enabled))
+    rng = random.Random(seed)
+    payloads = [
+        {"topic": rng.choice(TOPICS), "language": rng.choice(LANGUAGES)}
+        for _ in range(requests)
+    ]
+    transport = httpx.ASGITransport(app=blog_app.app)
+    start = time.perf_counter()
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        # bursts of 10 concurrent requests exercise single-flight deduplication
+        for i in range(0, len(payloads), 10):
+            burst = payloads[i:i + 10]
+            responses = await asyncio.gather(*(client.post("/blogs/topic", json=p) for p in burst))
+            for response in responses:
+                response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    stats = blog_app.response_cache.stats()
+    label = "cache on " if enabled else "cache off"
+    print(
+        f"{label}  llm_calls={CountingFakeChatModel.calls:4d}  "
+        f"hit_rate={stats['hit_rate']:.2f}  wall={elapsed:.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(run_workload(False, args.requests, args.latency, args.seed))
+    asyncio.run(run_workload(True, args.requests, args.latency, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Bytes on the wire and serialization time for blog responses.
+
+Builds YouTube response states around large transcript fixtures and
+compares the previous body (the whole state with the standard JSON
+encoder, uncompressed) with the shaped one (no transcript unless asked
+for, orjson, gzip/brotli). Then checks the real /blogs/youtube endpoint
+end to end with the fake backend.
+
+    python benchmarks/bench_response_payload.py --transcript-words 5000 50000 200000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["LLM_BACKEND"] = "fake"
+os.environ.setdefault("FAKE_LLM_LATENCY", "0")
+os.environ["TRANSCRIPT_CACHE_DIR"] = ""
+os.environ["JOB_WORKERS_ENABLED"] = "false"
+
+import httpx
+
+import app as blog_app
+from src.api.compression import CompressionMiddleware, brotli
+from src.api.responses import blog_response, dumps
+from src.llms.fakellm import FAKE_CONTENT
+from src.transcripts.store import get_transcript_store
+
+
+def make_transcript(words, seed=7):
+    """
+    Caption-like text: a 3000-word vocabulary drawn with a Zipf-ish skew,
+    so it compresses roughly like real speech instead of a repeated phrase
+    """
+    rng = random.Random(seed)
+    letters = "etaoinshrdlucmfwyp"
+    vocabulary = ["".join(rng.choice(letters) for _ in range(rng.randint(2, 9))) for _ in range(3000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return " ".join(rng.choices(vocabulary, weights=weights, k=words))
+
+
+def make_state(transcript_words, languages):
+    transcript = make_transcript(transcript_words)
+    blog = {"title": "Agentic AI", "content": FAKE_CONTENT + make_transcript(1500, seed=11)}
+    return {
+        "youtube_url": "https://www.youtube.com/watch?v=bench000001",
+        "video_id": "bench000001",
+        "current_language": "english",
+        "languages": languages,
+        "transcript": transcript,
+        "blog": blog,
+        "translations": {language: blog for language in languages},
+    }
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def compare(transcript_words, repeat):
+    state = make_state(transcript_words, ["english", "french", "hindi"])
+    compressor = CompressionMiddleware(None)
+
+    legacy, legacy_ms = timed(lambda: json.dumps({"data": state, "video_id": state["video_id"]}).encode("utf-8"), repeat)
+    shaped, shaped_ms = timed(lambda: dumps(blog_response(state)), repeat)
+    gzipped, gzip_ms = timed(lambda: compressor.compress(shaped, "gzip"), repeat)
+    print(f"transcript={transcript_words:>7} words")
+    print(f"  before   {len(legacy):>10} bytes  {legacy_ms:7.2f}ms serialize")
+    print(f"  shaped   {len(shaped):>10} bytes  {shaped_ms:7.2f}ms serialize  ({len(legacy) / len(shaped):6.1f}x smaller)")
+    print(f"  +gzip    {len(gzipped):>10} bytes  {gzip_ms:7.2f}ms compress   ({len(legacy) / len(gzipped):6.1f}x smaller)")
+    if brotli is not None:
+        compressed, br_ms = timed(lambda: compressor.compress(shaped, "br"), repeat)
+        print(f"  +brotli  {len(compressed):>10} bytes  {br_ms:7.2f}ms compress   ({len(legacy) / len(compressed):6.1f}x smaller)")
+
+
+async def end_to_end(transcript_words):
+    get_transcript_store().put("bench000001", make_state(transcript_words, [])["transcript"])
+    transport = httpx.ASGITransport(app=blog_app.app)
+    payload = {"youtube_url": "https://www.youtube.com/watch?v=bench000001"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, query, encoding in (
+            ("full state, identity", "?fields=youtube_url,video_id,current_language,blog,transcript", "identity"),
+            ("full state, gzip", "?fields=youtube_url,video_id,current_language,blog,transcript", "gzip"),
+            ("default fields, identity", "", "identity"),
+            ("default fields, gzip", "", "gzip"),
+        ):
+            response = await client.post(f"/blogs/youtube{query}", json=payload, headers={"accept-encoding": encoding})
+            response.raise_for_status()
+            wire = int(response.headers["content-length"])
+            print(f"  {label:<26} {wire:>9} bytes on the wire  encoding={response.headers.get('content-encoding', 'none')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transcript-words", type=int, nargs="+", default=[5000, 50000, 200000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    for words in args.transcript_words:
+        compare(words, args.repeat)
+    print(f"/blogs/youtube end to end (transcript={args.transcript_words[-1]} words)")
+    asyncio.run(end_to_end(args.transcript_words[-1]))
+
+
+if __name__ == "__main__":
+    main()
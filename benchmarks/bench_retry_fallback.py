@@ -0,0 +1,93 @@
+"""
+Verify node-level retry/fallback against a fake LLM that injects 429s.
+
+Runs the topic graph (French, so translation runs) with a primary model
+whose translation calls fail with groq.RateLimitError, then reports how
+many LLM calls each model received. The fake blog translates as four
+calls (title + three sections). Only the failed calls should be paid for
+again: title/content are never regenerated.
+
+Scenarios:
+  short-retry-after  primary 429s twice with Retry-After 0.05s, then succeeds
+  long-retry-after   primary always 429s with Retry-After 600s -> fallback
+  old-behaviour      emulates the previous app.py: rerun the whole graph on
+                     the fallback model after the first 429
+
+    python benchmarks/bench_retry_fallback.py
+"""
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-dummy-key")
+
+import groq
+import httpx
+
+from src.llms.fakellm import FakeChatModel
+from src.graphs.graph_builder import GraphBuilder
+from src.llms.retry import RetryPolicy
+
+CALLS = Counter()
+
+
+def rate_limit_error(retry_after):
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": str(retry_after)}, request=request)
+    return groq.RateLimitError("Error code: 429 - Rate limit reached", response=response, body=None)
+
+
+class InjectingFakeChatModel(FakeChatModel):
+    model_name: str = "fake"
+    failures_left: int = 0
+    retry_after: float = 0.05
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        prompt = str(messages[-1].content)
+        CALLS[(self.model_name, "translation" if "Translate" in prompt else "generation")] += 1
+        if "Translate" in prompt and self.failures_left != 0:
+            self.failures_left -= 1
+            raise rate_limit_error(self.retry_after)
+        return super()._generate(messages, stop, run_manager, **kwargs)
+
+
+def run_graph(primary, fallback=None, policy=None):
+    builder = GraphBuilder(primary, fallback_llms=[fallback] if fallback else None)
+    graph = builder.setup_graph("topic")
+    builder.blog_node_obj.invoker.policy = policy or RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=5.0)
+    return graph.invoke({"topic": "Agentic AI", "current_language": "french"})
+
+
+def report(label, elapsed):
+    summary = ", ".join(f"{model}/{kind}={count}" for (model, kind), count in sorted(CALLS.items()))
+    print(f"{label:<18} calls={sum(CALLS.values()):3d}  wall={elapsed:.2f}s  [{summary}]")
+    CALLS.clear()
+
+
+def main():
+    scenarios = {
+        "short-retry-after": dict(failures_left=2, retry_after=0.05),
+        "long-retry-after": dict(failures_left=-1, retry_after=600),
+    }
+    for label, options in scenarios.items():
+        primary = InjectingFakeChatModel(model_name="primary", latency=0.05, **options)
+        fallback = InjectingFakeChatModel(model_name="fallback", latency=0.05)
+        start = time.perf_counter()
+        run_graph(primary, fallback)
+        report(label, time.perf_counter() - start)
+
+    # previous behaviour: any 429 aborts the run and the graph restarts from START
+    no_retry = RetryPolicy(max_attempts=1)
+    primary = InjectingFakeChatModel(model_name="primary", latency=0.05, failures_left=-1, retry_after=600)
+    fallback = InjectingFakeChatModel(model_name="fallback", latency=0.05)
+    start = time.perf_counter()
+    try:
+        run_graph(primary, policy=no_retry)
+    except groq.RateLimitError:
+        run_graph(fallback, policy=no_retry)
+    report("old-behaviour", time.perf_counter() - start)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Round trips and input tokens per blog: single-call vs split generation.
+
+Runs the topic and YouTube graphs with a metered fake model, once with
+title and content generated by separate calls and once with a single
+structured call, and counts LLM calls and prompt tokens per blog. Also
+checks that the repair parser recovers a Blog from malformed responses
+(fenced, truncated or trailing-comma JSON) without another call.
+
+    python benchmarks/bench_single_call.py --blogs 20 --transcript-words 3000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("TRANSCRIPT_CACHE_DIR", "")
+
+from src.graphs.graph_builder import GraphBuilder
+from src.llms.fakellm import FakeChatModel
+from src.nodes.blog_node import GenerationConfig
+from src.transcripts.chunking import estimate_tokens
+from src.transcripts.store import get_transcript_store
+from src.utils.blog_parser import parse_blog
+
+MALFORMED = [
+    '```json\n{"title": "Agentic AI", "content": "## Intro\nAgents plan.",}\n```',
+    '{"title": "Agentic AI", "content": "## Intro\\nAgents plan and act',
+    'Title: **Agentic AI**\n\n## Intro\nAgents plan.',
+]
+
+
+class MeteredFakeChatModel(FakeChatModel):
+    input_tokens: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.input_tokens += sum(estimate_tokens(str(m.content)) for m in messages)
+        return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+
+async def measure(usecase, single_call, blogs, transcript, latency):
+    llm = MeteredFakeChatModel(latency=latency)
+    graph = GraphBuilder(llm, generation_config=GenerationConfig(single_call=single_call)).setup_graph(usecase)
+    store = get_transcript_store()
+    start = time.perf_counter()
+    for index in range(blogs):
+        if usecase == "topic":
+            state = await graph.ainvoke({"topic": f"Agentic AI {index}"})
+        else:
+            video_id = f"single{int(single_call)}x{index}"
+            store.put(video_id, transcript)
+            state = await graph.ainvoke({"youtube_url": f"https://youtu.be/{video_id}"})
+        assert state["blog"]["title"] and state["blog"]["content"]
+    elapsed = time.perf_counter() - start
+    return llm.calls / blogs, llm.input_tokens / blogs, elapsed / blogs
+
+
+async def run(blogs, transcript_words, latency):
+    transcript = " ".join(f"word{i % 50}" for i in range(transcript_words))
+    print(f"{'usecase':<8} {'mode':<7} {'calls/blog':>10} {'input tok/blog':>15} {'s/blog':>7}")
+    for usecase in ("topic", "youtube"):
+        rows = {}
+        for single_call in (False, True):
+            calls, tokens, seconds = await measure(usecase, single_call, blogs, transcript, latency)
+            rows[single_call] = (calls, tokens)
+            mode = "single" if single_call else "split"
+            print(f"{usecase:<8} {mode:<7} {calls:>10.1f} {tokens:>15.0f} {seconds:>7.3f}")
+        print(f"{'':<8} ratio   {rows[True][0] / rows[False][0]:>10.2f} {rows[True][1] / rows[False][1]:>15.2f}")
+
+    repaired = sum(1 for text in MALFORMED if parse_blog(text).title == "Agentic AI")
+    print(f"repair parser: {repaired}/{len(MALFORMED)} malformed responses recovered without a new call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blogs", type=int, default=20)
+    parser.add_argument("--transcript-words", type=int, default=3000)
+    parser.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args()
+    asyncio.run(run(args.blogs, args.transcript_words, args.latency))
+
+
+if __name__ == "__main__":
+    main()
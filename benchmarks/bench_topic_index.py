@@ -0,0 +1,107 @@
+"""
+Near-duplicate topic index: lookup latency at scale and match quality.
+
+Fills a TopicIndex with N synthetic topics (2-4 words drawn with a
+Zipf-like skew from a large vocabulary, so popular words have long
+posting lists), then times lookups for paraphrases of stored topics
+(hits) and for unseen topics (misses). Also prints the similarity and
+decision for a few hand-written paraphrase and different-topic pairs.
+
+    python benchmarks/bench_topic_index.py --entries 100000 --queries 2000
+"""
+import argparse
+import itertools
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cache.topic_index import TopicIndex
+
+PAIRS = [
+    ("Agentic AI", "What is Agentic AI?"),
+    ("Agentic AI", "agentic AI systems"),
+    ("Large language models", "Introduction to large language model"),
+    ("React hooks", "A guide to React hooks"),
+    ("Python for data science", "Python for web development"),
+    ("Kubernetes networking", "Kubernetes storage"),
+    ("Machine learning", "Deep learning"),
+    ("World War 2", "World War 1"),
+    ("How not to bake bread", "How to bake bread"),
+]
+
+
+def vocabulary(rng, size):
+    letters = "etaoinshrdlucmfwypvbgk"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(4, 10))) for _ in range(size)]
+
+
+def make_topic(rng, words, cum_weights):
+    return " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(2, 4)))
+
+
+def paraphrase(rng, topic):
+    prefix = rng.choice(["What is", "Introduction to", "A guide to", "", "Explain"])
+    return f"{prefix} {topic.title()}{rng.choice(['?', '', 's'])}".strip()
+
+
+def timed_lookups(index, queries):
+    latencies = []
+    hits = 0
+    for query in queries:
+        start = time.perf_counter()
+        match = index.lookup(query)
+        latencies.append((time.perf_counter() - start) * 1e6)
+        hits += match is not None
+    latencies.sort()
+    return hits, statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = vocabulary(rng, args.vocabulary)
+    weights = list(itertools.accumulate(1 / (rank + 1) ** 0.8 for rank in range(len(words))))
+    topics = [make_topic(rng, words, weights) for _ in range(args.entries)]
+
+    index = TopicIndex(capacity=args.entries)
+    start = time.perf_counter()
+    for topic in topics:
+        index.add(topic)
+    fill = time.perf_counter() - start
+    print(f"index: {len(index)} topics, filled in {fill:.1f}s ({fill / args.entries * 1e6:.0f}us/add)")
+
+    stored = rng.sample(topics, args.queries)
+    hit_queries = [paraphrase(rng, topic) for topic in stored]
+    miss_queries = [make_topic(rng, words, weights) + " " + rng.choice(words) for _ in range(args.queries)]
+    for label, queries in (("paraphrase", hit_queries), ("unseen", miss_queries)):
+        hits, p50, p99 = timed_lookups(index, queries)
+        print(f"{label:<10} lookups={len(queries)}  matched={hits / len(queries):6.1%}  p50={p50:6.1f}us  p99={p99:6.1f}us")
+
+    bounded = TopicIndex(capacity=1000)
+    for topic in topics[:5000]:
+        bounded.add(topic)
+    kept = sum(bounded.lookup(topic) is not None for topic in topics[4000:5000])
+    print(f"eviction: capacity=1000 after 5000 adds -> {len(bounded)} entries, {kept}/1000 most recent still found")
+
+    small = TopicIndex()
+    for stored_topic, _ in PAIRS:
+        small.add(stored_topic)
+    print(f"\nthreshold={small.threshold}")
+    for stored_topic, query in PAIRS:
+        match = small.lookup(query)
+        decision = f"reuse '{match.subject}' ({match.score:.2f})" if match else "generate"
+        print(f"  {query!r:<42} -> {decision}")
+
+
+if __name__ == "__main__":
+    main()
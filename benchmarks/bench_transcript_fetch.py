@@ -0,0 +1,142 @@
+"""
+Benchmark transcript extraction against a local HTTP stand-in.
+
+A ThreadingHTTPServer serves VTT files for a handful of fake video ids.
+`extract_youtube_transcript` is run repeatedly with Zipf-like popularity,
+once with a fresh (uncached) store per call and once with the shared
+TranscriptStore, reporting upstream fetches, TCP connections opened and
+wall time. A "blocked" video exercises negative caching.
+
+    python benchmarks/bench_transcript_fetch.py --requests 500
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from youtube_transcript_api import RequestBlocked
+
+from src.nodes.blog_node import BlogNode
+from src.transcripts.fetcher import TranscriptFetcher
+from src.transcripts.normalizer import iter_subtitle_lines
+from src.transcripts.store import TranscriptStore
+
+VIDEO_IDS = [f"vid{i:08d}" for i in range(8)] + ["blocked0000"]
+
+
+def make_vtt(video_id, cues=400):
+    lines = ["WEBVTT", "Kind: captions", ""]
+    for i in range(cues):
+        lines.append(f"00:{i // 60:02d}:{i % 60:02d}.000 --> 00:{i // 60:02d}:{i % 60:02d}.900")
+        lines.append(f"<c>{video_id} caption line {i} about agentic systems</c>")
+        lines.append("")
+    return "\n".join(lines)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = 0
+    connections = set()
+
+    def do_GET(self):
+        StandInHandler.hits += 1
+        StandInHandler.connections.add(self.client_address)
+        video_id = self.path.strip("/").split(".")[0]
+        if video_id.startswith("blocked"):
+            body = b"Too Many Requests"
+            self.send_response(429)
+        else:
+            body = make_vtt(video_id).encode("utf-8")
+            self.send_response(200)
+        self.send_header("Content-Type", "text/vtt; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInFetcher(TranscriptFetcher):
+    """
+    Fetcher whose caption source is the local stand-in server
+    """
+
+    def __init__(self, base_url, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url
+
+    def fetch_transcript_lines(self, video_id):
+        try:
+            data = self.fetch_subtitle(f"{self.base_url}/{video_id}.vtt")
+        except Exception:
+            # the real blocked error: yt-dlp is skipped and the failure is cached
+            raise RequestBlocked(video_id)
+        return list(iter_subtitle_lines(data))
+
+
+def workload(requests, seed):
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(VIDEO_IDS))]
+    return rng.choices(VIDEO_IDS, weights=weights, k=requests)
+
+
+def run(label, node_factory, video_ids):
+    StandInHandler.hits = 0
+    StandInHandler.connections = set()
+    failures = 0
+    start = time.perf_counter()
+    # quiet the per-fetch progress prints
+    with contextlib.redirect_stdout(io.StringIO()):
+        for video_id in video_ids:
+            node = node_factory()
+            try:
+                node.extract_youtube_transcript({"youtube_url": f"https://youtu.be/{video_id}"})
+            except ValueError:
+                failures += 1
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<14} upstream_fetches={StandInHandler.hits:5d}  "
+        f"connections={len(StandInHandler.connections):5d}  "
+        f"failures={failures:4d}  wall={elapsed:.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    video_ids = workload(args.requests, args.seed)
+
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            uncached = lambda: BlogNode(
+                None,
+                transcript_store=TranscriptStore(directory=None),
+                transcript_fetcher=StandInFetcher(base_url),
+            )
+            shared_store = TranscriptStore(directory=cache_dir)
+            shared_fetcher = StandInFetcher(base_url)
+            cached = lambda: BlogNode(
+                None, transcript_store=shared_store, transcript_fetcher=shared_fetcher
+            )
+            run("no store/pool", uncached, video_ids)
+            run("shared store", cached, video_ids)
+    finally:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
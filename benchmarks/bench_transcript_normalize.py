@@ -0,0 +1,134 @@
+"""
+Transcript normalizer throughput and size reduction over a VTT/SRT corpus.
+
+Generates YouTube-style fixtures (rolling auto-captions that repeat the
+previous line, [Music] markers, filler words, inline <c> timing tags)
+plus clean SRT files, or reads real ones from --fixtures. Compares the
+previous parser (split the payload into a list, regex every line, join)
+with the streaming normalizer: parse throughput, characters and tokens
+that reach the content prompt.
+
+    python benchmarks/bench_transcript_normalize.py --videos 40 --cues 1500
+    python benchmarks/bench_transcript_normalize.py --fixtures path/to/subtitles
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.transcripts.normalizer import TranscriptNormalizer
+
+WORDS = "agents plan tools memory retrieval graph state model prompt context evaluation latency".split()
+FILLERS = ["um", "uh", "you", "so"]
+
+
+def _timestamp(seconds, srt=False):
+    h, rest = divmod(seconds, 3600)
+    m, s = divmod(rest, 60)
+    return f"{h:02d}:{m:02d}:{s:02d}{',' if srt else '.'}000"
+
+
+def rolling_vtt(rng, cues):
+    """
+    Auto-caption layout: every cue repeats the previous line, then adds one
+    """
+    lines = ["WEBVTT", "Kind: captions", "Language: en", ""]
+    previous = ""
+    for i in range(cues):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(5, 9))]
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(FILLERS[:2]))
+        current = " ".join(f"{word}<00:00:{i % 60:02d}.500><c>" if j == 1 else word for j, word in enumerate(words))
+        if rng.random() < 0.05:
+            current = "[Music]"
+        lines.append(f"{_timestamp(i)} --> {_timestamp(i + 1)} align:start position:0%")
+        lines.extend(line for line in (previous, current) if line)
+        lines.append("")
+        previous = re.sub(r"<[^>]+>", "", current)
+    return "\n".join(lines)
+
+
+def clean_srt(rng, cues):
+    lines = []
+    for i in range(cues):
+        lines.append(str(i + 1))
+        lines.append(f"{_timestamp(i, srt=True)} --> {_timestamp(i + 1, srt=True)}")
+        lines.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 12))) + ".")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def legacy_parse(subtitle_data):
+    """
+    The parser the normalizer replaced (BlogNode._parse_subtitle)
+    """
+    transcript_lines = []
+    for line in subtitle_data.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('WEBVTT') or line.startswith('Kind:') or '-->' in line:
+            continue
+        if line.isdigit():
+            continue
+        line = re.sub(r'<[^>]+>', '', line)
+        if line:
+            transcript_lines.append(line)
+    return " ".join(transcript_lines)
+
+
+def load_corpus(args):
+    if args.fixtures:
+        corpus = []
+        for name in sorted(os.listdir(args.fixtures)):
+            if name.endswith((".vtt", ".srt")):
+                with open(os.path.join(args.fixtures, name), encoding="utf-8") as f:
+                    corpus.append((name, f.read()))
+        return corpus
+    rng = random.Random(args.seed)
+    corpus = [(f"auto{i}.vtt", rolling_vtt(rng, args.cues)) for i in range(args.videos)]
+    corpus += [(f"clean{i}.srt", clean_srt(rng, args.cues)) for i in range(max(1, args.videos // 4))]
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--videos", type=int, default=40)
+    parser.add_argument("--cues", type=int, default=1500)
+    parser.add_argument("--fixtures", help="directory of .vtt/.srt files to use instead of generated ones")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args)
+    total_bytes = sum(len(payload) for _, payload in corpus)
+    # no budget, so every file is compared in full
+    normalizer = TranscriptNormalizer(max_tokens=0)
+
+    start = time.perf_counter()
+    legacy = [legacy_parse(payload) for _, payload in corpus]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    normalized = [normalizer.normalize_subtitle(payload) for _, payload in corpus]
+    normalized_seconds = time.perf_counter() - start
+
+    legacy_chars = sum(len(text) for text in legacy)
+    legacy_tokens = sum(normalizer.count_tokens(text) for text in legacy)
+    new_chars = sum(len(text) for text, _ in normalized)
+    new_tokens = sum(stats["output_tokens"] for _, stats in normalized)
+    mib = total_bytes / 2**20
+
+    print(f"corpus: {len(corpus)} files, {mib:.1f} MiB")
+    print(f"legacy parser  {mib / legacy_seconds:7.1f} MiB/s  chars={legacy_chars:>10}  tokens={legacy_tokens:>9}")
+    print(f"normalizer     {mib / normalized_seconds:7.1f} MiB/s  chars={new_chars:>10}  tokens={new_tokens:>9}")
+    print(f"prompt size vs legacy: chars {new_chars / legacy_chars:.2f}x, tokens {new_tokens / legacy_tokens:.2f}x")
+    for kind in (".vtt", ".srt"):
+        ratios = [stats["compression_ratio"] for (name, _), (_, stats) in zip(corpus, normalized) if name.endswith(kind)]
+        if ratios:
+            print(f"mean compression ratio {kind}: {sum(ratios) / len(ratios):.2f} (output/input caption chars)")
+
+
+if __name__ == "__main__":
+    main()
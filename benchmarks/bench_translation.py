@@ -0,0 +1,85 @@
+"""
+Benchmark whole-document vs section-parallel translation.
+
+An echo fake model "translates" by returning the text it was given, taking a
+fixed latency plus a per-output-token decode time, so translation time
+grows with the amount of text in a call. Blogs of increasing length are
+translated with TRANSLATION_SPLIT_SECTIONS off and on.
+
+    python benchmarks/bench_translation.py --sections 4,12,24
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.llms.fakellm import FakeChatModel
+from src.nodes.blog_node import BlogNode, TranslationConfig
+from src.transcripts.chunking import estimate_tokens
+from src.transcripts.store import TranscriptStore
+
+
+class EchoFakeChatModel(FakeChatModel):
+    decode_seconds_per_token: float = 0.0005
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        prompt = str(messages[-1].content)
+        marker = "SECTION:" if "SECTION:" in prompt else "BLOG TITLE:"
+        text = prompt.split(marker, 1)[1].strip()
+        await asyncio.sleep(self.latency + estimate_tokens(text) * self.decode_seconds_per_token)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+
+
+def make_blog(sections, paragraphs_per_section=4):
+    parts = ["# Benchmark Blog\n\nIntro paragraph about agentic systems.\n"]
+    for i in range(sections):
+        body = "\n\n".join(
+            f"Paragraph {p} of section {i} explains planning, tools and memory in detail. " * 3
+            for p in range(paragraphs_per_section)
+        )
+        parts.append(f"\n## Section {i}\n\n{body}\n")
+    return "".join(parts)
+
+
+async def measure(content, split_sections, concurrency, latency):
+    node = BlogNode(
+        EchoFakeChatModel(latency=latency),
+        transcript_store=TranscriptStore(directory=None),
+        translation_config=TranslationConfig(max_concurrency=concurrency, split_sections=split_sections),
+    )
+    state = {"current_language": "french", "blog": {"title": "Benchmark Blog", "content": content}}
+    start = time.perf_counter()
+    result = await node.atranslation(state)
+    elapsed = time.perf_counter() - start
+    assert result["blog"]["content"] == content, "sections were not reassembled in order"
+    return elapsed
+
+
+async def run(section_counts, concurrency, latency):
+    print(f"concurrency={concurrency} latency={latency}s")
+    print(f"{'sections':>8} {'tokens':>7} {'whole_s':>8} {'sectioned_s':>11}")
+    for count in section_counts:
+        content = make_blog(count)
+        whole = await measure(content, False, concurrency, latency)
+        sectioned = await measure(content, True, concurrency, latency)
+        print(f"{count:>8} {estimate_tokens(content):>7} {whole:>8.2f} {sectioned:>11.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", default="4,12,24")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.1)
+    args = parser.parse_args()
+    counts = [int(count) for count in args.sections.split(",")]
+    asyncio.run(run(counts, args.concurrency, args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Time-to-first-token harness for the streaming endpoints.
+
+Compares the blocking /blogs/topic endpoint (first byte only after the
+whole pipeline, including translation, has finished) with the NDJSON
+body of /blogs/topic/stream, against a fake streaming chat model.
+
+httpx's ASGI transport buffers response bodies, so the streaming side
+consumes `app.stream_graph` (the generator handed to StreamingResponse)
+directly and timestamps each NDJSON line as it is produced.
+
+    python benchmarks/bench_ttft.py --language french --runs 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-dummy-key")
+os.environ.setdefault("LANGCHAIN_API_KEY", "benchmark-dummy-key")
+## every blocking request must run the graph, or the comparison measures a cache hit
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "false")
+os.environ.setdefault("TOPIC_INDEX_ENABLED", "false")
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+import httpx
+
+import app as blog_app
+from src.llms.fakellm import FakeLLM
+from src.graphs.registry import GraphRegistry
+
+
+async def measure_blocking(client, payload):
+    start = time.perf_counter()
+    response = await client.post("/blogs/topic", json=payload)
+    response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed
+
+
+async def measure_stream(payload):
+    start = time.perf_counter()
+    first_token = None
+    nodes = []
+    inputs = {"topic": payload["topic"], "current_language": payload["language"]}
+    async for line in blog_app.stream_graph("topic", inputs, payload["topic"]):
+        event = json.loads(line)
+        if event["event"] == "token" and first_token is None:
+            first_token = time.perf_counter() - start
+        elif event["event"] == "node_start":
+            nodes.append(event["node"])
+        elif event["event"] == "error":
+            raise RuntimeError(event["detail"])
+    return first_token, time.perf_counter() - start, nodes
+
+
+async def run(language, runs, latency, tokens_per_second):
+    blog_app.graph_registry = GraphRegistry(
+        lambda: FakeLLM(latency=latency, tokens_per_second=tokens_per_second)
+    )
+    blog_app.graph_registry.warmup()
+    payload = {"topic": "Agentic AI", "language": language}
+    transport = httpx.ASGITransport(app=blog_app.app)
+    blocking, streaming_ttft, streaming_total = [], [], []
+    nodes = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for _ in range(runs):
+            first_byte, _total = await measure_blocking(client, payload)
+            blocking.append(first_byte)
+            ttft, total, nodes = await measure_stream(payload)
+            streaming_ttft.append(ttft)
+            streaming_total.append(total)
+
+    print(f"language={language} runs={runs} latency={latency}s tokens_per_second={tokens_per_second}")
+    print(f"nodes streamed:            {', '.join(nodes)}")
+    print(f"blocking first byte (p50): {statistics.median(blocking) * 1000:8.1f}ms")
+    print(f"streaming TTFT (p50):      {statistics.median(streaming_ttft) * 1000:8.1f}ms")
+    print(f"streaming total (p50):     {statistics.median(streaming_total) * 1000:8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--language", default="french")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--tokens-per-second", type=float, default=100.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.language, args.runs, args.latency, args.tokens_per_second))
+
+
+if __name__ == "__main__":
+    main()
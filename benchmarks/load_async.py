@@ -0,0 +1,72 @@
+"""
+Load test for the async execution path of app.py.
+
+Fires N concurrent /blogs/topic requests at the ASGI app backed by a fake
+LLM with a fixed latency, and probes /health while they are in flight.
+With non-blocking execution the batch should finish in roughly the time
+of a single request and /health should answer immediately.
+
+    python benchmarks/load_async.py --concurrency 20 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("GROQ_API_KEY", "benchmark-dummy-key")
+os.environ.setdefault("LANGCHAIN_API_KEY", "benchmark-dummy-key")
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+## the numbered topics are near duplicates of each other; measure real generations
+os.environ.setdefault("TOPIC_INDEX_ENABLED", "false")
+
+import httpx
+
+import app as blog_app
+from src.llms.fakellm import FakeLLM
+from src.graphs.registry import GraphRegistry
+
+
+async def timed_post(client, payload):
+    start = time.perf_counter()
+    response = await client.post("/blogs/topic", json=payload)
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def run(concurrency, latency):
+    blog_app.graph_registry = GraphRegistry(lambda: FakeLLM(latency=latency))
+    blog_app.graph_registry.warmup()
+    transport = httpx.ASGITransport(app=blog_app.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        single = await timed_post(client, {"topic": "Agentic AI"})
+
+        start = time.perf_counter()
+        tasks = [
+            asyncio.create_task(timed_post(client, {"topic": f"Agentic AI {i}"}))
+            for i in range(concurrency)
+        ]
+        await asyncio.sleep(latency / 10)
+        health_start = time.perf_counter()
+        await client.get("/health")
+        health = time.perf_counter() - health_start
+        await asyncio.gather(*tasks)
+        total = time.perf_counter() - start
+
+    print(f"fake latency per LLM call: {latency:.3f}s")
+    print(f"single request:            {single:.3f}s")
+    print(f"{concurrency} concurrent requests: {total:.3f}s ({total / single:.2f}x single)")
+    print(f"/health during load:       {health * 1000:.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(run(args.concurrency, args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+End-to-end latency and throughput suite for CI.
+
+Drives /blogs/topic and /blogs/youtube on app.py through the ASGI
+transport with LLM_BACKEND=fake, at several concurrency levels, and
+reports p50/p95/p99 latency and blogs per second for each. Caching,
+coalescing, the job workers and the model router are switched off so
+every request runs the full graph; YouTube transcripts are primed in the
+transcript store so no network is touched.
+
+    python benchmarks/suite.py --concurrency 1 8 32 --requests 64
+    python benchmarks/suite.py --json results.json --max-p95-ms 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["LLM_BACKEND"] = "fake"
+os.environ.setdefault("FAKE_LLM_LATENCY", "0.05")
+os.environ.setdefault("FAKE_LLM_TOKENS_PER_SECOND", "0")
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
+os.environ["REQUEST_COALESCING_ENABLED"] = "false"
+os.environ["JOB_WORKERS_ENABLED"] = "false"
+os.environ["MODEL_ROUTER_ENABLED"] = "false"
+os.environ["TRANSCRIPT_CACHE_DIR"] = ""
+## measure the raw execution path; bench_admission.py covers admission control
+os.environ["ADMISSION_ENABLED"] = "false"
+
+import httpx
+
+import app as blog_app
+from src.transcripts.store import get_transcript_store
+
+TRANSCRIPT = " ".join(f"Sentence {i} of the benchmark transcript about agentic AI." for i in range(200))
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def payloads(usecase, count, run):
+    if usecase == "topic":
+        return [{"topic": f"Agentic AI {run}-{i}"} for i in range(count)]
+    store = get_transcript_store()
+    items = []
+    for i in range(count):
+        video_id = f"bench{run}x{i}"
+        store.put(video_id, TRANSCRIPT)
+        items.append({"youtube_url": f"https://www.youtube.com/watch?v={video_id}"})
+    return items
+
+
+async def measure(client, usecase, concurrency, count, run):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def one(payload):
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(f"/blogs/{usecase}", json=payload)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(payload) for payload in payloads(usecase, count, run)))
+    elapsed = time.perf_counter() - start
+    return {
+        "usecase": usecase,
+        "concurrency": concurrency,
+        "requests": count,
+        "errors": errors,
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "throughput_rps": round(count / elapsed, 2),
+    }
+
+
+async def run(levels, count, usecases):
+    blog_app.graph_registry.warmup()
+    transport = httpx.ASGITransport(app=blog_app.app)
+    results = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for usecase in usecases:
+            for run_index, concurrency in enumerate(levels):
+                results.append(await measure(client, usecase, concurrency, max(count, concurrency), run_index))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=64, help="requests per concurrency level")
+    parser.add_argument("--usecase", choices=["topic", "youtube"], nargs="+", default=["topic", "youtube"])
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--max-p95-ms", type=float, help="exit 1 if any level's p95 exceeds this budget")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.concurrency, args.requests, args.usecase))
+
+    print(f"fake LLM latency {os.environ['FAKE_LLM_LATENCY']}s, "
+          f"{os.environ['FAKE_LLM_TOKENS_PER_SECOND']} tokens/s (0 = instant)")
+    print(f"{'usecase':<8} {'conc':>5} {'reqs':>5} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}")
+    for r in results:
+        print(f"{r['usecase']:<8} {r['concurrency']:>5} {r['requests']:>5} {r['errors']:>4} "
+              f"{r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['throughput_rps']:>8.2f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"results": results}, f, indent=2)
+
+    failed = [r for r in results if r["errors"]]
+    over_budget = [r for r in results if args.max_p95_ms is not None and r["p95_ms"] > args.max_p95_ms]
+    for r in over_budget:
+        print(f"FAIL: {r['usecase']} at concurrency {r['concurrency']} p95 {r['p95_ms']}ms > {args.max_p95_ms}ms")
+    if failed:
+        print(f"FAIL: {sum(r['errors'] for r in failed)} requests returned an error")
+    raise SystemExit(1 if failed or over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,60 @@
+import argparse
+import asyncio
+import os
+from dotenv import load_dotenv
+
+
+def build_registry():
+    from src.checkpoints.sqlite_saver import SQLiteCheckpointSaver, checkpoints_enabled
+    from src.graphs.registry import GraphRegistry
+    from src.llms.backends import get_llm_provider_class
+    from src.llms.router import get_model_router, router_enabled
+
+    backend = os.getenv("LLM_BACKEND", "groq").lower()
+    ## with checkpoints, a job that failed mid-graph resumes from its last node on the next run
+    checkpointer = SQLiteCheckpointSaver.from_env() if checkpoints_enabled() else None
+    return GraphRegistry(
+        get_llm_provider_class(backend),
+        router_factory=get_model_router if router_enabled(backend) else None,
+        checkpointer=checkpointer,
+    )
+
+
+async def run_batch(args):
+    from src.batch.runner import BatchRunner, read_jobs
+
+    with open(args.jobs, encoding="utf-8") as f:
+        jobs = read_jobs(f)
+    runner = BatchRunner(build_registry(), max_concurrency=args.concurrency)
+    stats = await runner.run_to_file(jobs, args.output, resume=not args.no_resume)
+
+    summary = stats.summary()
+    print(
+        f"Batch finished: {summary['succeeded']} ok, {summary['failed']} failed, "
+        f"{summary['skipped']} skipped in {summary['elapsed_seconds']}s "
+        f"({summary['blogs_per_minute']} blogs/min at concurrency {summary['concurrency']})"
+    )
+    return 1 if summary["failed"] else 0
+
+
 def main():
-    print("Hello from blogagentic!")
+    try:
+        load_dotenv()
+    except Exception:
+        pass
+
+    parser = argparse.ArgumentParser(description="Blog Generator Agent")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="Generate blogs for every job in a JSONL file")
+    batch.add_argument("jobs", help='JSONL file of {"topic"|"youtube_url", "language"?, "languages"?, "id"?} jobs')
+    batch.add_argument("-o", "--output", default="batch_results.jsonl", help="JSONL file results are appended to")
+    batch.add_argument("-c", "--concurrency", type=int, default=int(os.getenv("BATCH_CONCURRENCY", "4")))
+    batch.add_argument("--no-resume", action="store_true", help="Overwrite the output instead of skipping finished jobs")
+
+    args = parser.parse_args()
+    if args.command == "batch":
+        raise SystemExit(asyncio.run(run_batch(args)))
 
 
 if __name__ == "__main__":
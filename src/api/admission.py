@@ -0,0 +1,251 @@
+import asyncio
+import heapq
+import itertools
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from src.observability.metrics import ADMISSION_DECISIONS, ADMISSION_WAIT
+
+
+class AdmissionRejected(Exception):
+    """
+    A request turned away before it started: 429 when its client already
+    has too many requests queued, 503 when the server is overloaded.
+    `retry_after` is the suggested wait in whole seconds.
+    """
+
+    def __init__(self, status_code, detail, retry_after):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class AdmissionTicket:
+    def __init__(self, usecase, queued_for=0.0):
+        self.usecase = usecase
+        self.queued_for = queued_for
+        self.started = time.monotonic()
+        self.released = False
+
+
+class _Pool:
+    """
+    Concurrency slots of one usecase and the requests waiting for them.
+
+    Waiting requests are ordered by priority, then by a per-client virtual
+    start tag (start-time fair queueing): each new request of a client is
+    tagged one past that client's previous tag, but never before the tag
+    currently being served. A client with a burst of requests therefore
+    takes turns with the others instead of going first with all of them.
+    """
+
+    def __init__(self, limit, service_time):
+        self.limit = limit
+        self.active = 0
+        self.service_time = service_time
+        self.waiting = 0
+        self.waiting_by_client = {}
+        self._heap = []
+        self._tags = {}
+        self._virtual = 0
+        self._seq = itertools.count()
+
+    def key(self, client_id, priority):
+        tag = max(self._virtual, self._tags.get(client_id, 0)) + 1
+        return (-priority, tag, next(self._seq))
+
+    def estimated_wait(self, key=None):
+        """
+        Seconds until a request with `key` (or one joining at the back)
+        gets a slot, assuming slots free up every service_time / limit
+        """
+        ahead = sum(1 for entry in self._heap if not entry[-1].done() and (key is None or entry[0] < key))
+        departures = max(0, ahead + 1 - (self.limit - self.active))
+        return departures * self.service_time / self.limit
+
+    def push(self, key, client_id):
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._heap, (key, client_id, future))
+        self._tags[client_id] = key[1]
+        self.waiting += 1
+        self.waiting_by_client[client_id] = self.waiting_by_client.get(client_id, 0) + 1
+        return future
+
+    def left_queue(self, client_id):
+        self.waiting -= 1
+        remaining = self.waiting_by_client.get(client_id, 1) - 1
+        if remaining:
+            self.waiting_by_client[client_id] = remaining
+        else:
+            self.waiting_by_client.pop(client_id, None)
+            # a client with nothing queued starts from the current tag next time
+            if self._tags.get(client_id, 0) <= self._virtual:
+                self._tags.pop(client_id, None)
+
+    def dispatch(self):
+        while self.active < self.limit and self._heap:
+            key, _, future = heapq.heappop(self._heap)
+            if future.done():
+                # gave up waiting (timeout or client went away)
+                continue
+            self.active += 1
+            self._virtual = max(self._virtual, key[1])
+            future.set_result(None)
+
+    def release(self, elapsed=None):
+        self.active -= 1
+        if elapsed is not None:
+            # moving average, so the wait estimate follows the current mix of requests
+            self.service_time = 0.8 * self.service_time + 0.2 * elapsed
+        self.dispatch()
+
+
+class AdmissionController:
+    """
+    Admission control in front of the graph endpoints.
+
+    Each usecase gets a bounded pool of concurrent executions, so a burst
+    queues here instead of starting every LLM call at once and running
+    into the provider's rate limits together. Waiting requests are served
+    by priority and fairly across clients (API keys). A request is rejected
+    straight away, with a Retry-After, when its client already has
+    `max_client_queue` requests waiting (429) or when the estimated wait
+    is longer than `max_wait` seconds or the queue is full (503). A request
+    still queued after `max_wait` gets a 503 as well. Only the API keys in
+    `priority_keys` may ask for a priority; everyone else queues at 0.
+    """
+
+    def __init__(self, limits=None, max_queue=64, max_client_queue=8, max_wait=30.0, service_time=10.0, enabled=True,
+                 priority_keys=()):
+        self.limits = limits or {"topic": 8, "youtube": 4}
+        self.priority_keys = frozenset(priority_keys)
+        self.max_queue = max_queue
+        self.max_client_queue = max_client_queue
+        self.max_wait = max_wait
+        self.enabled = enabled
+        self._pools = {usecase: _Pool(limit, service_time) for usecase, limit in self.limits.items()}
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            limits={
+                "topic": int(os.getenv("ADMISSION_TOPIC_CONCURRENCY", "8")),
+                "youtube": int(os.getenv("ADMISSION_YOUTUBE_CONCURRENCY", "4")),
+            },
+            max_queue=int(os.getenv("ADMISSION_MAX_QUEUE", "64")),
+            max_client_queue=int(os.getenv("ADMISSION_MAX_CLIENT_QUEUE", "8")),
+            max_wait=float(os.getenv("ADMISSION_MAX_WAIT", "30")),
+            service_time=float(os.getenv("ADMISSION_SERVICE_TIME", "10")),
+            enabled=os.getenv("ADMISSION_ENABLED", "true").lower() not in ("0", "false", "no"),
+            priority_keys=[key.strip() for key in os.getenv("ADMISSION_PRIORITY_KEYS", "").split(",") if key.strip()],
+        )
+
+    def priority_for(self, api_key, requested):
+        """
+        The queue priority for a request: `requested` (e.g. an X-Priority
+        header) when `api_key` is one of `priority_keys`, else 0
+        """
+        if not api_key or api_key not in self.priority_keys:
+            return 0
+        try:
+            return int(requested or 0)
+        except ValueError:
+            return 0
+
+    def _reject(self, usecase, status_code, detail, retry_after, result):
+        ADMISSION_DECISIONS.inc(usecase=usecase, result=result)
+        raise AdmissionRejected(status_code, detail, max(1, math.ceil(retry_after)))
+
+    async def acquire(self, usecase, client_id="anonymous", priority=0):
+        """
+        Wait for a slot in the usecase's pool and return a ticket for
+        `release`. Raises AdmissionRejected instead of waiting too long.
+        """
+        if not self.enabled:
+            return AdmissionTicket(usecase)
+        pool = self._pools[usecase]
+        if pool.active < pool.limit and not pool.waiting:
+            pool.active += 1
+            ADMISSION_DECISIONS.inc(usecase=usecase, result="admitted")
+            return AdmissionTicket(usecase)
+
+        if pool.waiting_by_client.get(client_id, 0) >= self.max_client_queue:
+            self._reject(
+                usecase, 429, f"Too many queued requests for this client (limit {self.max_client_queue})",
+                pool.service_time, "rejected_client",
+            )
+        key = pool.key(client_id, priority)
+        wait = pool.estimated_wait(key)
+        if pool.waiting >= self.max_queue or wait > self.max_wait:
+            self._reject(
+                usecase, 503, f"Server is busy, estimated wait {wait:.1f}s",
+                max(wait - self.max_wait, pool.service_time / pool.limit), "rejected_overload",
+            )
+
+        future = pool.push(key, client_id)
+        pool.dispatch()
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(future, timeout=self.max_wait)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # the slot was granted just as the wait timed out
+                pool.release()
+            self._reject(usecase, 503, "Server is busy, request timed out in the queue", pool.estimated_wait(), "timeout")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # the slot was granted just as the client went away
+                pool.release()
+            raise
+        finally:
+            pool.left_queue(client_id)
+        queued_for = time.monotonic() - start
+        ADMISSION_WAIT.observe(queued_for, usecase=usecase)
+        ADMISSION_DECISIONS.inc(usecase=usecase, result="queued")
+        return AdmissionTicket(usecase, queued_for)
+
+    def release(self, ticket):
+        """
+        Give the ticket's slot back; releasing twice is a no-op
+        """
+        if self.enabled and not ticket.released:
+            ticket.released = True
+            self._pools[ticket.usecase].release(time.monotonic() - ticket.started)
+
+    @asynccontextmanager
+    async def slot(self, usecase, client_id="anonymous", priority=0):
+        ticket = await self.acquire(usecase, client_id, priority)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    async def guard_stream(self, ticket, stream):
+        """
+        Pass a streamed response through, keeping its slot until it ends.
+        A generator that never starts does not run `finally`, so also
+        release the ticket in a background task of the response.
+        """
+        try:
+            async for chunk in stream:
+                yield chunk
+        finally:
+            self.release(ticket)
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "max_wait": self.max_wait,
+            "pools": {
+                usecase: {
+                    "limit": pool.limit,
+                    "active": pool.active,
+                    "waiting": pool.waiting,
+                    "service_time": round(pool.service_time, 3),
+                    "estimated_wait": round(pool.estimated_wait(), 3),
+                }
+                for usecase, pool in self._pools.items()
+            },
+        }
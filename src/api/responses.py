@@ -0,0 +1,101 @@
+import json
+from typing import Dict, List, Optional
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from src.states.blogstate import Blog
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+## every field a blog response can carry; `transcript` is only sent when asked for
+RESPONSE_FIELDS = ("topic", "youtube_url", "video_id", "current_language", "languages", "blog", "translations", "transcript")
+DEFAULT_FIELDS = frozenset(RESPONSE_FIELDS) - {"transcript"}
+
+
+class BlogData(BaseModel):
+    topic: Optional[str] = None
+    youtube_url: Optional[str] = None
+    video_id: Optional[str] = None
+    current_language: Optional[str] = None
+    languages: Optional[List[str]] = None
+    blog: Optional[Blog] = None
+    translations: Optional[Dict[str, Blog]] = None
+    transcript: Optional[str] = None
+
+
+class BlogResponse(BaseModel):
+    data: BlogData
+    video_id: Optional[str] = None
+    thread_id: Optional[str] = None
+    blog_id: Optional[str] = None
+    translation_ids: Optional[Dict[str, str]] = None
+
+
+def parse_fields(fields: Optional[str]):
+    """
+    Turn a `fields=blog,transcript` query value into the set of fields to
+    return; None or empty means the defaults. Raises ValueError for unknown
+    names.
+    """
+    if not fields:
+        return DEFAULT_FIELDS
+    selected = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = selected - set(RESPONSE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}. Choose from: {', '.join(RESPONSE_FIELDS)}")
+    return frozenset(selected)
+
+
+def shape_state(state: dict, fields=DEFAULT_FIELDS):
+    """
+    The selected fields of a graph state, leaving out the ones it does not
+    have (or has empty, like `translations` on a single-language run).
+    `translations` is only part of a multi-language (`languages`) result;
+    a single-language run may carry it from pipelined translation.
+    """
+    return {
+        field: state[field]
+        for field in RESPONSE_FIELDS
+        if field in fields
+        and state.get(field) not in (None, "", [], {})
+        and (field != "translations" or state.get("languages"))
+    }
+
+
+def blog_response(state: dict, fields=DEFAULT_FIELDS, thread_id=None):
+    """
+    Build the body for a generated blog: `{"data": ..., "video_id"?,
+    "thread_id"?, "blog_id"?, "translation_ids"?}`. The ids are the blog
+    store's (GET /blogs/{id}).
+    """
+    result = {"data": shape_state(state, fields)}
+    if state.get("video_id"):
+        result["video_id"] = state["video_id"]
+    if state.get("blog_id") and "blog" in result["data"]:
+        result["blog_id"] = state["blog_id"]
+    if state.get("translation_ids") and "translations" in result["data"]:
+        result["translation_ids"] = state["translation_ids"]
+    if thread_id:
+        result["thread_id"] = thread_id
+    return result
+
+
+def dumps(content) -> bytes:
+    """
+    Serialize to compact JSON bytes, with orjson when it is installed
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=str)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered by `dumps`: orjson when available, compact
+    separators otherwise
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import time
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel
+from src.checkpoints.threads import ainvoke_in_thread, thread_config
+from src.observability.callbacks import MetricsCallbackHandler
+
+
+class BatchJob:
+    """
+    One line of a batch file: {"topic": ...} or {"youtube_url": ...},
+    with optional "id", "language" and "languages"
+    """
+
+    def __init__(self, usecase, inputs, job_id):
+        self.usecase = usecase
+        self.inputs = inputs
+        self.id = job_id
+
+    @classmethod
+    def from_dict(cls, data):
+        if not isinstance(data, dict):
+            raise ValueError(f"Batch job must be a JSON object, not {type(data).__name__}")
+        language, languages = data.get("language"), data.get("languages")
+        if language is not None and not isinstance(language, str):
+            raise ValueError("'language' must be a string")
+        if languages is not None and not (
+            isinstance(languages, list) and all(isinstance(item, str) for item in languages)
+        ):
+            raise ValueError("'languages' must be a list of strings")
+        if data.get("topic"):
+            usecase, inputs = "topic", {"topic": data["topic"]}
+        elif data.get("youtube_url"):
+            usecase, inputs = "youtube", {"youtube_url": data["youtube_url"]}
+        else:
+            raise ValueError("Batch job needs a 'topic' or 'youtube_url'")
+
+        inputs["current_language"] = (language or "english").lower()
+        if languages:
+            inputs["languages"] = [item.lower() for item in languages]
+
+        job_id = data.get("id")
+        if not job_id:
+            ## stable id so a resumed run recognises jobs it already finished
+            payload = json.dumps([usecase, inputs], sort_keys=True)
+            job_id = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+        return cls(usecase, inputs, str(job_id))
+
+
+def read_jobs(lines):
+    """
+    Parse JSONL job lines, skipping blanks. Raises ValueError with the
+    line number on malformed input.
+    """
+    jobs = []
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            jobs.append(BatchJob.from_dict(json.loads(line)))
+        except (json.JSONDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid batch job on line {number}: {e}")
+    return jobs
+
+
+def completed_job_ids(path):
+    """
+    Ids of jobs that already succeeded in an existing output file
+    """
+    done = set()
+    if not path or not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # a line cut short by an interrupted run
+                continue
+            if record.get("status") == "ok":
+                done.add(record.get("id"))
+    return done
+
+
+def _jsonable(value):
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    return str(value)
+
+
+def to_jsonl(record):
+    return json.dumps(record, default=_jsonable, ensure_ascii=False) + "\n"
+
+
+class BatchStats:
+    def __init__(self, concurrency, skipped=0):
+        self.concurrency = concurrency
+        self.skipped = skipped
+        self.succeeded = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def record(self, ok):
+        if ok:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+        self.elapsed = time.perf_counter() - self.started
+
+    @property
+    def blogs_per_minute(self):
+        return self.succeeded / self.elapsed * 60 if self.elapsed else 0.0
+
+    def summary(self):
+        return {
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "concurrency": self.concurrency,
+            "elapsed_seconds": round(self.elapsed, 2),
+            "blogs_per_minute": round(self.blogs_per_minute, 2),
+        }
+
+
+class BatchRunner:
+    """
+    Run many blog jobs through the compiled graphs with LangGraph's
+    `abatch_as_completed`, so at most `max_concurrency` graphs run at once
+    and each result is available as soon as its own job finishes. With an
+    AdmissionController each async job also takes one of its slots, and a
+    rejected job is reported as an error record.
+
+    With checkpoints, job `id` runs in thread `{thread_prefix}-{id}`. The
+    CLI keeps the default prefix, so rerunning a batch file with
+    CHECKPOINTS_ENABLED resumes a job that failed mid-graph; concurrent
+    API batches each pass a unique one.
+    """
+
+    def __init__(self, graph_registry, max_concurrency=4, admission=None, client_id="anonymous", thread_prefix="batch"):
+        self.graph_registry = graph_registry
+        self.max_concurrency = max_concurrency
+        self.admission = admission
+        self.client_id = client_id
+        self.thread_prefix = thread_prefix
+        self._dispatch = RunnableLambda(self._run_job, afunc=self._arun_job, name="batch_job")
+
+    def _thread_id(self, job: BatchJob):
+        return f"{self.thread_prefix}-{job.id}"
+
+    def _run_job(self, job: BatchJob, config):
+        graph = self.graph_registry.get(job.usecase)
+        if graph.checkpointer is not None:
+            config = thread_config(config, self._thread_id(job), job.usecase)
+        return graph.invoke(job.inputs, config)
+
+    async def _arun_job(self, job: BatchJob, config):
+        if self.admission is None:
+            return await self._arun_graph(job, config)
+        async with self.admission.slot(job.usecase, self.client_id):
+            return await self._arun_graph(job, config)
+
+    async def _arun_graph(self, job: BatchJob, config):
+        graph = self.graph_registry.get(job.usecase)
+        if graph.checkpointer is None:
+            return await graph.ainvoke(job.inputs, config)
+        # one thread per job, so rerunning a batch resumes a job that failed mid-graph
+        thread_id = self._thread_id(job)
+        state = await ainvoke_in_thread(graph, job.inputs, config, thread_id, job.usecase, resume=True)
+        await graph.checkpointer.adelete_thread(thread_id)
+        return state
+
+    def _record(self, job, output):
+        if isinstance(output, Exception):
+            return {"id": job.id, "usecase": job.usecase, "status": "error", "error": str(output)}
+        return {"id": job.id, "usecase": job.usecase, "status": "ok", "data": output}
+
+    async def run(self, jobs, stats=None):
+        """
+        Yield one result record per job, in completion order
+        """
+        stats = stats or BatchStats(self.max_concurrency)
+        if not jobs:
+            return
+        config = {"max_concurrency": self.max_concurrency, "callbacks": [MetricsCallbackHandler()]}
+        async for index, output in self._dispatch.abatch_as_completed(
+            jobs, config, return_exceptions=True
+        ):
+            job = jobs[index]
+            record = self._record(job, output)
+            stats.record(record["status"] == "ok")
+            if record["status"] == "error":
+                print(f"Batch job {job.id} failed: {record['error']}")
+            yield record
+
+    async def run_to_file(self, jobs, output_path, resume=True):
+        """
+        Append results to `output_path` as JSONL while jobs finish. With
+        `resume`, jobs already recorded as ok in the file are skipped.
+        """
+        done = completed_job_ids(output_path) if resume else set()
+        pending = [job for job in jobs if job.id not in done]
+        stats = BatchStats(self.max_concurrency, skipped=len(jobs) - len(pending))
+        with open(output_path, "a" if resume else "w", encoding="utf-8") as f:
+            async for record in self.run(pending, stats):
+                f.write(to_jsonl(record))
+                f.flush()
+        return stats
@@ -0,0 +1,210 @@
+import gzip
+import hashlib
+import html
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pydantic import BaseModel
+from src.utils.paths import data_path
+
+try:
+    import markdown
+except ImportError:
+    markdown = None
+
+JSON = "json"
+HTML = "html"
+FORMATS = (JSON, HTML)
+
+
+def _as_dict(blog):
+    return blog.model_dump() if isinstance(blog, BaseModel) else dict(blog)
+
+
+def make_blog_id(blog) -> str:
+    """
+    Stable id of a blog: a hash of its title and content, so saving the
+    same blog again (a cache hit, another client) returns the same id
+    """
+    blog = _as_dict(blog)
+    payload = json.dumps([blog["title"], blog["content"]], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def make_etag(blog_id, format=JSON):
+    # the id hashes the content, so the body behind it never changes; weak
+    # because the gzip and identity responses share it
+    return f'W/"{blog_id}"' if format == JSON else f'W/"{blog_id}.{format}"'
+
+
+def render_html(blog):
+    """
+    Standalone HTML page for a blog, or None without the optional
+    `markdown` package
+    """
+    if markdown is None:
+        return None
+    blog = _as_dict(blog)
+    body = markdown.markdown(blog["content"], extensions=["fenced_code", "tables"])
+    return (
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{html.escape(blog['title'])}</title>\n</head>\n<body>\n<article>\n{body}\n</article>\n</body>\n</html>\n"
+    )
+
+
+def _compress(text: str) -> bytes:
+    return gzip.compress(text.encode("utf-8"), compresslevel=6, mtime=0)
+
+
+class StoredBlog:
+    """
+    One stored representation of a blog. `body` is the gzip-compressed
+    document, served as-is to clients that accept gzip.
+    """
+
+    def __init__(self, id, format, body, size):
+        self.id = id
+        self.format = format
+        self.body = body
+        self.size = size
+
+    @property
+    def etag(self):
+        return make_etag(self.id, self.format)
+
+    @property
+    def media_type(self):
+        return "application/json" if self.format == JSON else "text/html; charset=utf-8"
+
+    def iter_decompressed(self, chunk_size=64 * 1024):
+        """
+        Yield the uncompressed body in chunks of at most `chunk_size` bytes
+        """
+        decompressor = zlib.decompressobj(wbits=31)
+        data = memoryview(self.body)
+        for start in range(0, len(data), chunk_size):
+            chunk = decompressor.decompress(data[start:start + chunk_size], chunk_size)
+            while chunk:
+                yield chunk
+                chunk = decompressor.decompress(decompressor.unconsumed_tail, chunk_size)
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+
+
+class BlogStore:
+    """
+    SQLite table of generated blogs, keyed by a content hash (make_blog_id).
+
+    Each blog is stored once as its gzip-compressed JSON document (the blog
+    plus usecase, subject, language, model and node timings of the run that
+    produced it) and, with the `markdown` package installed, as a
+    pre-rendered HTML page. Rows are immutable: saving a blog that already
+    exists keeps the original metadata.
+    """
+
+    def __init__(self, path=":memory:", store_html=True):
+        self.path = path
+        self.store_html = store_html
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blogs ("
+            "id TEXT PRIMARY KEY, usecase TEXT, subject TEXT, language TEXT, model TEXT, "
+            "timings TEXT, created_at REAL NOT NULL, json_gz BLOB NOT NULL, json_size INTEGER NOT NULL, "
+            "html_gz BLOB, html_size INTEGER)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls):
+        """
+        BLOG_STORE_SQLITE_PATH selects the database (":memory:" for no
+        persistence); BLOG_STORE_HTML=false skips the HTML rendering
+        """
+        return cls(
+            os.getenv("BLOG_STORE_SQLITE_PATH", data_path("blogs.sqlite3")),
+            store_html=os.getenv("BLOG_STORE_HTML", "true").lower() not in ("0", "false", "no"),
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def exists(self, blog_id):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM blogs WHERE id = ?", (blog_id,)).fetchone() is not None
+
+    def save(self, blog, usecase=None, subject=None, language=None, model=None, timings=None):
+        """
+        Store a blog unless it is already stored and return its id
+        """
+        blog = _as_dict(blog)
+        blog_id = make_blog_id(blog)
+        if self.exists(blog_id):
+            return blog_id
+
+        created_at = time.time()
+        metadata = {
+            "usecase": usecase,
+            "subject": subject,
+            "language": language,
+            "model": model,
+            "timings": {node: round(seconds, 4) for node, seconds in (timings or {}).items()},
+            "created_at": created_at,
+        }
+        document = json.dumps(
+            {"id": blog_id, "blog": {"title": blog["title"], "content": blog["content"]}, **metadata},
+            ensure_ascii=False, separators=(",", ":"),
+        )
+        page = render_html(blog) if self.store_html else None
+        # compress outside the lock; a concurrent save of the same blog is ignored below
+        json_gz = _compress(document)
+        html_gz = _compress(page) if page is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO blogs (id, usecase, subject, language, model, timings, created_at, "
+                "json_gz, json_size, html_gz, html_size) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    blog_id, usecase, subject, language, model, json.dumps(metadata["timings"]), created_at,
+                    json_gz, len(document.encode("utf-8")),
+                    html_gz, len(page.encode("utf-8")) if page is not None else None,
+                ),
+            )
+            self._conn.commit()
+        return blog_id
+
+    def get(self, blog_id, format=JSON):
+        """
+        Return the StoredBlog for an id and format, or None
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format '{format}'. Choose from: {', '.join(FORMATS)}")
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {format}_gz, {format}_size FROM blogs WHERE id = ?", (blog_id,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return StoredBlog(blog_id, format, row[0], row[1])
+
+    def stats(self):
+        with self._lock:
+            count, raw, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(json_size + COALESCE(html_size, 0)), 0), "
+                "COALESCE(SUM(LENGTH(json_gz) + COALESCE(LENGTH(html_gz), 0)), 0) FROM blogs"
+            ).fetchone()
+        return {
+            "blogs": count,
+            "bytes": raw,
+            "stored_bytes": stored,
+            "compression_ratio": round(stored / raw, 3) if raw else 0.0,
+            "html": markdown is not None and self.store_html,
+        }
@@ -0,0 +1,142 @@
+import asyncio
+import os
+from src.observability.metrics import COALESCED_REQUESTS
+
+
+class _Flight:
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class _Broadcast:
+    def __init__(self):
+        self.events = []
+        self.done = False
+        self.error = None
+        self.changed = asyncio.Condition()
+        self.subscribers = 0
+        self.task = None
+
+
+class RequestCoalescer:
+    """
+    Collapse identical in-flight work onto one execution.
+
+    `run(key, factory)` awaits a single `factory()` per key no matter how
+    many callers ask at once; `stream(key, factory)` does the same for async
+    iterators, replaying earlier events to late subscribers. The shared
+    execution is only cancelled once every caller has gone away. Unlike the
+    response cache nothing is kept after completion, so it bounds duplicate
+    concurrent LLM spend even with caching disabled.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.leaders = 0
+        self.followers = 0
+        self._inflight = {}
+        self._streams = {}
+
+    @classmethod
+    def from_env(cls):
+        return cls(enabled=os.getenv("REQUEST_COALESCING_ENABLED", "true").lower() not in ("0", "false", "no"))
+
+    def _count(self, kind, leader):
+        if leader:
+            self.leaders += 1
+        else:
+            self.followers += 1
+        COALESCED_REQUESTS.inc(kind=kind, role="leader" if leader else "follower")
+
+    def _finished(self, key, flight, task):
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        # mark retrieved so an unobserved failure is not logged by asyncio
+        if not task.cancelled():
+            task.exception()
+
+    async def run(self, key, factory):
+        if not self.enabled:
+            return await factory()
+
+        flight = self._inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda task: self._finished(key, flight, task))
+        self._count("result", leader)
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # forget it right away: a caller arriving while the cancelled
+                # execution winds down must start a fresh one, not join it
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                flight.task.cancel()
+
+    async def _pump(self, key, broadcast, factory):
+        try:
+            async for event in factory():
+                async with broadcast.changed:
+                    broadcast.events.append(event)
+                    broadcast.changed.notify_all()
+        except Exception as e:
+            broadcast.error = e
+        finally:
+            if self._streams.get(key) is broadcast:
+                del self._streams[key]
+            broadcast.done = True
+            async with broadcast.changed:
+                broadcast.changed.notify_all()
+
+    async def stream(self, key, factory):
+        if not self.enabled:
+            async for event in factory():
+                yield event
+            return
+
+        broadcast = self._streams.get(key)
+        leader = broadcast is None
+        if leader:
+            broadcast = _Broadcast()
+            self._streams[key] = broadcast
+            broadcast.task = asyncio.ensure_future(self._pump(key, broadcast, factory))
+        self._count("stream", leader)
+
+        broadcast.subscribers += 1
+        index = 0
+        try:
+            while True:
+                async with broadcast.changed:
+                    await broadcast.changed.wait_for(lambda: index < len(broadcast.events) or broadcast.done)
+                    pending = broadcast.events[index:]
+                    finished = broadcast.done
+                for event in pending:
+                    yield event
+                index += len(pending)
+                if finished and index >= len(broadcast.events):
+                    break
+            if broadcast.error is not None:
+                raise broadcast.error
+        finally:
+            broadcast.subscribers -= 1
+            if broadcast.subscribers == 0 and not broadcast.task.done():
+                if self._streams.get(key) is broadcast:
+                    del self._streams[key]
+                broadcast.task.cancel()
+
+    def stats(self):
+        total = self.leaders + self.followers
+        return {
+            "enabled": self.enabled,
+            "executions": self.leaders,
+            "coalesced": self.followers,
+            "coalescing_ratio": (self.followers / total) if total else 0.0,
+            "inflight": len(self._inflight) + len(self._streams),
+        }
@@ -0,0 +1,204 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from src.cache.coalescer import RequestCoalescer
+from src.observability.metrics import CACHE_REQUESTS
+
+## bump whenever prompts change so stale generations are not served
+PROMPT_VERSION = "2"
+
+
+def normalize_subject(subject: str) -> str:
+    """
+    Normalize a topic / video id so trivially different spellings share a key
+    """
+    return " ".join(str(subject).lower().split())
+
+
+def make_cache_key(usecase, subject, language, model, prompt_version=PROMPT_VERSION):
+    """
+    Content-addressed key for a generation request
+    """
+    payload = json.dumps([
+        usecase,
+        normalize_subject(subject),
+        (language or "english").strip().lower(),
+        model,
+        prompt_version,
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MemoryBackend:
+    """
+    In-memory LRU cache with per-entry TTL
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """
+    On-disk cache backend storing JSON values in a single SQLite table
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl):
+        data = json.dumps(value, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, data, time.time() + ttl),
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+            self._conn.commit()
+
+
+class ResponseCache:
+    """
+    Two-tier (memory, optional SQLite) cache for graph results. Misses go
+    through a RequestCoalescer, so concurrent callers asking for the same
+    key share one generation instead of each running the graph; that
+    still holds when the cache itself is disabled.
+    """
+
+    def __init__(self, ttl=3600, max_entries=256, sqlite_path=None, enabled=True, coalescer=None):
+        self.ttl = ttl
+        self.enabled = enabled
+        self.memory = MemoryBackend(max_entries=max_entries)
+        self.disk = SQLiteBackend(sqlite_path) if sqlite_path else None
+        self.coalescer = coalescer or RequestCoalescer()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls, coalescer=None):
+        """
+        Build a cache from RESPONSE_CACHE_* environment variables
+        """
+        return cls(
+            ttl=float(os.getenv("RESPONSE_CACHE_TTL", "3600")),
+            max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "256")),
+            sqlite_path=os.getenv("RESPONSE_CACHE_SQLITE_PATH") or None,
+            enabled=os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() not in ("0", "false", "no"),
+            coalescer=coalescer,
+        )
+
+    async def get(self, key):
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = await asyncio.to_thread(self.disk.get, key)
+            if value is not None:
+                self.memory.set(key, value, self.ttl)
+        return value
+
+    async def set(self, key, value):
+        self.memory.set(key, value, self.ttl)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.set, key, value, self.ttl)
+
+    async def get_or_create(self, key, factory, cacheable=None):
+        """
+        Return the cached value for `key`, or await `factory()` to produce it.
+        Only one factory call runs per key at a time. A produced value for
+        which `cacheable(value)` is false is returned without being cached.
+        """
+        if not self.enabled:
+            return await self.coalescer.run(key, factory)
+
+        value = await self.get(key)
+        if value is not None:
+            self.hits += 1
+            CACHE_REQUESTS.inc(result="hit")
+            return value
+
+        self.misses += 1
+        CACHE_REQUESTS.inc(result="miss")
+
+        async def produce():
+            # an execution that just finished may have filled the cache
+            value = await self.get(key)
+            if value is None:
+                value = await factory()
+                if cacheable is None or cacheable(value):
+                    await self.set(key, value)
+            return value
+
+        return await self.coalescer.run(key, produce)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "entries": len(self.memory),
+            "inflight": self.coalescer.stats()["inflight"],
+            "disk": self.disk.path if self.disk else None,
+        }
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
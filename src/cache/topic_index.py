@@ -0,0 +1,212 @@
+import itertools
+import os
+import re
+import threading
+import zlib
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+## words that change the phrasing of a request but not the blog it should get
+STOPWORDS = frozenset(
+    "a an the of to in on for and or with about into vs versus what whats is are was were how why when "
+    "does do can should explain explained introduction intro guide overview tutorial basics beginners "
+    "beginner understanding blog post article write me please".split()
+)
+## words that flip or narrow a topic's meaning; two topics only match when these agree exactly
+NEGATIONS = frozenset("not no non never without nor dont doesnt isnt arent cant cannot wont shouldnt".split())
+
+
+def topic_tokens(topic: str):
+    """
+    Content words of a topic: lowercased, stopwords removed, plural "s" dropped
+    """
+    tokens = []
+    for word in _WORD_RE.findall(topic.lower().replace("'", "").replace("\u2019", "")):
+        if word in STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def guard_tokens(tokens):
+    """
+    The tokens a match must share exactly: numbers ("World War 1" is not
+    "World War 2") and negations ("how not to ..."). The hashed embedding
+    barely separates topics that differ only in these.
+    """
+    return tuple(sorted(token for token in tokens if token in NEGATIONS or any(c.isdigit() for c in token)))
+
+
+def embed(tokens, dim):
+    """
+    Hashed n-gram embedding: each word and each character trigram of the
+    words is hashed (crc32, so it is stable across processes) into one of
+    `dim` signed buckets. Needs no model download; L2-normalized.
+    """
+    import numpy as np
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for word in tokens:
+        features = [(word, 2.0)]
+        padded = f"#{word}#"
+        features.extend((padded[i:i + 3], 1.0) for i in range(len(padded) - 2))
+        for feature, weight in features:
+            h = zlib.crc32(feature.encode("utf-8"))
+            vector[h % dim] += -weight if h & 0x80000000 else weight
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class TopicMatch:
+    def __init__(self, subject, score):
+        self.subject = subject
+        self.score = score
+
+
+class TopicIndex:
+    """
+    Bounded index of previously generated topics for near-duplicate lookup.
+
+    Topics are embedded with `embed` into a NumPy matrix, allocated on the
+    first `add` (NumPy is only imported then). A lookup only scores the
+    entries that share a content word with the query, starting from the
+    rarest word (an inverted index acting as the ANN pre-filter), so it
+    stays sub-millisecond at 100k entries. Candidates whose numbers or
+    negations differ from the query's (see `guard_tokens`) never match.
+    When the index is full the least recently used topic is evicted.
+    """
+
+    def __init__(self, capacity=10000, threshold=0.9, dim=256, max_candidates=1024, enabled=True):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.dim = dim
+        self.max_candidates = max_candidates
+        self.enabled = enabled
+        self._vectors = None
+        self._last_used = None
+        self._subjects = [None] * capacity
+        self._tokens = [()] * capacity
+        self._guards = [()] * capacity
+        self._slots = {}
+        self._postings = {}
+        self._free = list(range(capacity - 1, -1, -1))
+        self._clock = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            capacity=int(os.getenv("TOPIC_INDEX_CAPACITY", "10000")),
+            threshold=float(os.getenv("TOPIC_INDEX_THRESHOLD", "0.9")),
+            dim=int(os.getenv("TOPIC_INDEX_DIM", "256")),
+            enabled=os.getenv("TOPIC_INDEX_ENABLED", "false").lower() in ("1", "true", "yes"),
+        )
+
+    def __len__(self):
+        return len(self._slots)
+
+    def _touch(self, slot):
+        self._clock += 1
+        self._last_used[slot] = self._clock
+
+    def _allocate(self):
+        import numpy as np
+
+        self._vectors = np.zeros((self.capacity, self.dim), dtype=np.float32)
+        self._last_used = np.zeros(self.capacity, dtype=np.int64)
+
+    def _evict(self):
+        import numpy as np
+
+        slot = int(np.argmin(self._last_used))
+        del self._slots[" ".join(self._tokens[slot])]
+        for token in set(self._tokens[slot]):
+            postings = self._postings[token]
+            postings.discard(slot)
+            if not postings:
+                del self._postings[token]
+        return slot
+
+    def add(self, subject: str):
+        """
+        Remember that a blog was generated for `subject`
+        """
+        if not self.enabled:
+            return
+        tokens = tuple(topic_tokens(subject))
+        if not tokens:
+            return
+        key = " ".join(tokens)
+        with self._lock:
+            if self._vectors is None:
+                self._allocate()
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._free.pop() if self._free else self._evict()
+                self._slots[key] = slot
+                self._subjects[slot] = subject
+                self._tokens[slot] = tokens
+                self._guards[slot] = guard_tokens(tokens)
+                self._vectors[slot] = embed(tokens, self.dim)
+                for token in set(tokens):
+                    self._postings.setdefault(token, set()).add(slot)
+            self._touch(slot)
+
+    def _candidates(self, tokens, guards):
+        ## rarest words first; a near duplicate shares most of its words, so
+        ## stopping at max_candidates (before a very common word's postings) is safe
+        postings = sorted(
+            (self._postings[token] for token in set(tokens) if token in self._postings), key=len
+        )
+        candidates = set()
+        for slots in postings:
+            room = self.max_candidates - len(candidates)
+            if len(slots) > room:
+                candidates.update(itertools.islice(slots, room))
+                break
+            candidates |= slots
+        return [slot for slot in candidates if self._guards[slot] == guards]
+
+    def lookup(self, subject: str):
+        """
+        The stored topic most similar to `subject` if its cosine similarity
+        reaches the threshold, else None
+        """
+        if not self.enabled:
+            return None
+        tokens = topic_tokens(subject)
+        if not tokens:
+            return None
+        with self._lock:
+            slot = self._slots.get(" ".join(tokens))
+            score = 1.0
+            if slot is None and self._vectors is not None:
+                import numpy as np
+
+                candidates = self._candidates(tokens, guard_tokens(tokens))
+                if candidates:
+                    slots = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+                    scores = self._vectors[slots] @ embed(tokens, self.dim)
+                    best = int(np.argmax(scores))
+                    slot, score = int(slots[best]), float(scores[best])
+            if slot is None or score < self.threshold:
+                self.misses += 1
+                return None
+            self._touch(slot)
+            self.hits += 1
+            return TopicMatch(self._subjects[slot], score)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._slots),
+            "capacity": self.capacity,
+            "threshold": self.threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
@@ -0,0 +1,30 @@
+import uuid
+from langchain_core.runnables.config import patch_config
+
+
+def new_thread_id():
+    return uuid.uuid4().hex
+
+
+def thread_config(config, thread_id, usecase):
+    """
+    Add the thread id (and the usecase, kept in checkpoint metadata so a
+    resume knows which graph to run) to a run config
+    """
+    config = patch_config(config, configurable={**(config or {}).get("configurable", {}), "thread_id": thread_id})
+    config["metadata"] = {**config.get("metadata", {}), "usecase": usecase}
+    return config
+
+
+async def ainvoke_in_thread(graph, inputs, config, thread_id, usecase, resume=False):
+    """
+    Run a checkpointed graph in `thread_id`. With `resume`, a thread that
+    stopped mid-graph continues from its last completed node instead of
+    starting over; a finished or unknown thread runs `inputs` as usual.
+    """
+    config = thread_config(config, thread_id, usecase)
+    if resume:
+        snapshot = await graph.aget_state(config)
+        if snapshot.next:
+            return await graph.ainvoke(None, config)
+    return await graph.ainvoke(inputs, config)
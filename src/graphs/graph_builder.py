@@ -1,28 +1,35 @@
 from langgraph.graph import StateGraph, START, END
-from src.llms.groqllm import GroqLLM
+from langchain_core.runnables import RunnableLambda
+from src.llms.backends import get_llm_provider_class
 from src.states.blogstate import BlogState
-from src.nodes.blog_node import BlogNode
+from src.nodes.blog_node import BlogNode, GenerationConfig
 
 class GraphBuilder:
-    def __init__(self,llm):
+    def __init__(self,llm,fallback_llms=None,invoker=None,generation_config=None):
         self.llm=llm
+        self.fallback_llms=fallback_llms
+        self.invoker=invoker
+        self.generation_config=generation_config or GenerationConfig.from_env()
 
-    def build_topic_graph(self):
+    def _blog_node(self):
+        return BlogNode(self.llm, fallback_llms=self.fallback_llms, invoker=self.invoker, generation_config=self.generation_config)
+
+    def _node(self, func, afunc):
         """
-        Build a graph to generate blogs based on topic with language support
+        Wrap a node so the compiled graph runs `func` under invoke()
+        and the non-blocking `afunc` under ainvoke()
         """
-        graph = StateGraph(BlogState)
-        self.blog_node_obj=BlogNode(self.llm)
-        ## Nodes
-        graph.add_node("title_creation", self.blog_node_obj.title_creation)
-        graph.add_node("content_generation",self.blog_node_obj.content_generation)
-        graph.add_node("translation", self.blog_node_obj.translation)
-        graph.add_node("route",self.blog_node_obj.route)
+        return RunnableLambda(func, afunc=afunc, name=func.__name__)
 
-        ## Edges
-        graph.add_edge(START,"title_creation")
-        graph.add_edge("title_creation","content_generation")
-        graph.add_edge("content_generation", "route")
+    def _add_translation_branch(self, graph):
+        """
+        Add the route node and everything after it: a single `translation`
+        for current_language, or one `language_translation` branch per entry
+        of `languages` (fanned out with Send and run in parallel)
+        """
+        graph.add_node("translation", self._node(self.blog_node_obj.translation, self.blog_node_obj.atranslation))
+        graph.add_node("language_translation", self._node(self.blog_node_obj.language_translation, self.blog_node_obj.alanguage_translation))
+        graph.add_node("route", self.blog_node_obj.route)
 
         ## conditional edge for language translation
         graph.add_conditional_edges(
@@ -30,10 +37,37 @@ class GraphBuilder:
             self.blog_node_obj.route_decision,
             {
                 "translate":"translation",
+                "fanout":"language_translation",
                 "end":END
             }
         )
         graph.add_edge("translation",END)
+        graph.add_edge("language_translation",END)
+
+    def build_topic_graph(self):
+        """
+        Build a graph to generate blogs based on topic with language support
+        """
+        graph = StateGraph(BlogState)
+        self.blog_node_obj=self._blog_node()
+        self._add_translation_branch(graph)
+
+        if self.generation_config.single_call:
+            ## title and content come from one structured response
+            graph.add_node("blog_generation", self._node(self.blog_node_obj.blog_generation, self.blog_node_obj.ablog_generation))
+            graph.add_edge(START,"blog_generation")
+            graph.add_edge("blog_generation","route")
+            return graph
+
+        ## Nodes
+        graph.add_node("title_creation", self._node(self.blog_node_obj.title_creation, self.blog_node_obj.atitle_creation))
+        graph.add_node("content_generation",self._node(self.blog_node_obj.content_generation, self.blog_node_obj.acontent_generation))
+
+        ## Edges
+        ## title and content are independent, so fan out from START and join at route
+        graph.add_edge(START,"title_creation")
+        graph.add_edge(START,"content_generation")
+        graph.add_edge(["title_creation","content_generation"], "route")
 
         return graph
     
@@ -42,44 +76,53 @@ class GraphBuilder:
         Build a graph for blog generation from YouTube transcript
         """
         graph = StateGraph(BlogState)
-        self.blog_node_obj=BlogNode(self.llm)
+        self.blog_node_obj=self._blog_node()
         ## Nodes
-        graph.add_node("extract_transcript", self.blog_node_obj.extract_youtube_transcript)
-        graph.add_node("generate_blog_from_transcript", self.blog_node_obj.generate_blog_from_transcript)
-        graph.add_node("translation", self.blog_node_obj.translation)
-        graph.add_node("route", self.blog_node_obj.route)
+        graph.add_node("extract_transcript", self._node(self.blog_node_obj.extract_youtube_transcript, self.blog_node_obj.aextract_youtube_transcript))
+        graph.add_node("generate_blog_from_transcript", self._node(self.blog_node_obj.generate_blog_from_transcript, self.blog_node_obj.agenerate_blog_from_transcript))
+        self._add_translation_branch(graph)
 
         ## Edges
         graph.add_edge(START, "extract_transcript")
         graph.add_edge("extract_transcript", "generate_blog_from_transcript")
         graph.add_edge("generate_blog_from_transcript", "route")
-        
-        ## conditional edge
-        graph.add_conditional_edges(
-            "route",
-            self.blog_node_obj.route_decision,
-            {
-                "translate":"translation",
-                "end":END
-            }
-        )
-        graph.add_edge("translation",END)
         return graph
 
+
+    def build_translation_graph(self):
+        """
+        Build a graph that only translates an already generated blog
+        (used when the English base blog is served from cache)
+        """
+        graph = StateGraph(BlogState)
+        self.blog_node_obj=self._blog_node()
+        self._add_translation_branch(graph)
+        graph.add_edge(START, "route")
+        return graph
     
-    def setup_graph(self,usecase):
+    def setup_graph(self,usecase,checkpointer=None):
+        """
+        Compile the graph for a usecase. With a checkpointer, every run needs
+        a thread id and can be resumed from its last completed node.
+        """
         if usecase=="topic":
-            return self.build_topic_graph().compile()
+            return self.build_topic_graph().compile(checkpointer=checkpointer)
         elif usecase=="youtube":
-            return self.build_youtube_graph().compile()
+            return self.build_youtube_graph().compile(checkpointer=checkpointer)
+        elif usecase=="translation":
+            return self.build_translation_graph().compile(checkpointer=checkpointer)
         else:
             raise ValueError(f"Unknown usecase: {usecase}")
     
 
 ## Below code is for the langsmith langgraph studio
-llm=GroqLLM().get_llm()
-
-## get the graph
-graph_builder=GraphBuilder(llm)
-graph=graph_builder.build_topic_graph().compile()
+def make_graph(config=None):
+    """
+    Graph factory referenced by langgraph.json. The LLM client is created
+    and the graph compiled only when the dev server asks for the graph,
+    so importing this module has no side effects.
+    """
+    usecase=((config or {}).get("configurable") or {}).get("usecase","topic")
+    llm=get_llm_provider_class()().get_llm()
+    return GraphBuilder(llm).setup_graph(usecase)
 
@@ -0,0 +1,119 @@
+import threading
+from src.graphs.graph_builder import GraphBuilder
+from src.llms.router import RoutedInvoker
+
+USECASES = ("topic", "youtube", "translation")
+
+
+class GraphRegistry:
+    """
+    Process-wide registry of compiled graphs keyed by (usecase, model).
+
+    Graphs are compiled once (at startup or on first use) and shared by
+    every request. Changing the default model builds the new graphs first
+    and then swaps them in under the lock, so in-flight requests keep the
+    graph they already hold.
+
+    With a `router_factory`, every LLM call in the graphs is routed through
+    the shared ModelRouter instead of a fixed primary/fallback pair. With a
+    `checkpointer`, graphs persist their state after every node.
+    """
+
+    def __init__(self, llm_provider_factory, router_factory=None, checkpointer=None):
+        self._llm_provider_factory = llm_provider_factory
+        self._router_factory = router_factory
+        self.checkpointer = checkpointer
+        self._router = None
+        self._llm_provider = None
+        self._graphs = {}
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def llm_provider(self):
+        """
+        Lazily create the shared LLM provider (e.g. GroqLLM)
+        """
+        if self._llm_provider is None:
+            with self._lock:
+                if self._llm_provider is None:
+                    self._llm_provider = self._llm_provider_factory()
+        return self._llm_provider
+
+    @property
+    def model(self):
+        if self._model is None:
+            return self.llm_provider.current_model
+        return self._model
+
+    @property
+    def router(self):
+        if self._router is None and self._router_factory is not None:
+            with self._lock:
+                if self._router is None:
+                    self._router = self._router_factory()
+        return self._router
+
+    def _build(self, usecase, model):
+        provider = self.llm_provider
+        llm = provider.get_llm(model=model)
+        if self.router is not None:
+            invoker = RoutedInvoker(self.router, lambda name: provider.get_llm(model=name))
+            return GraphBuilder(llm, invoker=invoker).setup_graph(usecase=usecase, checkpointer=self.checkpointer)
+
+        fallback_llms = []
+        if model != provider.fallback_model:
+            fallback_llms.append(provider.get_llm(model=provider.fallback_model))
+        return GraphBuilder(llm, fallback_llms=fallback_llms).setup_graph(
+            usecase=usecase, checkpointer=self.checkpointer
+        )
+
+    def get(self, usecase, model=None):
+        """
+        Return the compiled graph for a usecase, compiling it on first use.
+        """
+        if usecase not in USECASES:
+            raise ValueError(f"Unknown usecase: {usecase}")
+        model = model or self.model
+        key = (usecase, model)
+        graph = self._graphs.get(key)
+        if graph is None:
+            compiled = self._build(usecase, model)
+            with self._lock:
+                graph = self._graphs.setdefault(key, compiled)
+        return graph
+
+    def warmup(self, model=None):
+        """
+        Compile the graphs for every usecase ahead of the first request.
+        """
+        model = model or self.model
+        for usecase in USECASES:
+            self.get(usecase, model)
+        print(f"Compiled graphs for model: {model}")
+
+    def set_model(self, model):
+        """
+        Make `model` the default, compiling its graphs before the swap.
+        """
+        compiled = {
+            (usecase, model): self._graphs.get((usecase, model)) or self._build(usecase, model)
+            for usecase in USECASES
+        }
+        with self._lock:
+            self._graphs.update(compiled)
+            self._model = model
+
+    def set_checkpointer(self, checkpointer):
+        """
+        Checkpoint graph runs with `checkpointer` from now on; graphs
+        compiled before are rebuilt on their next use
+        """
+        with self._lock:
+            self.checkpointer = checkpointer
+            self._graphs = {}
+
+    def clear(self):
+        with self._lock:
+            self._graphs = {}
+            self._model = None
@@ -0,0 +1,52 @@
+import json
+
+## internal bookkeeping nodes that carry no user-visible progress
+SILENT_NODES = {"route"}
+
+
+async def stream_graph_events(graph, inputs, config=None):
+    """
+    Run a compiled graph with astream and yield progress events as dicts:
+
+    - {"event": "node_start", "node": ...} when a node begins
+    - {"event": "token", "node": ..., "content": ...} for each LLM token
+    - {"event": "node_end", "node": ...} when a node finishes
+    - {"event": "translated_section", "language": ..., "index": ..., "content": ...}
+      for each section translated while the blog is still generating
+    - {"event": "generation_restarted", "node": ..., "attempt": ...} when a
+      retried LLM call streams again; drop that node's tokens received so far
+    - {"event": "done", "data": <final state>} once the graph completes
+    """
+    final_state = None
+    async for mode, chunk in graph.astream(
+        inputs, config, stream_mode=["tasks", "messages", "custom", "values"]
+    ):
+        if mode == "messages":
+            message, metadata = chunk
+            content = getattr(message, "content", "")
+            if isinstance(content, str) and content:
+                yield {
+                    "event": "token",
+                    "node": metadata.get("langgraph_node"),
+                    "content": content,
+                }
+        elif mode == "tasks":
+            if chunk["name"] in SILENT_NODES:
+                continue
+            if "input" in chunk:
+                yield {"event": "node_start", "node": chunk["name"]}
+            else:
+                yield {"event": "node_end", "node": chunk["name"]}
+        elif mode == "custom":
+            yield chunk
+        elif mode == "values":
+            final_state = chunk
+
+    yield {"event": "done", "data": final_state}
+
+
+def to_ndjson(event):
+    """
+    Serialize one stream event as a newline-delimited JSON line
+    """
+    return json.dumps(event, default=str) + "\n"
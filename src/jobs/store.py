@@ -0,0 +1,201 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from pydantic import BaseModel
+from src.utils.paths import data_path
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINAL_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+_COLUMNS = "id, client_id, usecase, payload, priority, status, result, error, created_at, started_at, finished_at"
+
+
+def _dumps(value):
+    return json.dumps(value, default=lambda v: v.model_dump() if isinstance(v, BaseModel) else str(v))
+
+
+class Job:
+    def __init__(self, id, client_id, usecase, payload, priority, status, result=None,
+                 error=None, created_at=None, started_at=None, finished_at=None):
+        self.id = id
+        self.client_id = client_id
+        self.usecase = usecase
+        self.payload = payload
+        self.priority = priority
+        self.status = status
+        self.result = result
+        self.error = error
+        self.created_at = created_at
+        self.started_at = started_at
+        self.finished_at = finished_at
+
+    @classmethod
+    def from_row(cls, row):
+        job = cls(*row)
+        job.payload = json.loads(job.payload)
+        job.result = json.loads(job.result) if job.result is not None else None
+        return job
+
+    def to_dict(self, include_result=False):
+        data = {
+            "job_id": self.id,
+            "client_id": self.client_id,
+            "usecase": self.usecase,
+            "status": self.status,
+            "priority": self.priority,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+
+class JobStore:
+    """
+    SQLite-backed job table. All status transitions are single UPDATEs
+    guarded by the expected current status, so a job cancelled while it
+    runs is never overwritten by the worker that finishes it.
+
+        queued -> running -> succeeded | failed | cancelled
+        queued -> cancelled
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, client_id TEXT NOT NULL, usecase TEXT NOT NULL, "
+            "payload TEXT NOT NULL, priority INTEGER NOT NULL DEFAULT 0, status TEXT NOT NULL, "
+            "result TEXT, error TEXT, created_at REAL NOT NULL, started_at REAL, finished_at REAL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (status, priority DESC, created_at)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls):
+        """
+        JOB_QUEUE_SQLITE_PATH selects the database (":memory:" for no persistence)
+        """
+        return cls(os.getenv("JOB_QUEUE_SQLITE_PATH", data_path("jobs.sqlite3")))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def submit(self, usecase, payload, client_id="anonymous", priority=0):
+        job = Job(uuid.uuid4().hex, client_id, usecase, payload, priority, QUEUED, created_at=time.time())
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, client_id, usecase, payload, priority, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job.id, client_id, usecase, _dumps(payload), priority, QUEUED, job.created_at),
+            )
+            self._conn.commit()
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.from_row(row) if row else None
+
+    def claim_next(self, per_client_limit=None):
+        """
+        Move the highest-priority, oldest queued job to running and return
+        it, skipping clients that already have `per_client_limit` jobs
+        running. Returns None when nothing is eligible.
+        """
+        with self._lock:
+            query = f"SELECT {_COLUMNS} FROM jobs WHERE status = ?"
+            params = [QUEUED]
+            if per_client_limit:
+                query += (
+                    " AND client_id NOT IN (SELECT client_id FROM jobs WHERE status = ?"
+                    " GROUP BY client_id HAVING COUNT(*) >= ?)"
+                )
+                params += [RUNNING, per_client_limit]
+            query += " ORDER BY priority DESC, created_at LIMIT 1"
+            row = self._conn.execute(query, params).fetchone()
+            if row is None:
+                return None
+            job = Job.from_row(row)
+            job.status, job.started_at = RUNNING, time.time()
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+                (RUNNING, job.started_at, job.id),
+            )
+            self._conn.commit()
+        return job
+
+    def _transition(self, job_id, from_statuses, status, result=None, error=None):
+        placeholders = ", ".join("?" for _ in from_statuses)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+                f"WHERE id = ? AND status IN ({placeholders})",
+                (status, _dumps(result) if result is not None else None, error, time.time(),
+                 job_id, *from_statuses),
+            )
+            self._conn.commit()
+        return cursor.rowcount == 1
+
+    def complete(self, job_id, result):
+        return self._transition(job_id, (RUNNING,), SUCCEEDED, result=result)
+
+    def fail(self, job_id, error):
+        return self._transition(job_id, (RUNNING,), FAILED, error=error)
+
+    def cancel(self, job_id):
+        return self._transition(job_id, (QUEUED, RUNNING), CANCELLED)
+
+    def requeue_running(self, job_ids=None):
+        """
+        Put running jobs back in the queue, e.g. after a restart interrupted them
+        """
+        with self._lock:
+            if job_ids is None:
+                cursor = self._conn.execute(
+                    "UPDATE jobs SET status = ?, started_at = NULL WHERE status = ?", (QUEUED, RUNNING)
+                )
+            else:
+                cursor = self._conn.executemany(
+                    "UPDATE jobs SET status = ?, started_at = NULL WHERE id = ? AND status = ?",
+                    [(QUEUED, job_id, RUNNING) for job_id in job_ids],
+                )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def counts(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
+
+    def purge(self, older_than):
+        """
+        Delete finished jobs that ended more than `older_than` seconds ago
+        """
+        placeholders = ", ".join("?" for _ in FINAL_STATUSES)
+        with self._lock:
+            cursor = self._conn.execute(
+                f"DELETE FROM jobs WHERE status IN ({placeholders}) AND finished_at < ?",
+                (*FINAL_STATUSES, time.time() - older_than),
+            )
+            self._conn.commit()
+        return cursor.rowcount
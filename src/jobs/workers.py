@@ -0,0 +1,126 @@
+import asyncio
+import os
+from src.jobs.store import FINAL_STATUSES
+
+
+class JobQueue:
+    """
+    Pool of worker coroutines draining a JobStore. `handler(job)` is an
+    async function that returns the job result; it runs on the app's event
+    loop, so the graphs' own async LLM calls provide the concurrency.
+
+    Workers wake immediately on submit and finish, and poll every
+    `poll_interval` seconds otherwise (e.g. for jobs another process added).
+    """
+
+    def __init__(self, store, handler, workers=4, per_client_limit=2, poll_interval=1.0, retention=86400.0):
+        self.store = store
+        self.handler = handler
+        self.workers = workers
+        self.per_client_limit = per_client_limit
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._wakeup = None
+        self._tasks = []
+        self._running = {}
+
+    @classmethod
+    def from_env(cls, store, handler):
+        return cls(
+            store,
+            handler,
+            workers=int(os.getenv("JOB_WORKERS", "4")),
+            per_client_limit=int(os.getenv("JOB_CLIENT_CONCURRENCY", "2")),
+            poll_interval=float(os.getenv("JOB_POLL_INTERVAL", "1")),
+            retention=float(os.getenv("JOB_RETENTION_SECONDS", "86400")),
+        )
+
+    @property
+    def started(self):
+        return bool(self._tasks)
+
+    async def start(self):
+        self._wakeup = asyncio.Event()
+        requeued = await asyncio.to_thread(self.store.requeue_running)
+        purged = await asyncio.to_thread(self.store.purge, self.retention)
+        if requeued or purged:
+            print(f"Job queue: requeued {requeued} interrupted jobs, purged {purged} old jobs")
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """
+        Stop the workers. Jobs still running go back to the queue so the
+        next start picks them up.
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        interrupted = list(self._running)
+        for task in self._running.values():
+            task.cancel()
+        await asyncio.gather(*self._running.values(), return_exceptions=True)
+        self._running.clear()
+        if interrupted:
+            await asyncio.to_thread(self.store.requeue_running, interrupted)
+
+    def notify(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def submit(self, usecase, payload, client_id="anonymous", priority=0):
+        job = await asyncio.to_thread(self.store.submit, usecase, payload, client_id, priority)
+        self.notify()
+        return job
+
+    async def get(self, job_id):
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def cancel(self, job_id):
+        """
+        Cancel a queued or running job. Returns False if it already finished.
+        """
+        cancelled = await asyncio.to_thread(self.store.cancel, job_id)
+        task = self._running.get(job_id)
+        if cancelled and task is not None:
+            task.cancel()
+        return cancelled
+
+    async def _worker(self):
+        while True:
+            # clear before claiming so a submit that lands in between is not missed
+            self._wakeup.clear()
+            job = await asyncio.to_thread(self.store.claim_next, self.per_client_limit)
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job):
+        task = asyncio.create_task(self.handler(job))
+        self._running[job.id] = task
+        # wait() does not raise when the job task itself is cancelled; if the
+        # worker is cancelled instead, stop() cancels and requeues the job
+        await asyncio.wait({task})
+        self._running.pop(job.id, None)
+        self.notify()
+
+        if task.cancelled():
+            print(f"Job {job.id} cancelled")
+        elif task.exception() is not None:
+            print(f"Job {job.id} failed: {task.exception()}")
+            await asyncio.to_thread(self.store.fail, job.id, str(task.exception()))
+        else:
+            await asyncio.to_thread(self.store.complete, job.id, task.result())
+
+    def stats(self):
+        counts = self.store.counts()
+        return {
+            "workers": self.workers,
+            "per_client_limit": self.per_client_limit,
+            "running_here": len(self._running),
+            **{status: counts.get(status, 0) for status in ("queued", "running", *FINAL_STATUSES)},
+        }
@@ -0,0 +1,20 @@
+import importlib
+import os
+
+## LLM_BACKEND value -> (module, provider class); providers share the GroqLLM interface
+LLM_BACKENDS = {
+    "groq": ("src.llms.groqllm", "GroqLLM"),
+    "fake": ("src.llms.fakellm", "FakeLLM"),
+}
+
+
+def get_llm_provider_class(name=None):
+    """
+    Provider class for the configured backend. Imported on demand so the
+    unused backend's dependencies are never loaded.
+    """
+    name = (name or os.getenv("LLM_BACKEND", "groq")).strip().lower()
+    if name not in LLM_BACKENDS:
+        raise ValueError(f"Unknown LLM_BACKEND: {name} (expected one of {', '.join(LLM_BACKENDS)})")
+    module, attribute = LLM_BACKENDS[name]
+    return getattr(importlib.import_module(module), attribute)
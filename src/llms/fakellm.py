@@ -0,0 +1,187 @@
+import asyncio
+import os
+import threading
+import time
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+from src.transcripts.chunking import estimate_tokens
+
+## instructions of the title-only prompts, answered with the canned title line
+TITLE_ONLY_MARKERS = ("Return only the title", "Generate only the title")
+
+FAKE_CONTENT = """# Fake Blog
+
+## Introduction
+
+Generated by the local fake model.
+
+## Details
+
+Lorem ipsum dolor sit amet, consectetur adipiscing elit.
+"""
+
+
+class FakeRateLimitError(Exception):
+    """
+    Looks like a provider 429 to src.llms.retry: status_code 429 and a
+    response carrying a Retry-After header
+    """
+
+    class _Response:
+        def __init__(self, retry_after):
+            self.headers = {"retry-after": str(retry_after)}
+
+    def __init__(self, retry_after):
+        super().__init__(f"Error code: 429 - Rate limit reached, please try again in {retry_after}s")
+        self.status_code = 429
+        self.response = self._Response(retry_after)
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Deterministic local chat model. It waits `latency` seconds before the
+    first token, then emits `content` word by word at `tokens_per_second`
+    (0 = all at once). With `rate_limit_every=N` every Nth call fails with a
+    429. Title prompts get the first heading of `content`; translation
+    prompts get their section or title back, so they take time in
+    proportion to its length.
+    """
+
+    model_name: str = "fake"
+    latency: float = 0.5
+    tokens_per_second: float = 0.0
+    content: str = FAKE_CONTENT
+    rate_limit_every: int = 0
+    retry_after: float = 1.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self):
+        return "fake-chat"
+
+    def _check_rate_limit(self):
+        self.calls += 1
+        if self.rate_limit_every and self.calls % self.rate_limit_every == 0:
+            raise FakeRateLimitError(self.retry_after)
+
+    def _text(self, messages):
+        prompt = str(messages[-1].content) if messages else ""
+        for marker in ("SECTION:", "BLOG TITLE:"):
+            if marker in prompt:
+                return prompt.split(marker, 1)[1].strip()
+        if any(marker in prompt for marker in TITLE_ONLY_MARKERS):
+            for line in self.content.splitlines():
+                if line.strip():
+                    return line.strip("# ").strip()
+        return self.content
+
+    def _tokens(self, text):
+        words = text.split(" ")
+        return [word if i == len(words) - 1 else word + " " for i, word in enumerate(words)]
+
+    def _token_delay(self):
+        return 1.0 / self.tokens_per_second if self.tokens_per_second else 0.0
+
+    def _result(self, messages, text):
+        message = AIMessage(content=text, usage_metadata={
+            "input_tokens": estimate_tokens(str(messages)),
+            "output_tokens": len(self._tokens(text)),
+            "total_tokens": estimate_tokens(str(messages)) + len(self._tokens(text)),
+        })
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self._check_rate_limit()
+        text = self._text(messages)
+        time.sleep(self.latency + self._token_delay() * len(self._tokens(text)))
+        return self._result(messages, text)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self._check_rate_limit()
+        text = self._text(messages)
+        await asyncio.sleep(self.latency + self._token_delay() * len(self._tokens(text)))
+        return self._result(messages, text)
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        self._check_rate_limit()
+        time.sleep(self.latency)
+        start = time.perf_counter()
+        for index, token in enumerate(self._tokens(self._text(messages))):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+            # paced against the start time, so per-token overhead does not slow the rate down
+            time.sleep(max(0.0, start + (index + 1) * self._token_delay() - time.perf_counter()))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        self._check_rate_limit()
+        await asyncio.sleep(self.latency)
+        start = time.perf_counter()
+        for index, token in enumerate(self._tokens(self._text(messages))):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+            await asyncio.sleep(max(0.0, start + (index + 1) * self._token_delay() - time.perf_counter()))
+
+    def _structured(self, schema, text):
+        values = {}
+        for name in schema.model_fields:
+            values[name] = text.splitlines()[0].strip("# ").strip() if name == "title" else text
+        return schema.model_validate(values)
+
+    def with_structured_output(self, schema, *, include_raw=False, **kwargs):
+        """
+        Return `schema` instances (e.g. Blog) filled from `content`; the
+        title field gets the first heading
+        """
+        def invoke(input, config=None):
+            message = self.invoke(input, config)
+            parsed = self._structured(schema, message.content)
+            return {"raw": message, "parsed": parsed, "parsing_error": None} if include_raw else parsed
+
+        async def ainvoke(input, config=None):
+            message = await self.ainvoke(input, config)
+            parsed = self._structured(schema, message.content)
+            return {"raw": message, "parsed": parsed, "parsing_error": None} if include_raw else parsed
+
+        return RunnableLambda(invoke, afunc=ainvoke, name=f"{self.model_name}_structured")
+
+
+class FakeLLM:
+    """
+    Drop-in replacement for GroqLLM backed by FakeChatModel, configured
+    from FAKE_LLM_* environment variables (LLM_BACKEND=fake)
+    """
+
+    def __init__(self, latency=None, tokens_per_second=None, rate_limit_every=None, retry_after=None):
+        self.primary_model = "fake-primary"
+        self.fallback_model = "fake-fallback"
+        self.current_model = self.primary_model
+        self.latency = latency if latency is not None else float(os.getenv("FAKE_LLM_LATENCY", "0.5"))
+        self.tokens_per_second = (
+            tokens_per_second if tokens_per_second is not None else float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", "0"))
+        )
+        self.rate_limit_every = (
+            rate_limit_every if rate_limit_every is not None else int(os.getenv("FAKE_LLM_RATE_LIMIT_EVERY", "0"))
+        )
+        self.retry_after = retry_after if retry_after is not None else float(os.getenv("FAKE_LLM_RETRY_AFTER", "1"))
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get_llm(self, use_fallback=False, model=None):
+        if model is None:
+            model = self.fallback_model if use_fallback else self.current_model
+        with self._lock:
+            if model not in self._clients:
+                self._clients[model] = FakeChatModel(
+                    model_name=model,
+                    latency=self.latency,
+                    tokens_per_second=self.tokens_per_second,
+                    rate_limit_every=self.rate_limit_every,
+                    retry_after=self.retry_after,
+                )
+            return self._clients[model]
@@ -1,50 +1,48 @@
-from langchain_groq import ChatGroq
 import os 
 from dotenv import load_dotenv
+from src.llms.retry import is_rate_limit_error
 
 class GroqLLM:
     def __init__(self):
         load_dotenv()
         self.groq_api_key = os.getenv("GROQ_API_KEY")
-        os.environ["GROQ_API_KEY"] = self.groq_api_key
         self.primary_model = "openai/gpt-oss-120b"
         self.fallback_model = "llama-3.1-8b-instant"
         self.current_model = self.primary_model
+        ## one client per model so HTTP connections are reused across requests
+        self._clients = {}
 
-    def get_llm(self, use_fallback=False):
+    def get_llm(self, use_fallback=False, model=None):
         """
         Get LLM instance. If use_fallback is True, uses the fallback model.
+        An explicit model name takes precedence over both.
         """
         try:
             if not self.groq_api_key:
                 raise ValueError("GROQ_API_KEY is not set")
             
-            model = self.fallback_model if use_fallback else self.current_model
-            print(f"Using Groq model: {model}")
-            
-            llm = ChatGroq(
-                api_key=self.groq_api_key,
-                model=model,
-                temperature=0.7
-            )
+            if model is None:
+                model = self.fallback_model if use_fallback else self.current_model
+
+            llm = self._clients.get(model)
+            if llm is None:
+                ## imported on first use: langchain_groq pulls in the groq SDK and httpx
+                from langchain_groq import ChatGroq
+                print(f"Using Groq model: {model}")
+                llm = ChatGroq(
+                    api_key=self.groq_api_key,
+                    model=model,
+                    temperature=0.7
+                )
+                self._clients[model] = llm
             return llm
         except Exception as e:
             raise ValueError(f"Error occurred with exception: {str(e)}")
     
     def should_use_fallback(self, error_message):
         """
-        Check if error indicates rate limit, then switch to fallback model.
+        Check if error indicates rate limit. Fallback itself now happens per
+        LLM call (see src.llms.retry.ResilientInvoker), so this no longer
+        switches current_model for the whole process.
         """
-        error_lower = str(error_message).lower()
-        # Check for rate limit errors (429, rate limit, tokens per day)
-        if any(keyword in error_lower for keyword in [
-            'rate limit', 
-            '429', 
-            'tokens per day', 
-            'tpd',
-            'limit reached'
-        ]):
-            print(f"Rate limit detected. Switching to fallback model: {self.fallback_model}")
-            self.current_model = self.fallback_model
-            return True
-        return False
\ No newline at end of file
+        return is_rate_limit_error(error_message)
@@ -0,0 +1,157 @@
+import asyncio
+import os
+import random
+import re
+import time
+from src.observability.metrics import FALLBACKS, LLM_RETRIES
+
+RATE_LIMIT_MARKERS = ('rate limit', '429', 'tokens per day', 'tpd', 'limit reached')
+TRANSIENT_MARKERS = ('timeout', 'timed out', 'connection', 'temporarily unavailable', '502', '503', '504')
+
+## Groq error bodies say e.g. "Please try again in 7m12.5s" or "in 850ms"
+_TRY_AGAIN_RE = re.compile(r"try again in (?:(\d+)h)?(?:(\d+)m(?!s))?(?:([\d.]+)s)?(?:([\d.]+)ms)?", re.IGNORECASE)
+
+
+def is_rate_limit_error(error) -> bool:
+    if getattr(error, "status_code", None) == 429:
+        return True
+    error_lower = str(error).lower()
+    return any(marker in error_lower for marker in RATE_LIMIT_MARKERS)
+
+
+def is_transient_error(error) -> bool:
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int) and status >= 500:
+        return True
+    error_lower = str(error).lower()
+    return any(marker in error_lower for marker in TRANSIENT_MARKERS)
+
+
+def get_retry_after(error):
+    """
+    Seconds the provider asked us to wait, from the Retry-After header
+    or the error message, or None when it did not say
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        value = headers.get("retry-after")
+        if value is not None:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                pass
+
+    match = _TRY_AGAIN_RE.search(str(error))
+    if match and any(match.groups()):
+        hours, minutes, seconds, millis = match.groups()
+        return (
+            int(hours or 0) * 3600
+            + int(minutes or 0) * 60
+            + float(seconds or 0)
+            + float(millis or 0) / 1000
+        )
+    return None
+
+
+def _model_name(llm):
+    return getattr(llm, "model_name", None) or getattr(llm, "model", None) or type(llm).__name__
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for individual LLM calls.
+    A provider Retry-After hint replaces the computed delay; when it is
+    longer than `max_delay` the call moves on to the next model instead
+    of waiting.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=20.0, jitter=True):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_attempts=int(os.getenv("LLM_RETRY_ATTEMPTS", "3")),
+            base_delay=float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5")),
+            max_delay=float(os.getenv("LLM_RETRY_MAX_DELAY", "20")),
+        )
+
+    def backoff(self, attempt):
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def next_delay(self, error, attempt):
+        """
+        Delay before the next attempt on the same model, or None to give up
+        on this model (not retryable, attempts exhausted, or asked to wait
+        longer than max_delay)
+        """
+        if not (is_rate_limit_error(error) or is_transient_error(error)):
+            return None
+        if attempt + 1 >= self.max_attempts:
+            return None
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            # small jitter so callers told the same value do not stampede
+            return retry_after + (random.uniform(0, self.base_delay) if self.jitter else 0)
+        return self.backoff(attempt)
+
+
+class ResilientInvoker:
+    """
+    Invoke a chat model with per-call retries, falling back through
+    `fallback_llms` when a model keeps failing with retryable errors.
+    Only the failing call is repeated; the rest of the graph run is kept.
+    """
+
+    def __init__(self, llm, fallback_llms=None, policy=None):
+        self.llms = [llm] + [fallback for fallback in (fallback_llms or []) if fallback is not None]
+        self.policy = policy or RetryPolicy.from_env()
+
+    def _should_fall_back(self, error, index):
+        return index + 1 < len(self.llms) and (is_rate_limit_error(error) or is_transient_error(error))
+
+    def _record_fallback(self, index, error):
+        source, target = _model_name(self.llms[index]), _model_name(self.llms[index + 1])
+        print(f"LLM call failed on {source} ({str(error)[:120]}), falling back to {target}")
+        FALLBACKS.inc(from_model=source, to_model=target)
+
+    def invoke(self, messages, **kwargs):
+        for index, llm in enumerate(self.llms):
+            attempt = 0
+            while True:
+                try:
+                    return llm.invoke(messages, **kwargs)
+                except Exception as e:
+                    delay = self.policy.next_delay(e, attempt)
+                    if delay is None:
+                        if self._should_fall_back(e, index):
+                            self._record_fallback(index, e)
+                            break
+                        raise
+                    LLM_RETRIES.inc(model=_model_name(llm))
+                    time.sleep(delay)
+                    attempt += 1
+
+    async def ainvoke(self, messages, **kwargs):
+        for index, llm in enumerate(self.llms):
+            attempt = 0
+            while True:
+                try:
+                    return await llm.ainvoke(messages, **kwargs)
+                except Exception as e:
+                    delay = self.policy.next_delay(e, attempt)
+                    if delay is None:
+                        if self._should_fall_back(e, index):
+                            self._record_fallback(index, e)
+                            break
+                        raise
+                    LLM_RETRIES.inc(model=_model_name(llm))
+                    await asyncio.sleep(delay)
+                    attempt += 1
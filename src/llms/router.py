@@ -0,0 +1,272 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from src.llms.retry import RetryPolicy, get_retry_after, is_rate_limit_error, is_transient_error
+from src.observability.metrics import LLM_RETRIES, ROUTER_DECISIONS, ROUTER_RATE_LIMITS, ROUTER_WAIT
+from src.transcripts.chunking import estimate_tokens
+
+## Groq free-tier quotas, only assumed when the router is enabled without GROQ_MODEL_ROUTES
+DEFAULT_ROUTES = [
+    {"model": "openai/gpt-oss-120b", "priority": 0, "rpm": 30, "tpm": 8000},
+    {"model": "llama-3.1-8b-instant", "priority": 1, "rpm": 30, "tpm": 6000},
+]
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `capacity` tokens, refilled continuously at
+    `capacity / period` tokens per second
+    """
+
+    def __init__(self, capacity, period=60.0):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount, now):
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount):
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta):
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+    def drain(self):
+        self.tokens = min(self.tokens, 0.0)
+
+
+class ModelRoute:
+    def __init__(self, model, priority=0, rpm=30, tpm=6000, period=60.0):
+        self.model = model
+        self.priority = priority
+        self.requests = TokenBucket(rpm, period)
+        self.tokens = TokenBucket(tpm, period)
+        self.cooldown_until = 0.0
+
+
+class ModelRouter:
+    """
+    Process-wide router that picks a model for each LLM call up front.
+    Each model has request-per-minute and token-per-minute budgets; a call
+    goes to the highest-priority model with budget left, so traffic spills
+    over to lower-priority models before the provider starts returning 429s.
+    A model that does return 429 cools down and is retried automatically
+    once the cooldown ends.
+    """
+
+    def __init__(self, routes, cooldown=60.0, expected_completion_tokens=800, max_wait=30.0):
+        if not routes:
+            raise ValueError("ModelRouter needs at least one route")
+        self.routes = sorted(
+            (route if isinstance(route, ModelRoute) else ModelRoute(**route) for route in routes),
+            key=lambda route: route.priority,
+        )
+        self.cooldown = cooldown
+        self.expected_completion_tokens = expected_completion_tokens
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """
+        GROQ_MODEL_ROUTES is a JSON list of {"model", "priority", "rpm", "tpm"}
+        with the quotas of the account's tier
+        """
+        routes = json.loads(os.getenv("GROQ_MODEL_ROUTES", "") or "null")
+        if not routes:
+            print("GROQ_MODEL_ROUTES is not set: routing with the Groq free-tier quotas")
+            routes = DEFAULT_ROUTES
+        return cls(
+            routes,
+            cooldown=float(os.getenv("MODEL_ROUTER_COOLDOWN", "60")),
+            expected_completion_tokens=int(os.getenv("MODEL_ROUTER_COMPLETION_TOKENS", "800")),
+            max_wait=float(os.getenv("MODEL_ROUTER_MAX_WAIT", "30")),
+        )
+
+    @property
+    def models(self):
+        return [route.model for route in self.routes]
+
+    def _route(self, model):
+        for route in self.routes:
+            if route.model == model:
+                return route
+        raise ValueError(f"Unknown model: {model}")
+
+    def estimate(self, messages):
+        return estimate_tokens(str(messages)) + self.expected_completion_tokens
+
+    def reserve(self, tokens):
+        """
+        Reserve budget for a call. Returns (model, 0) on success, or
+        (None, seconds) with the shortest wait until some model has room.
+        """
+        with self._lock:
+            now = time.monotonic()
+            shortest = float("inf")
+            for route in self.routes:
+                if route.cooldown_until > now:
+                    shortest = min(shortest, route.cooldown_until - now)
+                    continue
+                wait = max(route.requests.wait_time(1, now), route.tokens.wait_time(tokens, now))
+                if wait == 0:
+                    route.requests.consume(1)
+                    route.tokens.consume(tokens)
+                    ROUTER_DECISIONS.inc(model=route.model)
+                    return route.model, 0.0
+                shortest = min(shortest, wait)
+            return None, shortest
+
+    def record_usage(self, model, estimated, actual):
+        """
+        Correct a reservation once the real token count is known
+        """
+        if actual is None:
+            return
+        with self._lock:
+            self._route(model).tokens.adjust(actual - estimated)
+
+    def report_rate_limit(self, model, retry_after=None):
+        with self._lock:
+            route = self._route(model)
+            route.cooldown_until = time.monotonic() + (retry_after if retry_after is not None else self.cooldown)
+            route.requests.drain()
+            route.tokens.drain()
+
+    def status(self):
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "model": route.model,
+                    "priority": route.priority,
+                    "requests_available": round(route.requests.tokens, 2),
+                    "tokens_available": round(route.tokens.tokens, 1),
+                    "cooldown_remaining": round(max(0.0, route.cooldown_until - now), 2),
+                }
+                for route in self.routes
+            ]
+
+
+def _actual_tokens(response):
+    usage = getattr(response, "usage_metadata", None)
+    if usage:
+        return usage.get("total_tokens") or usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+    return None
+
+
+class RoutedInvoker:
+    """
+    Drop-in replacement for ResilientInvoker that asks a ModelRouter which
+    model to call, waits for budget when every model is saturated, and
+    reports 429s back to the router so later calls avoid that model.
+    """
+
+    def __init__(self, router, llm_for_model, policy=None):
+        self.router = router
+        self.llm_for_model = llm_for_model
+        self.policy = policy or RetryPolicy.from_env()
+        self.max_attempts = self.policy.max_attempts * len(router.routes)
+
+    def _no_capacity(self, wait):
+        return RuntimeError(
+            f"Rate limit: all models are saturated, next capacity in {wait:.1f}s"
+        )
+
+    def _handle_error(self, model, error, attempt):
+        """
+        Returns the delay before retrying, or raises when the error is final
+        """
+        if attempt + 1 >= self.max_attempts:
+            raise error
+        if is_rate_limit_error(error):
+            self.router.report_rate_limit(model, get_retry_after(error))
+            ROUTER_RATE_LIMITS.inc(model=model)
+            return 0.0
+        if is_transient_error(error):
+            LLM_RETRIES.inc(model=model)
+            return self.policy.backoff(attempt)
+        raise error
+
+    def invoke(self, messages, **kwargs):
+        estimated = self.router.estimate(messages)
+        waited = 0.0
+        attempt = 0
+        while True:
+            model, wait = self.router.reserve(estimated)
+            if model is None:
+                if waited + wait > self.router.max_wait:
+                    raise self._no_capacity(wait)
+                ROUTER_WAIT.observe(wait)
+                time.sleep(wait)
+                waited += wait
+                continue
+            try:
+                response = self.llm_for_model(model).invoke(messages, **kwargs)
+            except Exception as e:
+                delay = self._handle_error(model, e, attempt)
+                attempt += 1
+                if delay:
+                    time.sleep(delay)
+                continue
+            self.router.record_usage(model, estimated, _actual_tokens(response))
+            return response
+
+    async def ainvoke(self, messages, **kwargs):
+        estimated = self.router.estimate(messages)
+        waited = 0.0
+        attempt = 0
+        while True:
+            model, wait = self.router.reserve(estimated)
+            if model is None:
+                if waited + wait > self.router.max_wait:
+                    raise self._no_capacity(wait)
+                ROUTER_WAIT.observe(wait)
+                await asyncio.sleep(wait)
+                waited += wait
+                continue
+            try:
+                response = await self.llm_for_model(model).ainvoke(messages, **kwargs)
+            except Exception as e:
+                delay = self._handle_error(model, e, attempt)
+                attempt += 1
+                if delay:
+                    await asyncio.sleep(delay)
+                continue
+            self.router.record_usage(model, estimated, _actual_tokens(response))
+            return response
+
+
+def router_enabled(backend):
+    """
+    MODEL_ROUTER_ENABLED for an LLM backend. The budgets depend on the
+    account's tier, so by default the router is only on for Groq once
+    GROQ_MODEL_ROUTES configures them.
+    """
+    default = "true" if backend == "groq" and os.getenv("GROQ_MODEL_ROUTES") else "false"
+    return os.getenv("MODEL_ROUTER_ENABLED", default).lower() not in ("0", "false", "no")
+
+
+_default_router = None
+
+
+def get_model_router():
+    """
+    The router shared by every graph in this process
+    """
+    global _default_router
+    if _default_router is None:
+        _default_router = ModelRouter.from_env()
+    return _default_router
@@ -1,144 +1,392 @@
 from src.states.blogstate import BlogState
 from langchain_core.messages import SystemMessage, HumanMessage
-from src.states.blogstate import Blog
-import re
+from langchain_core.runnables.config import get_executor_for_config
+from langgraph.types import Send
+from src.transcripts.fetcher import get_transcript_fetcher
+from src.transcripts.store import TranscriptFetchError, get_transcript_store, is_blocked_error, is_negative_error
+from src.transcripts.chunking import ChunkingConfig, split_transcript
+from src.transcripts.normalizer import get_transcript_normalizer, iter_subtitle_lines
+from src.utils.markdown import split_markdown_sections, split_surrounding_whitespace
+from src.utils.blog_parser import parse_blog
+from src.nodes.translation_pipeline import TranslationPipeline
+from src.llms.retry import ResilientInvoker, is_rate_limit_error
+from src.observability.metrics import TRANSCRIPT_COMPRESSION
+import asyncio
+import os
+
+def extract_video_id(youtube_url: str):
+    """
+    Extract the video id from a youtube.com/watch or youtu.be URL, or None
+    """
+    if "youtube.com/watch?v=" in youtube_url:
+        return youtube_url.split("v=")[1].split("&")[0]
+    elif "youtu.be/" in youtube_url:
+        return youtube_url.split("youtu.be/")[1].split("?")[0]
+    return None
+
+class TranslationConfig:
+    """
+    Settings for section-parallel translation. With `pipeline`, a blog
+    generated in one streaming call is translated section by section while
+    it is still being written (see TranslationPipeline).
+    """
+
+    def __init__(self, max_concurrency=4, retries=2, split_sections=True, pipeline=True):
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.split_sections = split_sections
+        self.pipeline = pipeline
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_concurrency=int(os.getenv("TRANSLATION_CONCURRENCY", "4")),
+            retries=int(os.getenv("TRANSLATION_SECTION_RETRIES", "2")),
+            split_sections=os.getenv("TRANSLATION_SPLIT_SECTIONS", "true").lower() not in ("0", "false", "no"),
+            pipeline=os.getenv("TRANSLATION_PIPELINE", "true").lower() not in ("0", "false", "no"),
+        )
+
+class GenerationConfig:
+    """
+    Settings for base blog generation. In single-call mode the title and
+    content come from one LLM response (and the transcript is sent once);
+    otherwise they are generated by two parallel calls.
+    """
+
+    def __init__(self, single_call=True):
+        self.single_call = single_call
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            single_call=os.getenv("SINGLE_CALL_GENERATION", "true").lower() not in ("0", "false", "no"),
+        )
 
 class BlogNode:
     """
     A class to represent the blog node
     """
 
-    def __init__(self,llm):
+    def __init__(self,llm,transcript_store=None,transcript_fetcher=None,chunking_config=None,translation_config=None,fallback_llms=None,retry_policy=None,invoker=None,generation_config=None,transcript_normalizer=None):
         self.llm=llm
+        ## retries and model fallback happen per LLM call, so completed nodes are never redone
+        self.invoker=invoker or ResilientInvoker(llm, fallback_llms=fallback_llms, policy=retry_policy)
+        self.chunking_config=chunking_config or ChunkingConfig.from_env()
+        self.translation_config=translation_config or TranslationConfig.from_env()
+        self.generation_config=generation_config or GenerationConfig.from_env()
+        ## shared across nodes so a popular video is fetched once per process
+        self.transcript_store=transcript_store or get_transcript_store()
+        self.transcript_fetcher=transcript_fetcher or get_transcript_fetcher()
+        self.transcript_normalizer=transcript_normalizer or get_transcript_normalizer()
 
     
-    def title_creation(self,state:BlogState):
+    def _response_text(self, response):
         """
-        create the title for the blog
+        Safely extract text content from an LLM response
         """
+        if hasattr(response, 'content'):
+            return response.content
+        elif isinstance(response, str):
+            return response
+        return str(response)
 
-        if "topic" in state and state["topic"]:
-            prompt="""
+    def _invoke(self, messages):
+        return self.invoker.invoke(messages)
+
+    async def _ainvoke(self, messages, **kwargs):
+        return await self.invoker.ainvoke(messages, **kwargs)
+
+    def _run_many(self, func, items, max_concurrency=None):
+        """
+        Apply `func` to items concurrently in threads, returning results in order
+        """
+        with get_executor_for_config({"max_concurrency": max_concurrency}) as executor:
+            return list(executor.map(func, items))
+
+    async def _arun_many(self, afunc, items, max_concurrency=None):
+        """
+        Await `afunc` over items concurrently, at most `max_concurrency` at a time
+        """
+        if not max_concurrency:
+            return await asyncio.gather(*(afunc(item) for item in items))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(item):
+            async with semaphore:
+                return await afunc(item)
+
+        return await asyncio.gather(*(bounded(item) for item in items))
+
+    def _invoke_many(self, messages_list, max_concurrency=None):
+        """
+        Run independent LLM calls concurrently, returning responses in order
+        """
+        return self._run_many(self._invoke, messages_list, max_concurrency)
+
+    async def _ainvoke_many(self, messages_list, max_concurrency=None):
+        return await self._arun_many(self._ainvoke, messages_list, max_concurrency)
+
+    def _title_prompt(self, state: BlogState):
+        prompt="""
                    You are an expert blog content writer. Use Markdown formatting. Generate
                    a blog title for the {topic}. This title should be creative and SEO friendly.
                    Return only the title, nothing else.
 
                    """
-            
-            system_message=prompt.format(topic=state["topic"])
-            response=self.llm.invoke(system_message)
-            
-            # Safely extract content from response
-            title = None
-            if hasattr(response, 'content'):
-                title = response.content
-            elif isinstance(response, str):
-                title = response
-            else:
-                title = str(response)
-            
-            # Strip any markdown formatting that might be in the title
-            title = title.strip().strip('#').strip()
-            
-            return {"blog":{"title":title}}
-        
-    def content_generation(self,state:BlogState):
+        return prompt.format(topic=state["topic"])
+
+    def _title_update(self, response):
+        # Strip any markdown formatting that might be in the title
+        title = self._response_text(response).strip().strip('#').strip()
+        return {"blog":{"title":title}}
+
+    def title_creation(self,state:BlogState):
+        """
+        create the title for the blog
+        """
+
         if "topic" in state and state["topic"]:
-            system_prompt = """You are expert blog writer. Use Markdown formatting.
+            response=self._invoke(self._title_prompt(state))
+            return self._title_update(response)
+
+    async def atitle_creation(self, state: BlogState):
+        """
+        Async counterpart of title_creation
+        """
+        if "topic" in state and state["topic"]:
+            response = await self._ainvoke(self._title_prompt(state))
+            return self._title_update(response)
+
+    def _content_prompt(self, state: BlogState):
+        system_prompt = """You are expert blog writer. Use Markdown formatting.
             Generate a detailed blog content with detailed breakdown for the {topic}"""
-            system_message = system_prompt.format(topic=state["topic"])
-            response = self.llm.invoke(system_message)
-            
-            # Safely extract title from state
-            blog_title = None
-            if "blog" in state and state["blog"]:
-                if isinstance(state["blog"], dict):
-                    blog_title = state["blog"].get("title", "Untitled")
-                elif hasattr(state["blog"], "title"):
-                    blog_title = state["blog"].title
-                else:
-                    blog_title = "Untitled"
-            else:
-                blog_title = "Untitled"
-            
-            # Safely extract content from response
-            content = None
-            if hasattr(response, 'content'):
-                content = response.content
-            elif isinstance(response, str):
-                content = response
-            else:
-                content = str(response)
-            
-            return {"blog": {"title": blog_title, "content": content}}
-        
-    def translation(self,state:BlogState):
+        return system_prompt.format(topic=state["topic"])
+
+    def _content_update(self, response):
+        # The title is written by title_creation running in parallel;
+        # the `blog` reducer merges both partial updates.
+        return {"blog": {"content": self._response_text(response)}}
+
+    def content_generation(self,state:BlogState):
+        if "topic" in state and state["topic"]:
+            response = self._invoke(self._content_prompt(state))
+            return self._content_update(response)
+
+    async def acontent_generation(self, state: BlogState):
         """
-        Translate the content to the specified language.
+        Async counterpart of content_generation
         """
-        current_language = state.get("current_language", "english")
-        blog_content = state["blog"]["content"]
-        blog_title = state["blog"]["title"]
+        if "topic" in state and state["topic"]:
+            response = await self._ainvoke(self._content_prompt(state))
+            return self._content_update(response)
         
-        translation_prompt="""
-        Translate the following blog title and content into {current_language}.
-        - Maintain the original tone, style, and formatting.
-        - Adapt cultural references and idioms to be appropriate for {current_language}.
-        - Keep the Markdown formatting intact.
+    def _blog_prompt(self, state: BlogState):
+        prompt = """You are an expert blog writer. Use Markdown formatting.
+            Write a detailed blog post with a detailed breakdown for the {topic}.
+            - Put a creative, SEO friendly title on the first line as a single `# ` heading
+            - Follow it with the blog content, using `##` headings for its sections
+            - Return only the blog post, nothing else"""
+        return prompt.format(topic=state["topic"])
+
+    def _blog_update(self, response):
+        # title and content come from one response; malformed output is repaired, not regenerated
+        return {"blog": parse_blog(self._response_text(response)).model_dump()}
+
+    def _pipeline_languages(self, state: BlogState):
+        """
+        Languages to translate into while the blog streams: every entry of
+        `languages`, or current_language, except English
+        """
+        config = self.translation_config
+        if not (config.pipeline and config.split_sections):
+            return []
+        requested = state.get("languages") or [state.get("current_language", "english")]
+        return [language for language in dict.fromkeys(l.lower() for l in requested) if language != "english"]
+
+    async def _agenerate_pipelined(self, state: BlogState, messages):
+        """
+        Generate the blog from one streaming call, translating each section
+        as soon as it is complete. Returns the English `blog` plus
+        `translations`, so route skips the translation nodes for every
+        language that was translated (see TranslationPipeline.finish).
+        """
+        languages = self._pipeline_languages(state)
+        if not languages:
+            return self._blog_update(await self._ainvoke(messages))
+
+        pipeline = TranslationPipeline(self, languages)
+        try:
+            response = await self._ainvoke(messages, config=pipeline.config(), stream=True)
+            update = self._blog_update(response)
+            translations = await pipeline.finish(update["blog"])
+        except BaseException:
+            pipeline.cancel()
+            raise
+        return {**update, "translations": translations}
+
+    def blog_generation(self, state: BlogState):
+        """
+        Generate the title and content of the blog in a single LLM call
+        """
+        if "topic" in state and state["topic"]:
+            response = self._invoke(self._blog_prompt(state))
+            return self._blog_update(response)
+
+    async def ablog_generation(self, state: BlogState):
+        """
+        Async counterpart of blog_generation
+        """
+        if "topic" in state and state["topic"]:
+            return await self._agenerate_pipelined(state, self._blog_prompt(state))
+
+    def _title_translation_messages(self, title: str, current_language: str):
+        prompt = """
+        Translate the following blog title into {current_language}.
+        Keep it creative and SEO friendly. Return only the translated title, nothing else.
 
         BLOG TITLE:
         {blog_title}
+        """
+        return [HumanMessage(prompt.format(current_language=current_language, blog_title=title))]
 
-        ORIGINAL CONTENT:
-        {blog_content}
+    def _section_translation_messages(self, section: str, current_language: str):
+        prompt = """
+        Translate the following section of a Markdown blog post into {current_language}.
+        - Maintain the original tone, style, and formatting.
+        - Adapt cultural references and idioms to be appropriate for {current_language}.
+        - Keep the Markdown formatting intact (headings, lists, links, code blocks).
+        - Return only the translated section, nothing else.
 
-        Return both the translated title and content maintaining the same structure.
+        SECTION:
+        {section}
         """
-        # Translating to target language
-        messages=[
-            HumanMessage(translation_prompt.format(
-                current_language=current_language, 
-                blog_title=blog_title,
-                blog_content=blog_content
-            ))
-        ]
-        try:
-            # Try structured output first
-            translation_result = self.llm.with_structured_output(Blog).invoke(messages)
-            return {
-                "blog": {
-                    "title": translation_result.title,
-                    "content": translation_result.content
-                }
-            }
-        except Exception as e:
-            # Fallback to regular invoke if structured output fails
-            # Structured output failed, using regular invoke
-            response = self.llm.invoke(messages)
-            # Assume the response contains both title and content
-            return {
-                "blog": {
-                    "title": blog_title,  # Keep original title if translation fails
-                    "content": response.content if hasattr(response, 'content') else str(response)
-                }
-            }
+        return [HumanMessage(prompt.format(current_language=current_language, section=section))]
+
+    def _translation_jobs(self, state: BlogState):
+        """
+        Split the blog into independent translation requests: the title
+        plus one request per Markdown section of the content
+        """
+        current_language = state.get("current_language", "english")
+        blog = state["blog"]
+        sections = (
+            split_markdown_sections(blog["content"])
+            if self.translation_config.split_sections
+            else [blog["content"]]
+        )
+        jobs = [self._title_translation_messages(blog["title"], current_language)]
+        jobs.extend(
+            self._section_translation_messages(split_surrounding_whitespace(section)[1], current_language)
+            for section in sections
+        )
+        return sections, jobs
+
+    def _translation_update(self, sections, responses):
+        title = self._response_text(responses[0]).strip().strip('#').strip()
+        translated = []
+        for section, response in zip(sections, responses[1:]):
+            leading, body, trailing = split_surrounding_whitespace(section)
+            if not body:
+                translated.append(section)
+                continue
+            translated.append(leading + self._response_text(response).strip() + trailing)
+        return {"blog": {"title": title, "content": "".join(translated)}}
+
+    def _invoke_with_retries(self, messages):
+        attempts = self.translation_config.retries + 1
+        for attempt in range(attempts):
+            try:
+                return self._invoke(messages)
+            except Exception as e:
+                # rate limits were already retried (and fallen back) by the invoker
+                if attempt == attempts - 1 or is_rate_limit_error(e):
+                    raise
+                print(f"Section translation failed ({str(e)}), retrying {attempt + 1}/{attempts - 1}")
+
+    async def _ainvoke_with_retries(self, messages, **kwargs):
+        attempts = self.translation_config.retries + 1
+        for attempt in range(attempts):
+            try:
+                return await self._ainvoke(messages, **kwargs)
+            except Exception as e:
+                # rate limits were already retried (and fallen back) by the invoker
+                if attempt == attempts - 1 or is_rate_limit_error(e):
+                    raise
+                print(f"Section translation failed ({str(e)}), retrying {attempt + 1}/{attempts - 1}")
+
+    def translation(self,state:BlogState):
+        """
+        Translate the content to the specified language. The title and each
+        Markdown section are translated concurrently and reassembled in order;
+        a failed section is retried on its own.
+        """
+        sections, jobs = self._translation_jobs(state)
+        responses = self._run_many(
+            self._invoke_with_retries, jobs, max_concurrency=self.translation_config.max_concurrency
+        )
+        return self._translation_update(sections, responses)
+
+    async def atranslation(self, state: BlogState):
+        """
+        Async counterpart of translation
+        """
+        sections, jobs = self._translation_jobs(state)
+        responses = await self._arun_many(
+            self._ainvoke_with_retries, jobs, max_concurrency=self.translation_config.max_concurrency
+        )
+        return self._translation_update(sections, responses)
+
+    def language_translation(self, state: BlogState):
+        """
+        One branch of a multi-language fan-out: translate the base blog and
+        record it under its language without touching the shared `blog`
+        """
+        result = self.translation(state)
+        return {"translations": {state["current_language"]: result["blog"]}}
+
+    async def alanguage_translation(self, state: BlogState):
+        """
+        Async counterpart of language_translation
+        """
+        result = await self.atranslation(state)
+        return {"translations": {state["current_language"]: result["blog"]}}
 
     def route(self, state: BlogState):
         """
         Route function to pass language information for translation decision.
+        A blog translated while it was generated becomes the single-language result.
         """
         current_language = state.get("current_language", "english")
+        translated = (state.get("translations") or {}).get(current_language.lower())
+        if translated is not None and not state.get("languages"):
+            return {"current_language": current_language, "blog": translated}
         return {"current_language": current_language}
     
 
     def route_decision(self, state: BlogState):
         """
         Route the content to the respective translation function.
+        With a `languages` list, fan out one parallel translation per language.
+        Languages already translated during generation are skipped.
         """
         supported_languages = ["hindi", "french", "telugu", "tamil", "malayalam", "english", "japanese", "chinese"]
+        done = state.get("translations") or {}
+        if state.get("languages"):
+            targets = [
+                language for language in state["languages"]
+                if language.lower() != "english" and language.lower() not in done
+            ]
+            if not targets:
+                return "end"
+            return [
+                Send("language_translation", {"blog": state["blog"], "current_language": language.lower()})
+                for language in targets
+            ]
+
         language = state.get("current_language", "english").lower()
         
-        if language == "english":
+        if language == "english" or language in done:
             return "end"
         elif language in supported_languages:
             return "translate"
@@ -152,41 +400,71 @@ class BlogNode:
         youtube_url = state.get("youtube_url", "")
         if not youtube_url:
             raise ValueError("YouTube URL is required")
-        
+
+        # Extract video ID from URL
+        video_id = extract_video_id(youtube_url)
+        if not video_id:
+            raise ValueError("Invalid YouTube URL format")
+
+        transcript_text = self.transcript_store.get(video_id)
+        if transcript_text is not None:
+            print(f"[CACHE] Using stored transcript for video_id: {video_id}")
+            return {"transcript": transcript_text, "video_id": video_id}
+
+        cached_error = self.transcript_store.get_failure(video_id)
+        if cached_error is not None:
+            raise TranscriptFetchError(cached_error, permanent=True)
+
+        try:
+            caption_lines = self._fetch_transcript(youtube_url, video_id)
+        except TranscriptFetchError as e:
+            if e.permanent:
+                self.transcript_store.put_failure(video_id, str(e))
+            raise
+
+        # stored normalized, so every later generation sends the compact text
+        transcript_text = self._normalize_transcript(caption_lines, video_id)
+        self.transcript_store.put(video_id, transcript_text)
+        return {"transcript": transcript_text, "video_id": video_id}
+
+    def _normalize_transcript(self, caption_lines, video_id: str) -> str:
+        transcript_text, stats = self.transcript_normalizer.normalize(caption_lines)
+        TRANSCRIPT_COMPRESSION.observe(stats["compression_ratio"])
+        print(
+            f"[NORMALIZE] {video_id}: {stats['input_chars']} -> {stats['output_chars']} chars "
+            f"(ratio {stats['compression_ratio']:.2f}, {stats['output_tokens']} tokens"
+            f"{', truncated to budget' if stats['truncated'] else ''})"
+        )
+        return transcript_text
+
+    def _fetch_transcript(self, youtube_url: str, video_id: str):
+        """
+        Fetch caption lines over the network, trying youtube-transcript-api
+        first and yt-dlp second. Raises TranscriptFetchError when both fail,
+        marked permanent by the type of the youtube-transcript-api error.
+        """
         try:
-            # Extract video ID from URL
-            video_id = None
-            if "youtube.com/watch?v=" in youtube_url:
-                video_id = youtube_url.split("v=")[1].split("&")[0]
-            elif "youtu.be/" in youtube_url:
-                video_id = youtube_url.split("youtu.be/")[1].split("?")[0]
-            
-            if not video_id:
-                raise ValueError("Invalid YouTube URL format")
-            
             # Try youtube-transcript-api first (more reliable, simpler)
-            transcript_text = None
             yt_dlp_error = None
             ytt_error = None
+            ytt_exception = None
             
             # Method 1: Try youtube-transcript-api (simpler, less dependencies)
             print(f"[1/2] Attempting youtube-transcript-api for video_id: {video_id}")
             try:
-                from youtube_transcript_api import YouTubeTranscriptApi
-                ytt_api = YouTubeTranscriptApi()
-                transcript_list = ytt_api.get_transcript(video_id, languages=['en', 'en-US', 'en-GB'])
-                transcript_text = " ".join([item['text'] for item in transcript_list])
-                print(f"[SUCCESS] Got transcript via youtube-transcript-api, length: {len(transcript_text)}")
-                return {"transcript": transcript_text, "video_id": video_id}
+                caption_lines = self.transcript_fetcher.fetch_transcript_lines(video_id)
+                print(f"[SUCCESS] Got transcript via youtube-transcript-api, {len(caption_lines)} captions")
+                return caption_lines
             except Exception as e:
                 ytt_error = str(e)
+                ytt_exception = e
                 print(f"[FAILED] youtube-transcript-api error: {ytt_error}")
                 import traceback
                 print(f"youtube-transcript-api traceback: {traceback.format_exc()}")
             
             # Method 2: Fallback to yt-dlp (but skip if bot detection expected)
             # Skip yt-dlp if youtube-transcript-api failed due to IP blocking - same issue will occur
-            if ytt_error and ("blocking" in ytt_error.lower() or "ip" in ytt_error.lower() or "cloud" in ytt_error.lower()):
+            if is_blocked_error(ytt_exception):
                 print("[SKIP] Skipping yt-dlp due to IP blocking (same issue will occur)")
                 yt_dlp_error = "Skipped (IP blocking detected from previous method)"
             else:
@@ -229,17 +507,15 @@ class BlogNode:
                                 sub_url = en_subs[0].get('url', '')
                                 if sub_url:
                                     print(f"Downloading subtitle from URL: {sub_url[:50]}...")
-                                    # Download subtitle content
-                                    import urllib.request
-                                    sub_response = urllib.request.urlopen(sub_url, timeout=10)
-                                    sub_data = sub_response.read().decode('utf-8')
+                                    # Download subtitle content over the shared session
+                                    sub_data = self.transcript_fetcher.fetch_subtitle(sub_url)
                                     
-                                    # Parse subtitle format
-                                    transcript_text = self._parse_subtitle(sub_data)
-                                    print(f"[SUCCESS] Got transcript via yt-dlp, length: {len(transcript_text)}")
-                                    return {"transcript": transcript_text, "video_id": video_id}
+                                    # caption lines are parsed lazily while the normalizer consumes them
+                                    print(f"[SUCCESS] Got subtitles via yt-dlp, length: {len(sub_data)}")
+                                    return iter_subtitle_lines(sub_data)
                         else:
-                            print("No subtitles found in video info")
+                            yt_dlp_error = "No subtitles found in video info"
+                            print(yt_dlp_error)
                             
                 except ImportError as e:
                     yt_dlp_error = f"yt-dlp not installed: {str(e)}"
@@ -259,11 +535,11 @@ class BlogNode:
                 error_details.append(f"yt-dlp: {yt_dlp_error}")
             
             error_msg = "Failed to extract transcript. "
-            if "blocking requests" in str(ytt_error).lower() or "ip" in str(ytt_error).lower():
+            if is_blocked_error(ytt_exception):
                 error_msg += "YouTube is blocking requests from this IP (cloud provider). "
             error_msg += "Methods attempted: " + "; ".join(error_details) if error_details else "No methods available"
             
-            raise ValueError(error_msg)
+            raise TranscriptFetchError(error_msg, permanent=is_negative_error(ytt_exception))
                 
         except ValueError:
             raise
@@ -274,34 +550,49 @@ class BlogNode:
             else:
                 raise ValueError(f"Failed to extract transcript: {str(e)}")
     
-    def _parse_subtitle(self, subtitle_data: str) -> str:
-        """Parse VTT or SRT subtitle format and extract text."""
-        lines = subtitle_data.split('\n')
-        transcript_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            # Skip VTT/SRT timestamps and formatting
-            if not line or line.startswith('WEBVTT') or line.startswith('Kind:') or '-->' in line:
-                continue
-            # Skip sequence numbers in SRT
-            if line.isdigit():
-                continue
-            # Remove HTML tags if present
-            line = re.sub(r'<[^>]+>', '', line)
-            if line:
-                transcript_lines.append(line)
-        
-        return " ".join(transcript_lines)
-    
-    def generate_blog_from_transcript(self, state: BlogState):
+    async def aextract_youtube_transcript(self, state: BlogState):
         """
-        Generate blog title and content from YouTube transcript.
+        Async counterpart of extract_youtube_transcript. The fetch uses blocking
+        HTTP clients, so it runs in a worker thread to keep the event loop free.
         """
+        return await asyncio.to_thread(self.extract_youtube_transcript, state)
+
+    def _require_transcript(self, state: BlogState):
         transcript = state.get("transcript", "")
         if not transcript:
             raise ValueError("Transcript is required")
-        
+        return transcript
+
+    def _chunk_summary_prompts(self, transcript: str):
+        """
+        Map step: one summary prompt per overlapping transcript chunk
+        """
+        config = self.chunking_config
+        chunks = split_transcript(transcript, config.chunk_tokens, config.overlap_tokens)
+        summary_prompt = """You are an expert note taker.
+        Summarize part {index} of {total} of a YouTube video transcript.
+        - Keep every key point, fact, example and number
+        - Preserve the order in which topics are discussed
+        - Use concise Markdown bullet points
+
+        TRANSCRIPT PART {index}/{total}:
+        {chunk}
+        """
+        return [
+            summary_prompt.format(index=i + 1, total=len(chunks), chunk=chunk)
+            for i, chunk in enumerate(chunks)
+        ]
+
+    def _join_summaries(self, summary_responses):
+        """
+        Reduce step input: the ordered chunk summaries stand in for the transcript
+        """
+        return "\n\n".join(
+            f"PART {i + 1}:\n{self._response_text(response).strip()}"
+            for i, response in enumerate(summary_responses)
+        )
+
+    def _transcript_prompts(self, transcript: str):
         # Generate title from transcript
         title_prompt = """
         You are an expert blog content writer. Use Markdown formatting.
@@ -313,19 +604,6 @@ class BlogNode:
         Generate only the title, nothing else.
         """
         
-        title_message = title_prompt.format(transcript=transcript[:2000])
-        title_response = self.llm.invoke(title_message)
-        
-        # Extract title safely
-        title = None
-        if hasattr(title_response, 'content'):
-            title = title_response.content
-        elif isinstance(title_response, str):
-            title = title_response
-        else:
-            title = str(title_response)
-        title = title.strip().strip('#').strip()
-        
         # Generate blog content from transcript
         content_prompt = """You are an expert blog writer. Use Markdown formatting.
         Based on the following YouTube video transcript, generate a detailed, well-structured blog post.
@@ -338,21 +616,70 @@ class BlogNode:
         {transcript}
         """
         
+        title_message = title_prompt.format(transcript=transcript[:2000])
         content_message = content_prompt.format(transcript=transcript)
-        content_response = self.llm.invoke(content_message)
-        
-        # Extract content safely
-        content = None
-        if hasattr(content_response, 'content'):
-            content = content_response.content
-        elif isinstance(content_response, str):
-            content = content_response
-        else:
-            content = str(content_response)
-        
+        return title_message, content_message
+
+    def _transcript_blog_prompt(self, transcript: str):
+        prompt = """You are an expert blog writer. Use Markdown formatting.
+        Based on the following YouTube video transcript, write a detailed, well-structured blog post.
+        - Put a creative, SEO-friendly title on the first line as a single `# ` heading
+        - Follow it with engaging content using `##` headings, subheadings, and formatting
+        - Summarize key points from the transcript
+        - Make it readable and informative
+        - Return only the blog post, nothing else
+
+        TRANSCRIPT:
+        {transcript}
+        """
+        return prompt.format(transcript=transcript)
+
+    def _transcript_blog_update(self, title_response, content_response):
+        title = self._response_text(title_response).strip().strip('#').strip()
         return {
             "blog": {
                 "title": title,
-                "content": content
+                "content": self._response_text(content_response)
             }
-        }
\ No newline at end of file
+        }
+
+    def generate_blog_from_transcript(self, state: BlogState):
+        """
+        Generate blog title and content from YouTube transcript, in one call
+        unless single-call generation is off. Long transcripts are first
+        condensed by summarizing chunks concurrently.
+        """
+        transcript = self._require_transcript(state)
+        if self.chunking_config.should_chunk(transcript):
+            summaries = self._invoke_many(
+                self._chunk_summary_prompts(transcript),
+                max_concurrency=self.chunking_config.max_concurrency,
+            )
+            transcript = self._join_summaries(summaries)
+
+        if self.generation_config.single_call:
+            return self._blog_update(self._invoke(self._transcript_blog_prompt(transcript)))
+
+        title_message, content_message = self._transcript_prompts(transcript)
+        # Title and content prompts are independent, so run them concurrently
+        title_response, content_response = self._invoke_many([title_message, content_message])
+        return self._transcript_blog_update(title_response, content_response)
+
+    async def agenerate_blog_from_transcript(self, state: BlogState):
+        """
+        Async counterpart of generate_blog_from_transcript
+        """
+        transcript = self._require_transcript(state)
+        if self.chunking_config.should_chunk(transcript):
+            summaries = await self._ainvoke_many(
+                self._chunk_summary_prompts(transcript),
+                max_concurrency=self.chunking_config.max_concurrency,
+            )
+            transcript = self._join_summaries(summaries)
+
+        if self.generation_config.single_call:
+            return await self._agenerate_pipelined(state, self._transcript_blog_prompt(transcript))
+
+        title_message, content_message = self._transcript_prompts(transcript)
+        title_response, content_response = await self._ainvoke_many([title_message, content_message])
+        return self._transcript_blog_update(title_response, content_response)
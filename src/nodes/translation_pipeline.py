@@ -0,0 +1,187 @@
+import asyncio
+import contextvars
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.runnables.config import ensure_config
+from langgraph.config import get_stream_writer
+from langgraph.constants import TAG_NOSTREAM
+from src.utils.markdown import MarkdownSectionStream, split_markdown_sections, split_surrounding_whitespace
+
+## translation calls run inside the generation node; keep their tokens out of its token stream
+_TRANSLATION_CONFIG = {"tags": [TAG_NOSTREAM]}
+
+
+class _SectionStreamHandler(AsyncCallbackHandler):
+    """
+    Feeds the tokens of the generation call into a TranslationPipeline
+    """
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+
+    async def on_chat_model_start(self, serialized, messages, **kwargs):
+        # a retry or fallback streams the response again from the start
+        self.pipeline.restart()
+
+    async def on_llm_new_token(self, token, **kwargs):
+        self.pipeline.feed(token)
+
+
+class TranslationPipeline:
+    """
+    Translate a blog while it is still being generated.
+
+    Attach `config()` to the streaming generation call: every Markdown
+    section (and the `# ` title line) is sent to translation into each
+    language as soon as the next heading starts. `finish(blog)` then
+    translates whatever the stream did not cover, reusing the translations
+    whose source text matches the final parsed blog, and assembles them in
+    order. Completed sections are also emitted in order as
+    `translated_section` custom stream events. When the generation call is
+    retried, a `generation_restarted` event tells clients to drop the
+    node's tokens so far; sections already emitted are not sent again.
+    """
+
+    def __init__(self, node, languages):
+        self.node = node
+        self.languages = languages
+        self._semaphore = asyncio.Semaphore(node.translation_config.max_concurrency or 1_000_000)
+        ## captured inside the node, so translation tasks and callbacks belong to its run
+        self._context = contextvars.copy_context()
+        config = ensure_config()
+        self._callbacks = config.get("callbacks")
+        self._node = config.get("metadata", {}).get("langgraph_node")
+        try:
+            self._writer = get_stream_writer()
+        except RuntimeError:
+            # called outside a graph run
+            self._writer = lambda event: None
+        self._tasks = {}
+        self._emitted = dict.fromkeys(self.languages, 0)
+        self._attempts = 0
+        self._reset()
+
+    def config(self):
+        """
+        Callbacks for the generation call: the node's own (metrics, graph
+        streaming) plus the handler that feeds this pipeline
+        """
+        callbacks = self._callbacks
+        handler = _SectionStreamHandler(self)
+        if callbacks is None:
+            callbacks = [handler]
+        elif isinstance(callbacks, list):
+            callbacks = callbacks + [handler]
+        else:
+            callbacks = callbacks.copy()
+            callbacks.add_handler(handler, inherit=False)
+        return {"callbacks": callbacks}
+
+    def restart(self):
+        """
+        A (new) attempt of the generation call starts streaming
+        """
+        if self._attempts:
+            self._writer({"event": "generation_restarted", "node": self._node, "attempt": self._attempts + 1})
+        self._attempts += 1
+        self._reset()
+
+    def _reset(self):
+        self._splitter = MarkdownSectionStream()
+        self._streamed = []
+
+    def feed(self, token):
+        for section in self._splitter.feed(token):
+            self._start(section)
+
+    def _start(self, section):
+        leading, body, trailing = split_surrounding_whitespace(section)
+        kind, text = "section", body
+        if not any(item[1] for item in self._streamed) and body.startswith("# ") and "\n" not in body:
+            kind, text = "title", body.strip("#").strip().strip("*").strip()
+        self._streamed.append((kind, text, leading, trailing))
+        if text:
+            for language in self.languages:
+                self._translate(kind, text, language)
+
+    def _translate(self, kind, text, language):
+        key = (kind, text, language)
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(kind, text, language), context=self._context)
+            task.add_done_callback(self._on_done)
+            self._tasks[key] = task
+        return task
+
+    async def _run(self, kind, text, language):
+        if kind == "title":
+            messages = self.node._title_translation_messages(text, language)
+        else:
+            messages = self.node._section_translation_messages(text, language)
+        async with self._semaphore:
+            response = await self.node._ainvoke_with_retries(messages, config=_TRANSLATION_CONFIG)
+        return self.node._response_text(response).strip()
+
+    def _on_done(self, task):
+        if not task.cancelled():
+            # retrieved here, so a failed task nobody awaits is not logged as never retrieved
+            task.exception()
+        self._emit_ready()
+
+    def _emit_ready(self):
+        for language in self.languages:
+            index = self._emitted[language]
+            while index < len(self._streamed):
+                kind, text, leading, trailing = self._streamed[index]
+                if text:
+                    task = self._tasks.get((kind, text, language))
+                    if task is None or not task.done() or task.cancelled() or task.exception() is not None:
+                        break
+                    translated = task.result()
+                    content = leading + (f"# {translated}" if kind == "title" else translated) + trailing
+                    self._writer({"event": "translated_section", "language": language, "index": index, "content": content})
+                index += 1
+            self._emitted[language] = index
+
+    def cancel(self):
+        for task in self._tasks.values():
+            task.cancel()
+
+    async def finish(self, blog: dict):
+        """
+        Wait for the translations of the final `blog` and return
+        {language: translated blog}. A language with a section that still
+        failed after its retries is left out, so the graph's translation
+        node translates it again while the English blog is kept.
+        """
+        for section in self._splitter.close():
+            self._start(section)
+        sections = split_markdown_sections(blog["content"])
+        bodies = [split_surrounding_whitespace(section)[1] for section in sections]
+
+        needed = {}
+        for language in self.languages:
+            needed[language] = [self._translate("title", blog["title"], language)] + [
+                self._translate("section", body, language) if body else None for body in bodies
+            ]
+        wanted = {task for tasks in needed.values() for task in tasks if task is not None}
+        unwanted = [task for task in self._tasks.values() if task not in wanted]
+        for task in unwanted:
+            task.cancel()
+        await asyncio.gather(*unwanted, return_exceptions=True)
+
+        try:
+            await asyncio.gather(*wanted, return_exceptions=True)
+        except BaseException:
+            self.cancel()
+            raise
+
+        translations = {}
+        for language, tasks in needed.items():
+            failed = [task for task in tasks if task is not None and (task.cancelled() or task.exception() is not None)]
+            if failed:
+                error = "cancelled" if failed[0].cancelled() else str(failed[0].exception())
+                print(f"Pipelined {language} translation failed ({error}), leaving it to the translation node")
+                continue
+            responses = [task.result() if task is not None else "" for task in tasks]
+            translations[language] = self.node._translation_update(sections, responses)["blog"]
+        return translations
@@ -0,0 +1,94 @@
+import time
+from contextvars import ContextVar
+from langchain_core.callbacks import BaseCallbackHandler
+from src.observability.metrics import LLM_CALLS, LLM_COST, LLM_TOKENS, NODE_DURATION, NODE_ERRORS
+from src.observability.pricing import get_price_table
+
+## per-request {node: seconds} map, filled by MetricsCallbackHandler
+request_timings: ContextVar = ContextVar("request_timings", default=None)
+
+
+def _is_node_run(name, tags, metadata):
+    """
+    LangGraph tags the run of each node with "graph:step:N"; child runs
+    inside the node carry the same langgraph_node metadata but other tags
+    """
+    node = (metadata or {}).get("langgraph_node")
+    return node is not None and name == node and any(
+        tag.startswith("graph:step:") for tag in (tags or [])
+    )
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback that records node wall time and LLM token usage
+    for every graph run it is attached to, without touching the nodes.
+    """
+
+    ## bookkeeping is cheap, so skip the executor hop for async runs
+    run_inline = True
+
+    def __init__(self, timings=None):
+        self.timings = timings if timings is not None else request_timings.get()
+        self._node_starts = {}
+        self._llm_models = {}
+        ## models that answered at least one call of the run
+        self.models = set()
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        if _is_node_run(kwargs.get("name"), tags, metadata):
+            self._node_starts[run_id] = (metadata["langgraph_node"], time.perf_counter())
+
+    def _finish_node(self, run_id, failed=False):
+        started = self._node_starts.pop(run_id, None)
+        if started is None:
+            return
+        node, start = started
+        elapsed = time.perf_counter() - start
+        NODE_DURATION.observe(elapsed, node=node)
+        if failed:
+            NODE_ERRORS.inc(node=node)
+        if self.timings is not None:
+            self.timings[node] = self.timings.get(node, 0.0) + elapsed
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._finish_node(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._finish_node(run_id, failed=True)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+        params = kwargs.get("invocation_params") or {}
+        model = (
+            (metadata or {}).get("ls_model_name")
+            or params.get("model_name")
+            or params.get("model")
+            or params.get("_type", "unknown")
+        )
+        self._llm_models[run_id] = model
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        model = self._llm_models.pop(run_id, "unknown")
+        self.models.add(model)
+        LLM_CALLS.inc(model=model)
+        input_tokens, output_tokens = 0, 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    input_tokens += usage.get("input_tokens", 0)
+                    output_tokens += usage.get("output_tokens", 0)
+        if not (input_tokens or output_tokens) and response.llm_output:
+            usage = response.llm_output.get("token_usage") or {}
+            input_tokens = usage.get("prompt_tokens", 0)
+            output_tokens = usage.get("completion_tokens", 0)
+        if input_tokens:
+            LLM_TOKENS.inc(input_tokens, model=model, kind="prompt")
+        if output_tokens:
+            LLM_TOKENS.inc(output_tokens, model=model, kind="completion")
+        cost = get_price_table().cost(model, input_tokens, output_tokens)
+        if cost:
+            LLM_COST.inc(cost, model=model)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._llm_models.pop(run_id, None)
@@ -0,0 +1,226 @@
+import threading
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _format_labels(labelnames, labelvalues, extra=None):
+    pairs = list(zip(labelnames, labelvalues))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = (
+        f'{name}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labelvalues, value in items:
+            lines.extend(self._render_sample(labelvalues, value))
+        return lines
+
+    def _render_sample(self, labelvalues, value):
+        return [f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+                self._values[key] = state
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][i] += 1
+            state["sum"] += value
+            state["count"] += 1
+
+    def _render_sample(self, labelvalues, state):
+        lines = []
+        for bound, count in zip(self.buckets, state["counts"]):
+            labels = _format_labels(self.labelnames, labelvalues, ("le", _format_value(bound)))
+            lines.append(f"{self.name}_bucket{labels} {count}")
+        labels = _format_labels(self.labelnames, labelvalues)
+        lines.append(f"{self.name}_sum{labels} {_format_value(state['sum'])}")
+        lines.append(f"{self.name}_count{labels} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Minimal Prometheus text-format registry. Collectors are callables run
+    at scrape time to refresh metrics owned by other components.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector):
+        self._collectors.append(collector)
+
+    def render(self):
+        for collector in self._collectors:
+            collector()
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+## process-wide registry and the metrics exported at /metrics
+metrics = MetricsRegistry()
+
+NODE_DURATION = metrics.histogram(
+    "blog_node_duration_seconds", "Wall time spent in each graph node", ["node"]
+)
+NODE_ERRORS = metrics.counter(
+    "blog_node_errors_total", "Graph node executions that raised", ["node"]
+)
+LLM_TOKENS = metrics.counter(
+    "blog_llm_tokens_total", "LLM tokens used, by model and kind", ["model", "kind"]
+)
+LLM_COST = metrics.counter(
+    "blog_llm_cost_usd_total", "Estimated LLM spend in US dollars from token usage and LLM_PRICES", ["model"]
+)
+LLM_CALLS = metrics.counter(
+    "blog_llm_calls_total", "LLM calls made, by model", ["model"]
+)
+FALLBACKS = metrics.counter(
+    "blog_fallback_total", "LLM calls that moved on to a fallback model", ["from_model", "to_model"]
+)
+LLM_RETRIES = metrics.counter(
+    "blog_llm_retries_total", "LLM call retries after rate limits or transient errors", ["model"]
+)
+ROUTER_DECISIONS = metrics.counter(
+    "blog_router_decisions_total", "LLM calls routed to each model", ["model"]
+)
+ROUTER_RATE_LIMITS = metrics.counter(
+    "blog_router_rate_limits_total", "429 responses reported back to the model router", ["model"]
+)
+ROUTER_WAIT = metrics.histogram(
+    "blog_router_wait_seconds", "Time calls waited for model budget", buckets=(0.1, 0.5, 1, 2, 5, 10, 30)
+)
+ROUTER_BUDGET = metrics.gauge(
+    "blog_router_budget_available", "Remaining per-minute budget by model and kind", ["model", "kind"]
+)
+REQUESTS_IN_FLIGHT = metrics.gauge(
+    "blog_requests_in_flight", "HTTP requests currently being served", ["path"]
+)
+REQUEST_DURATION = metrics.histogram(
+    "blog_request_duration_seconds", "HTTP request wall time", ["path", "status"]
+)
+CACHE_REQUESTS = metrics.counter(
+    "blog_cache_requests_total", "Response cache lookups by result", ["result"]
+)
+CACHE_HIT_RATIO = metrics.gauge(
+    "blog_cache_hit_ratio", "Response cache hit ratio since start"
+)
+COALESCED_REQUESTS = metrics.counter(
+    "blog_coalesced_requests_total", "Requests that started (leader) or joined (follower) an execution", ["kind", "role"]
+)
+COALESCING_RATIO = metrics.gauge(
+    "blog_coalescing_ratio", "Share of requests served by joining an identical in-flight execution"
+)
+NEAR_DUPLICATE_TOPICS = metrics.counter(
+    "blog_near_duplicate_topics_total", "Topic requests served from the cached blog of a similar topic"
+)
+TRANSCRIPT_COMPRESSION = metrics.histogram(
+    "blog_transcript_compression_ratio", "Normalized transcript size as a share of the raw captions",
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+ADMISSION_DECISIONS = metrics.counter(
+    "blog_admission_decisions_total", "Admission decisions for graph endpoints", ["usecase", "result"]
+)
+ADMISSION_WAIT = metrics.histogram(
+    "blog_admission_wait_seconds", "Time admitted requests spent queued", ["usecase"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+ADMISSION_SLOTS = metrics.gauge(
+    "blog_admission_requests", "Requests running or waiting for a slot, per usecase", ["usecase", "state"]
+)
+BLOG_STORE_READS = metrics.counter(
+    "blog_store_reads_total", "GET /blogs/{id} reads by format and result (hit, not_modified, miss)", ["format", "result"]
+)
+JOBS = metrics.gauge(
+    "blog_jobs", "Background jobs by status", ["status"]
+)
@@ -0,0 +1,44 @@
+import json
+import os
+
+## USD per million (prompt, completion) tokens; Groq list prices, override with LLM_PRICES
+DEFAULT_PRICES = {
+    "openai/gpt-oss-120b": (0.15, 0.75),
+    "openai/gpt-oss-20b": (0.10, 0.50),
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+}
+
+
+class PriceTable:
+    """
+    Per-model token prices used to turn token usage into an estimated cost.
+    Models without a price cost nothing, so unknown or local models never
+    inflate the estimate.
+    """
+
+    def __init__(self, prices=None):
+        self.prices = dict(DEFAULT_PRICES if prices is None else prices)
+
+    @classmethod
+    def from_env(cls):
+        """
+        LLM_PRICES is a JSON object of {"model": [prompt, completion]} in USD
+        per million tokens, merged over the defaults
+        """
+        overrides = json.loads(os.getenv("LLM_PRICES", "") or "{}")
+        return cls({**DEFAULT_PRICES, **{model: tuple(price) for model, price in overrides.items()}})
+
+    def cost(self, model, prompt_tokens, completion_tokens):
+        prompt_price, completion_price = self.prices.get(model, (0.0, 0.0))
+        return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+_default_prices = None
+
+
+def get_price_table():
+    global _default_prices
+    if _default_prices is None:
+        _default_prices = PriceTable.from_env()
+    return _default_prices
@@ -1,14 +1,38 @@
-from typing import TypedDict, Optional
+from typing import Annotated, TypedDict, Optional
 from pydantic import BaseModel,Field
 
 class Blog(BaseModel):
     title:str=Field(description="the title of the blog post")
     content:str=Field(description="The main content of the blog post")
 
+def merge_blog(left, right):
+    """
+    Reducer for the `blog` channel: merge the partial blog dicts written by
+    nodes that run in parallel (e.g. title and content generation).
+    """
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if isinstance(left, BaseModel):
+        left = left.model_dump()
+    if isinstance(right, BaseModel):
+        right = right.model_dump()
+    return {**left, **right}
+
+def merge_translations(left, right):
+    """
+    Reducer for the `translations` channel: combine the {language: blog}
+    maps written by parallel language_translation branches.
+    """
+    return {**(left or {}), **(right or {})}
+
 class BlogState(TypedDict, total=False):
     topic:str
-    blog:Blog
+    blog:Annotated[Blog, merge_blog]
     current_language:str
+    languages:list[str]
+    translations:Annotated[dict[str, Blog], merge_translations]
     youtube_url:str
     transcript:str
     video_id:str
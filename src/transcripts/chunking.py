@@ -0,0 +1,69 @@
+import math
+import os
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate (~4 characters per token for English text)
+    """
+    return math.ceil(len(text) / 4)
+
+
+def _word_tokens(word: str) -> int:
+    # each word also carries the separating space
+    return max(1, math.ceil((len(word) + 1) / 4))
+
+
+class ChunkingConfig:
+    """
+    Settings for map-reduce summarization of long transcripts
+    """
+
+    def __init__(self, chunk_tokens=3000, overlap_tokens=200, max_concurrency=4, threshold_tokens=6000):
+        if overlap_tokens >= chunk_tokens:
+            raise ValueError("overlap_tokens must be smaller than chunk_tokens")
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.max_concurrency = max_concurrency
+        self.threshold_tokens = threshold_tokens
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            chunk_tokens=int(os.getenv("TRANSCRIPT_CHUNK_TOKENS", "3000")),
+            overlap_tokens=int(os.getenv("TRANSCRIPT_CHUNK_OVERLAP", "200")),
+            max_concurrency=int(os.getenv("TRANSCRIPT_MAP_CONCURRENCY", "4")),
+            threshold_tokens=int(os.getenv("TRANSCRIPT_CHUNK_THRESHOLD", "6000")),
+        )
+
+    def should_chunk(self, transcript: str) -> bool:
+        return estimate_tokens(transcript) > self.threshold_tokens
+
+
+def split_transcript(transcript: str, chunk_tokens: int, overlap_tokens: int):
+    """
+    Split a transcript on word boundaries into chunks of at most
+    `chunk_tokens` estimated tokens, each starting with the last
+    `overlap_tokens` of the previous chunk so no point is cut in half.
+    """
+    words = transcript.split()
+    chunks = []
+    start = 0
+    while start < len(words):
+        end = start
+        size = 0
+        while end < len(words) and (size + _word_tokens(words[end]) <= chunk_tokens or end == start):
+            size += _word_tokens(words[end])
+            end += 1
+        chunks.append(" ".join(words[start:end]))
+        if end >= len(words):
+            break
+
+        # step back from the chunk end to cover the overlap
+        next_start = end
+        overlap = 0
+        while next_start > start + 1 and overlap + _word_tokens(words[next_start - 1]) <= overlap_tokens:
+            next_start -= 1
+            overlap += _word_tokens(words[next_start])
+        start = next_start
+    return chunks
@@ -0,0 +1,81 @@
+import os
+import threading
+
+TRANSCRIPT_LANGUAGES = ['en', 'en-US', 'en-GB']
+
+
+class TranscriptFetcher:
+    """
+    Network side of transcript extraction. Every request goes through one
+    shared requests.Session, so connections to YouTube (and to subtitle
+    hosts) are pooled and reused across fetches.
+    """
+
+    def __init__(self, session=None, timeout=10, pool_size=16):
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._session = session
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            timeout=float(os.getenv("TRANSCRIPT_FETCH_TIMEOUT", "10")),
+            pool_size=int(os.getenv("TRANSCRIPT_FETCH_POOL_SIZE", "16")),
+        )
+
+    @property
+    def session(self):
+        """
+        The shared session, created on the first fetch so importing and
+        constructing the fetcher stays cheap
+        """
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session(self.pool_size)
+        return self._session
+
+    def _build_session(self, pool_size):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["User-Agent"] = (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        )
+        return session
+
+    def fetch_transcript_lines(self, video_id):
+        """
+        Fetch captions with youtube-transcript-api as a list of caption lines
+        """
+        from youtube_transcript_api import YouTubeTranscriptApi
+        ytt_api = YouTubeTranscriptApi(http_client=self.session)
+        transcript = ytt_api.fetch(video_id, languages=TRANSCRIPT_LANGUAGES)
+        return [line for item in transcript.to_raw_data() for line in item['text'].splitlines()]
+
+    def fetch_subtitle(self, url):
+        """
+        Download a VTT/SRT subtitle file
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        response.encoding = response.encoding or 'utf-8'
+        return response.text
+
+
+_default_fetcher = None
+
+
+def get_transcript_fetcher():
+    """
+    Process-wide fetcher whose connection pool is shared by every BlogNode
+    """
+    global _default_fetcher
+    if _default_fetcher is None:
+        _default_fetcher = TranscriptFetcher.from_env()
+    return _default_fetcher
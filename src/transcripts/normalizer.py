@@ -0,0 +1,169 @@
+import html
+import io
+import os
+import re
+from src.transcripts.chunking import estimate_tokens
+
+## [Music], [Applause], (laughs), ♪ ... and ">>" speaker-change markers
+_NOISE_RE = re.compile(
+    r"\[[^\]]*\]|\((?:laugh|applause|music|inaudible|crosstalk|silence|cough)[^)]*\)|[♪♫]+|>>+",
+    re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]*>")
+_TIMESTAMP_MARK = "-->"
+## standalone hesitation words (with any trailing punctuation)
+_FILLER_RE = re.compile(r"(?<!\S)(?:u+m+|u+h+|uhm|erm|er|ah|h+m+|m+h?m+)[,.!?;:]*(?!\S)", re.IGNORECASE)
+## how far back a caption may overlap the text already emitted (rolling auto-captions repeat 1-2 lines)
+OVERLAP_WINDOW_WORDS = 48
+## about two and a half hours of speech; longer talks are cut here before map-reduce summarization
+DEFAULT_MAX_TOKENS = 32000
+## the encoding of the gpt-oss models served by Groq
+DEFAULT_ENCODING = "o200k_base"
+
+
+def _tiktoken_counter(encoding_name):
+    try:
+        import tiktoken
+    except ImportError:
+        print("tiktoken is not installed: transcript tokens are estimated")
+        return None
+    try:
+        encoding = tiktoken.get_encoding(encoding_name)
+    except Exception as e:
+        # the encoding file is downloaded on first use
+        print(f"Could not load the {encoding_name} tokenizer ({e}): transcript tokens are estimated")
+        return None
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def iter_subtitle_lines(payload: str):
+    """
+    Yield the caption text lines of a VTT or SRT payload one at a time,
+    skipping headers, cue numbers, timestamps and NOTE/STYLE blocks
+    """
+    skip_block = False
+    for line in io.StringIO(payload):
+        line = line.strip()
+        if not line:
+            skip_block = False
+            continue
+        if skip_block or _TIMESTAMP_MARK in line:
+            continue
+        if line.startswith(("WEBVTT", "Kind:", "Language:")):
+            continue
+        if line.startswith(("NOTE", "STYLE", "REGION")):
+            skip_block = True
+            continue
+        if line.isdigit():
+            continue
+        if "<" in line:
+            line = _TAG_RE.sub("", line)
+        if "&" in line:
+            line = html.unescape(line)
+        if line:
+            yield line
+
+
+class TranscriptNormalizer:
+    """
+    Streaming cleanup of caption text before it reaches a prompt: drops
+    the overlap that rolling auto-captions repeat from one cue to the
+    next, noise markers like [Music] and filler words, collapses
+    whitespace, and stops once `max_tokens` is reached (0 = no budget).
+
+    Tokens are counted with tiktoken and only estimated when the
+    tokenizer cannot be loaded.
+    """
+
+    def __init__(self, max_tokens=DEFAULT_MAX_TOKENS, remove_fillers=True, encoding=DEFAULT_ENCODING):
+        self.max_tokens = max_tokens
+        self.remove_fillers = remove_fillers
+        self.count_tokens = _tiktoken_counter(encoding) or estimate_tokens
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_tokens=int(os.getenv("TRANSCRIPT_MAX_TOKENS", str(DEFAULT_MAX_TOKENS))),
+            remove_fillers=os.getenv("TRANSCRIPT_REMOVE_FILLERS", "true").lower() not in ("0", "false", "no"),
+            encoding=os.getenv("TRANSCRIPT_TOKENIZER", DEFAULT_ENCODING),
+        )
+
+    def _clean_words(self, line):
+        if "[" in line or "(" in line or ">>" in line or "♪" in line or "♫" in line:
+            line = _NOISE_RE.sub(" ", line)
+        if self.remove_fillers:
+            line = _FILLER_RE.sub("", line)
+        return line.split()
+
+    @staticmethod
+    def _overlap(tail, words):
+        """
+        Length of the longest prefix of `words` that repeats the end of
+        `tail`. A single repeated word only counts when it is the whole
+        caption, so "no, no" style repeats inside speech survive.
+        """
+        for size in range(min(len(tail), len(words)), 0, -1):
+            if tail[-size:] == words[:size]:
+                return size if size > 1 or len(words) == 1 else 0
+        return 0
+
+    def normalize(self, lines):
+        """
+        Normalize an iterable of caption lines. Returns (text, stats) where
+        stats reports input/output size, output tokens, the compression
+        ratio and whether the token budget cut the transcript short.
+        """
+        pieces = []
+        tail = []
+        previous = None
+        input_chars = 0
+        tokens = 0
+        truncated = False
+        for line in lines:
+            input_chars += len(line) + 1
+            # cheap path for the common rolling-caption case: the exact previous line again
+            if line == previous:
+                continue
+            previous = line
+            words = self._clean_words(line)
+            if not words:
+                continue
+            words = words[self._overlap(tail, words):]
+            if not words:
+                continue
+            piece = " ".join(words)
+            piece_tokens = self.count_tokens(" " + piece)
+            if self.max_tokens and tokens + piece_tokens > self.max_tokens:
+                truncated = True
+                break
+            pieces.append(piece)
+            tokens += piece_tokens
+            tail = (tail + words)[-OVERLAP_WINDOW_WORDS:]
+
+        text = " ".join(pieces)
+        return text, {
+            "input_chars": input_chars,
+            "output_chars": len(text),
+            "output_tokens": tokens,
+            "compression_ratio": (len(text) / input_chars) if input_chars else 1.0,
+            "truncated": truncated,
+        }
+
+    def normalize_subtitle(self, payload: str):
+        """
+        Parse and normalize a VTT or SRT payload in one streaming pass
+        """
+        return self.normalize(iter_subtitle_lines(payload))
+
+
+_default_normalizer = None
+
+
+def get_transcript_normalizer():
+    """
+    Process-wide normalizer (the tokenizer is loaded once)
+    """
+    global _default_normalizer
+    if _default_normalizer is None:
+        _default_normalizer = TranscriptNormalizer.from_env()
+    return _default_normalizer
@@ -0,0 +1,175 @@
+import gzip
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+_VIDEO_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+def _youtube_errors():
+    """
+    (permanent, blocked) youtube-transcript-api exception types, imported
+    lazily like the fetcher does
+    """
+    try:
+        from youtube_transcript_api import (
+            InvalidVideoId,
+            NoTranscriptFound,
+            RequestBlocked,
+            TranscriptsDisabled,
+            VideoUnavailable,
+        )
+    except ImportError:
+        return (), ()
+    # IpBlocked is a RequestBlocked
+    return (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable, InvalidVideoId, RequestBlocked), (RequestBlocked,)
+
+
+def is_negative_error(error) -> bool:
+    """
+    Whether a fetch exception is stable enough (no captions, video
+    unavailable, blocked IP) to be remembered instead of retried on every
+    request. Decided by exception type: the formatted messages of transient
+    failures (e.g. a 503 from YouTube) contain the same words.
+    """
+    return isinstance(error, _youtube_errors()[0])
+
+
+def is_blocked_error(error) -> bool:
+    """
+    Whether YouTube refused the request because of the caller's IP
+    """
+    return isinstance(error, _youtube_errors()[1])
+
+
+class TranscriptFetchError(ValueError):
+    """
+    A failed transcript fetch; `permanent` when retrying soon will not help
+    """
+
+    def __init__(self, message, permanent=False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+class TranscriptStore:
+    """
+    Transcript cache keyed by video_id: an in-memory LRU in front of
+    gzip-compressed files on disk. Failed fetches (no captions, blocked IP)
+    are remembered in memory for `negative_ttl` seconds.
+    """
+
+    def __init__(self, directory=None, max_memory_entries=128, negative_ttl=900):
+        self.directory = directory
+        self.max_memory_entries = max_memory_entries
+        self.negative_ttl = negative_ttl
+        self._memory = OrderedDict()
+        self._failures = {}
+        self._lock = threading.Lock()
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+
+    @classmethod
+    def from_env(cls):
+        """
+        Build a store from TRANSCRIPT_CACHE_* environment variables.
+        Set TRANSCRIPT_CACHE_DIR to an empty string to keep it memory-only.
+        """
+        directory = os.getenv(
+            "TRANSCRIPT_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "blog-generator-transcripts"),
+        )
+        return cls(
+            directory=directory or None,
+            max_memory_entries=int(os.getenv("TRANSCRIPT_CACHE_MAX_ENTRIES", "128")),
+            negative_ttl=float(os.getenv("TRANSCRIPT_CACHE_NEGATIVE_TTL", "900")),
+        )
+
+    def _path(self, video_id):
+        if not self.directory or not _VIDEO_ID_RE.match(video_id):
+            return None
+        return os.path.join(self.directory, f"{video_id}.txt.gz")
+
+    def _remember(self, video_id, transcript):
+        with self._lock:
+            self._memory[video_id] = transcript
+            self._memory.move_to_end(video_id)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, video_id):
+        """
+        Return the stored transcript for a video, or None
+        """
+        with self._lock:
+            transcript = self._memory.get(video_id)
+            if transcript is not None:
+                self._memory.move_to_end(video_id)
+                return transcript
+
+        path = self._path(video_id)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                transcript = f.read()
+        except (OSError, EOFError):
+            return None
+        self._remember(video_id, transcript)
+        return transcript
+
+    def put(self, video_id, transcript):
+        self._remember(video_id, transcript)
+        with self._lock:
+            self._failures.pop(video_id, None)
+
+        path = self._path(video_id)
+        if path is None:
+            return
+        # write to a temp file first so readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                f.write(transcript)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not persist transcript for {video_id}: {str(e)}")
+
+    def get_failure(self, video_id):
+        """
+        Return the remembered error for a video if it has not expired
+        """
+        with self._lock:
+            failure = self._failures.get(video_id)
+            if failure is None:
+                return None
+            error_message, expires_at = failure
+            if expires_at < time.time():
+                del self._failures[video_id]
+                return None
+            return error_message
+
+    def put_failure(self, video_id, error_message, ttl=None):
+        ttl = self.negative_ttl if ttl is None else ttl
+        with self._lock:
+            self._failures[video_id] = (error_message, time.time() + ttl)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._failures.clear()
+
+
+_default_store = None
+
+
+def get_transcript_store():
+    """
+    Process-wide transcript store shared by every BlogNode
+    """
+    global _default_store
+    if _default_store is None:
+        _default_store = TranscriptStore.from_env()
+    return _default_store
@@ -0,0 +1,122 @@
+import json
+import re
+from src.states.blogstate import Blog
+
+_FENCED_RE = re.compile(r"^(```|~~~)[\w-]*\s*\n(.*?)\n?\1\s*$", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_TITLE_PREFIX_RE = re.compile(r"^(?:#{1,6}\s*)?(?:\*\*)?\s*title\s*:\s*", re.IGNORECASE)
+
+
+class BlogParseError(Exception):
+    """
+    The model answered with something that is not a blog, even after
+    repair. Not a ValueError: the request was fine, the upstream output
+    was not, so the API reports it as 502 rather than 400.
+    """
+
+
+def _unfence(text: str) -> str:
+    """
+    Drop a code fence wrapped around the whole response (```json ... ```)
+    """
+    match = _FENCED_RE.match(text)
+    if match:
+        return match.group(2).strip()
+    if text.startswith(("```", "~~~")):
+        # opening fence of a response that was cut off
+        return text.partition("\n")[2].strip()
+    return text
+
+
+def _repair_json(text: str) -> str:
+    """
+    Fix the usual ways a model breaks JSON: raw newlines and tabs inside
+    strings, trailing commas, and output cut off before the closing quote
+    or braces
+    """
+    out = []
+    closers = []
+    in_string = escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            elif char == "\n":
+                out.append("\\n")
+                continue
+            elif char == "\r":
+                continue
+            elif char == "\t":
+                out.append("\\t")
+                continue
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            closers.append("}" if char == "{" else "]")
+        elif char in "}]" and closers:
+            closers.pop()
+        out.append(char)
+
+    if escaped:
+        out.pop()
+    if in_string:
+        out.append('"')
+    repaired = "".join(out).rstrip().rstrip(",")
+    return _TRAILING_COMMA_RE.sub(r"\1", repaired + "".join(reversed(closers)))
+
+
+def _from_json(text: str):
+    start = text.find("{")
+    if start == -1:
+        return None
+    candidate = text[start:]
+    end = candidate.rfind("}")
+    for attempt in (candidate[: end + 1] if end != -1 else candidate, candidate):
+        for source in (attempt, _repair_json(attempt)):
+            try:
+                data = json.loads(source)
+            except ValueError:
+                continue
+            if isinstance(data, dict):
+                fields = {str(key).lower(): value for key, value in data.items()}
+                if isinstance(fields.get("title"), str) and isinstance(fields.get("content"), str):
+                    return Blog(title=fields["title"].strip().strip("#").strip(), content=fields["content"])
+    return None
+
+
+def _from_markdown(text: str):
+    lines = text.splitlines()
+    for index, line in enumerate(lines):
+        if line.strip():
+            break
+    else:
+        return None
+    title = _TITLE_PREFIX_RE.sub("", lines[index].strip())
+    title = title.strip("#").strip().strip("*").strip()
+    content = "\n".join(lines[index + 1:]).strip()
+    if not title or not content:
+        return None
+    return Blog(title=title, content=content)
+
+
+def parse_blog(text: str) -> Blog:
+    """
+    Parse a single-call generation response into a Blog.
+
+    Accepts the Markdown format the prompts ask for (title as the first
+    heading, content below it) as well as a JSON object with title and
+    content, repairing malformed JSON locally instead of asking the model
+    again. Raises BlogParseError when neither can be recovered.
+    """
+    text = _unfence(str(text).strip())
+    if text.startswith("{") or '"title"' in text[:200].lower():
+        blog = _from_json(text) or _from_markdown(text)
+    else:
+        blog = _from_markdown(text) or _from_json(text)
+    if blog is None:
+        raise BlogParseError("Could not parse a blog title and content from the model response")
+    return blog
@@ -0,0 +1,79 @@
+import re
+
+_HEADING_RE = re.compile(r"^#{1,6}\s")
+_FENCE_RE = re.compile(r"^(```|~~~)")
+
+
+def split_markdown_sections(text: str):
+    """
+    Split Markdown into sections that each start at an ATX heading.
+    Headings inside fenced code blocks are ignored, and the sections
+    concatenate back to exactly the original text.
+    """
+    sections = []
+    current = []
+    in_fence = False
+    for line in text.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if _FENCE_RE.match(stripped):
+            in_fence = not in_fence
+        elif not in_fence and _HEADING_RE.match(stripped) and any(l.strip() for l in current):
+            sections.append("".join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append("".join(current))
+    return sections
+
+
+def split_surrounding_whitespace(text: str):
+    """
+    Return (leading whitespace, body, trailing whitespace) so a rewritten
+    body can be put back with the original spacing
+    """
+    body = text.strip()
+    if not body:
+        return text, "", ""
+    start = text.index(body)
+    return text[:start], body, text[start + len(body):]
+
+
+class MarkdownSectionStream:
+    """
+    Incremental split_markdown_sections for text that arrives in pieces
+    (e.g. LLM tokens): `feed` returns each section as soon as the heading
+    of the next one starts, `close` returns the last one.
+    """
+
+    def __init__(self):
+        self._partial = ""
+        self._current = []
+        self._in_fence = False
+
+    def _push(self, line):
+        section = None
+        stripped = line.lstrip()
+        if _FENCE_RE.match(stripped):
+            self._in_fence = not self._in_fence
+        elif not self._in_fence and _HEADING_RE.match(stripped) and any(l.strip() for l in self._current):
+            section = "".join(self._current)
+            self._current = []
+        self._current.append(line)
+        return section
+
+    def feed(self, text: str):
+        *lines, self._partial = (self._partial + text).split("\n")
+        sections = (self._push(line + "\n") for line in lines)
+        return [section for section in sections if section is not None]
+
+    def close(self):
+        sections = self.feed("")
+        if self._partial:
+            section = self._push(self._partial)
+            if section is not None:
+                sections.append(section)
+            self._partial = ""
+        if self._current:
+            sections.append("".join(self._current))
+            self._current = []
+        return sections
@@ -0,0 +1,11 @@
+import os
+
+## the repository root, one level above src/
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def data_path(name: str) -> str:
+    """
+    Default location of a local database: `<project>/data/<name>`
+    """
+    return os.path.join(PROJECT_DIR, "data", name)
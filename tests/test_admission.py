@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from src.api import admission as admission_module
+from src.api.admission import AdmissionController, AdmissionRejected
+
+
+def test_slot_granted_at_timeout_is_released(monkeypatch):
+    async def scenario():
+        controller = AdmissionController(limits={"topic": 1}, max_wait=0.1, service_time=0.1)
+        holder = await controller.acquire("topic", "a")
+
+        async def granted_then_timed_out(future, timeout):
+            # the holder finishes and dispatch grants the queued request,
+            # but the timeout fires before the waiter resumes
+            controller.release(holder)
+            assert future.done()
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr(admission_module.asyncio, "wait_for", granted_then_timed_out)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("topic", "b")
+        monkeypatch.undo()
+        assert rejected.value.status_code == 503
+
+        pool = controller.stats()["pools"]["topic"]
+        assert pool["active"] == 0 and pool["waiting"] == 0
+        ticket = await asyncio.wait_for(controller.acquire("topic", "c"), timeout=1)
+        controller.release(ticket)
+
+    asyncio.run(scenario())
+
+
+def test_client_queue_limit_is_429():
+    async def scenario():
+        controller = AdmissionController(limits={"topic": 1}, max_client_queue=1, max_wait=5, service_time=0.1)
+        holder = await controller.acquire("topic", "a")
+        waiter = asyncio.create_task(controller.acquire("topic", "b"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire("topic", "b")
+        assert rejected.value.status_code == 429
+        controller.release(holder)
+        controller.release(await waiter)
+
+    asyncio.run(scenario())
+
+
+def test_priority_only_for_configured_keys():
+    controller = AdmissionController(priority_keys=["ops-key"])
+    assert controller.priority_for("ops-key", "5") == 5
+    assert controller.priority_for("other-key", "1000000") == 0
+    assert controller.priority_for(None, "1000000") == 0
+    assert controller.priority_for("ops-key", "high") == 0
@@ -0,0 +1,88 @@
+import asyncio
+import os
+
+from src.blogs.store import BlogStore
+from src.jobs.store import JobStore
+from src.utils.paths import PROJECT_DIR, data_path
+
+
+def test_default_store_paths_are_under_the_project():
+    assert data_path("blogs.sqlite3") == os.path.join(PROJECT_DIR, "data", "blogs.sqlite3")
+    assert os.path.exists(os.path.join(PROJECT_DIR, "app.py"))
+
+
+def test_lifespan_opens_and_closes_the_stores(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_BACKEND", "fake")
+    monkeypatch.setenv("BLOG_STORE_SQLITE_PATH", str(tmp_path / "blogs.sqlite3"))
+    monkeypatch.setenv("JOB_QUEUE_SQLITE_PATH", str(tmp_path / "jobs.sqlite3"))
+    import app as blog_app
+
+    assert blog_app.blog_store is None and blog_app.job_queue is None
+
+    async def scenario():
+        async with blog_app.lifespan(blog_app.app):
+            stores = blog_app.blog_store, blog_app.job_queue.store
+        return stores
+
+    blog_store, job_store = asyncio.run(scenario())
+    assert isinstance(blog_store, BlogStore) and isinstance(job_store, JobStore)
+    assert (tmp_path / "blogs.sqlite3").exists()
+    assert (tmp_path / "jobs.sqlite3").exists()
+    assert blog_app.blog_store is None and blog_app.job_queue is None
+
+
+def test_unwritable_store_falls_back_to_memory(monkeypatch, tmp_path):
+    import app as blog_app
+
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setenv("BLOG_STORE_SQLITE_PATH", str(blocker / "blogs.sqlite3"))
+    store = blog_app.open_store(BlogStore, "blog store")
+    assert store.path == ":memory:"
+
+
+def test_lifespan_opens_the_checkpoint_store(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_BACKEND", "fake")
+    monkeypatch.setenv("CHECKPOINT_SQLITE_PATH", str(tmp_path / "checkpoints.sqlite3"))
+    monkeypatch.setenv("BLOG_STORE_SQLITE_PATH", str(tmp_path / "blogs.sqlite3"))
+    monkeypatch.setenv("JOB_QUEUE_SQLITE_PATH", str(tmp_path / "jobs.sqlite3"))
+    import app as blog_app
+
+    monkeypatch.setattr(blog_app, "CHECKPOINTS_ENABLED", True)
+
+    async def scenario():
+        async with blog_app.lifespan(blog_app.app):
+            graph = blog_app.graph_registry.get("topic")
+            return blog_app.checkpointer, graph.checkpointer
+
+    checkpointer, graph_checkpointer = asyncio.run(scenario())
+    assert checkpointer is graph_checkpointer and checkpointer.path == str(tmp_path / "checkpoints.sqlite3")
+    assert (tmp_path / "checkpoints.sqlite3").exists()
+    assert blog_app.checkpointer is None and blog_app.graph_registry.checkpointer is None
+
+
+def test_stored_blog_etag_is_weak_and_shared_by_both_encodings(monkeypatch):
+    import httpx
+
+    import app as blog_app
+
+    store = BlogStore(":memory:")
+    blog_id = store.save({"title": "Agentic AI", "content": "Agents plan and act."})
+    monkeypatch.setattr(blog_app, "blog_store", store)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=blog_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            gzipped = await client.get(f"/blogs/{blog_id}", headers={"accept-encoding": "gzip"})
+            identity = await client.get(f"/blogs/{blog_id}", headers={"accept-encoding": "identity"})
+            revalidated = await client.get(
+                f"/blogs/{blog_id}", headers={"accept-encoding": "identity", "if-none-match": gzipped.headers["etag"]}
+            )
+        return gzipped, identity, revalidated
+
+    gzipped, identity, revalidated = asyncio.run(scenario())
+    assert gzipped.headers["content-encoding"] == "gzip" and "content-encoding" not in identity.headers
+    assert gzipped.headers["etag"] == identity.headers["etag"] == f'W/"{blog_id}"'
+    assert revalidated.status_code == 304
+    assert blog_app.not_modified(f'"{blog_id}"', gzipped.headers["etag"])
+    store.close()
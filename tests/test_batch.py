@@ -0,0 +1,60 @@
+import asyncio
+import json
+
+import httpx
+
+from src.batch.runner import BatchRunner
+
+JOBS = [{"id": "a", "topic": "Rust"}, {"id": "b", "topic": "Go"}]
+
+
+def post_batch(**kwargs):
+    import app as blog_app
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=blog_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/blogs/batch", **kwargs)
+        return response.status_code, [json.loads(line) for line in response.text.splitlines()]
+
+    return asyncio.run(scenario())
+
+
+def test_batch_accepts_ndjson_and_json(monkeypatch):
+    monkeypatch.setenv("LLM_BACKEND", "fake")
+    monkeypatch.setenv("FAKE_LLM_LATENCY", "0")
+    ndjson = "\n".join(json.dumps(job) for job in JOBS) + "\n"
+    status, records = post_batch(
+        content=ndjson, headers={"content-type": "application/x-ndjson"}, params={"max_concurrency": 2}
+    )
+    assert status == 200
+    assert sorted(record["id"] for record in records[:-1]) == ["a", "b"]
+    assert records[-1]["summary"]["succeeded"] == 2
+
+    status, records = post_batch(json={"jobs": JOBS})
+    assert status == 200 and records[-1]["summary"]["succeeded"] == 2
+
+
+def test_batch_rejects_a_bad_ndjson_line():
+    status, _ = post_batch(content='{"topic": "Rust"}\n{"nope": 1}\n', headers={"content-type": "application/x-ndjson"})
+    assert status == 400
+
+
+def test_batch_rejects_lines_that_are_not_job_objects():
+    cases = ["42", "[]", '"x"', '{"topic": "Rust", "language": 3}', '{"topic": "Rust", "languages": "french"}',
+             '{"topic": "Rust", "languages": ["french", 1]}']
+    for line in cases:
+        status, body = post_batch(content=f'{{"topic": "Go"}}\n{line}\n', headers={"content-type": "application/x-ndjson"})
+        assert status == 400, line
+        assert "line 2" in body[0]["detail"], line
+
+    status, _ = post_batch(json={"jobs": [{"topic": "Rust", "languages": [1]}]})
+    assert status == 400
+
+
+def test_thread_ids_carry_the_batch_prefix():
+    class Job:
+        id = "a"
+
+    assert BatchRunner(None)._thread_id(Job) == "batch-a"
+    assert BatchRunner(None, thread_prefix="batch-123")._thread_id(Job) == "batch-123-a"
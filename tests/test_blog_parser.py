@@ -0,0 +1,55 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.utils.blog_parser import BlogParseError, parse_blog
+
+
+def test_markdown_title_and_content():
+    blog = parse_blog("# Agentic AI\n\nAgents plan and act.")
+    assert (blog.title, blog.content) == ("Agentic AI", "Agents plan and act.")
+    assert parse_blog("**Title:** Agentic AI\nAgents plan and act.").title == "Agentic AI"
+
+
+def test_fenced_json_is_unwrapped():
+    blog = parse_blog('```json\n{"title": "Agentic AI", "content": "Agents plan and act."}\n```')
+    assert (blog.title, blog.content) == ("Agentic AI", "Agents plan and act.")
+    # a fence that was never closed
+    assert parse_blog("```markdown\n# Agentic AI\nAgents plan and act.").title == "Agentic AI"
+
+
+def test_trailing_commas_are_dropped():
+    blog = parse_blog('{"title": "Agentic AI", "content": "Agents plan and act.",}')
+    assert blog.content == "Agents plan and act."
+    assert parse_blog('{"Title": "# Agentic AI", "Content": "x", }').title == "Agentic AI"
+
+
+def test_raw_newlines_and_truncated_output_are_repaired():
+    blog = parse_blog('{"title": "Agentic AI", "content": "line one\nline two')
+    assert blog.content == "line one\nline two"
+
+
+def test_missing_title_raises_a_parse_error():
+    for text in ('{"content": "Agents plan and act."}', "Just one line", ""):
+        with pytest.raises(BlogParseError):
+            parse_blog(text)
+    assert not issubclass(BlogParseError, ValueError)
+
+
+def test_unparsable_response_is_a_bad_gateway(monkeypatch):
+    import app as blog_app
+
+    async def unparsable(*args, **kwargs):
+        raise BlogParseError("Could not parse a blog title and content from the model response")
+
+    monkeypatch.setattr(blog_app, "generate_blog", unparsable)
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=blog_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/blogs/topic", json={"topic": "Agentic AI"})
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 502
+    assert "Could not parse" in response.json()["detail"]
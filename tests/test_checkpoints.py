@@ -0,0 +1,128 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from src.checkpoints import sqlite_saver
+from src.checkpoints.sqlite_saver import SQLiteCheckpointSaver
+from src.checkpoints.threads import ainvoke_in_thread
+from src.graphs.graph_builder import GraphBuilder
+from src.llms.fakellm import FakeChatModel
+from src.llms.retry import RetryPolicy
+
+INPUTS = {"topic": "Agentic AI", "current_language": "french"}
+CALLS = Counter()
+
+
+class FlakyTranslationModel(FakeChatModel):
+    """
+    Counts generation and translation calls; the first `failures_left`
+    translation calls fail
+    """
+
+    failures_left: int = 0
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        kind = "translation" if "Translate" in str(messages[-1].content) else "generation"
+        CALLS[kind] += 1
+        if kind == "translation" and self.failures_left > 0:
+            self.failures_left -= 1
+            raise RuntimeError("simulated crash during translation")
+        return await super()._agenerate(messages, stop, run_manager, **kwargs)
+
+
+def build(saver, failures=0):
+    builder = GraphBuilder(FlakyTranslationModel(latency=0, failures_left=failures))
+    graph = builder.setup_graph("topic", checkpointer=saver)
+    builder.blog_node_obj.invoker.policy = RetryPolicy(max_attempts=1)
+    builder.blog_node_obj.translation_config.retries = 0
+    builder.blog_node_obj.translation_config.pipeline = False
+    return graph
+
+
+@pytest.fixture
+def saver(tmp_path):
+    saver = SQLiteCheckpointSaver(str(tmp_path / "checkpoints.sqlite3"))
+    yield saver
+    saver.close()
+
+
+def test_graph_state_round_trips_through_the_saver(saver):
+    graph = build(saver)
+    state = asyncio.run(ainvoke_in_thread(graph, INPUTS, None, "thread-1", "topic"))
+
+    latest = saver.get_tuple({"configurable": {"thread_id": "thread-1"}})
+    assert latest.checkpoint["channel_values"]["blog"] == state["blog"]
+    assert latest.metadata["usecase"] == "topic"
+
+    history = list(saver.list({"configurable": {"thread_id": "thread-1"}}))
+    assert history[0].config == latest.config
+    # every checkpoint points at the one written before it
+    for newer, older in zip(history, history[1:]):
+        assert newer.parent_config["configurable"]["checkpoint_id"] == older.config["configurable"]["checkpoint_id"]
+    assert history[-1].parent_config is None
+    assert len(list(saver.list({"configurable": {"thread_id": "thread-1"}}, limit=2))) == 2
+
+    by_id = saver.get_tuple(history[1].config)
+    assert by_id.config == history[1].config
+
+
+def test_failed_run_resumes_from_its_last_completed_node(saver):
+    CALLS.clear()
+    graph = build(saver, failures=1)
+    with pytest.raises(RuntimeError):
+        asyncio.run(ainvoke_in_thread(graph, INPUTS, None, "crashed", "topic"))
+    assert CALLS["generation"] == 1
+
+    state = asyncio.run(ainvoke_in_thread(graph, None, None, "crashed", "topic", resume=True))
+    assert CALLS["generation"] == 1, "the English blog was generated again"
+    assert state["current_language"] == "french" and state["blog"]["content"]
+
+
+def test_pending_writes_are_kept_once_and_errors_replaced(saver):
+    asyncio.run(ainvoke_in_thread(build(saver), INPUTS, None, "writes", "topic"))
+    config = saver.get_tuple({"configurable": {"thread_id": "writes"}}).config
+
+    saver.put_writes(config, [("blog", {"title": "a"}), ("__error__", "first")], "task-1")
+    saver.put_writes(config, [("blog", {"title": "b"}), ("__error__", "second")], "task-1")
+    writes = saver.get_tuple(config).pending_writes
+    assert ("task-1", "blog", {"title": "a"}) in writes
+    assert ("task-1", "__error__", "second") in writes
+    assert len(writes) == 2
+
+
+def test_large_values_are_compressed(saver, monkeypatch):
+    monkeypatch.setattr(sqlite_saver, "COMPRESS_MIN_BYTES", 16)
+    asyncio.run(ainvoke_in_thread(build(saver), INPUTS, None, "big", "topic"))
+    types = {row[0] for row in saver._conn.execute("SELECT type FROM blobs WHERE thread_id = 'big'")}
+    assert any(type_.endswith("+zlib") for type_ in types)
+    assert saver.get_tuple({"configurable": {"thread_id": "big"}}).checkpoint["channel_values"]["blog"]["title"]
+
+
+def test_concurrent_async_runs_share_one_saver(saver):
+    graph = build(saver)
+
+    async def scenario():
+        return await asyncio.gather(*(
+            ainvoke_in_thread(graph, {**INPUTS, "topic": f"Topic {i}"}, None, f"thread-{i}", "topic") for i in range(8)
+        ))
+
+    states = asyncio.run(scenario())
+    assert [state["topic"] for state in states] == [f"Topic {i}" for i in range(8)]
+    for i in range(8):
+        latest = saver.get_tuple({"configurable": {"thread_id": f"thread-{i}"}})
+        assert latest.checkpoint["channel_values"]["topic"] == f"Topic {i}"
+    assert saver.stats()["threads"] == 8
+
+
+def test_delete_thread_and_gc(saver):
+    graph = build(saver)
+    for thread_id in ("keep", "drop", "old"):
+        asyncio.run(ainvoke_in_thread(graph, INPUTS, None, thread_id, "topic"))
+    saver.delete_thread("drop")
+    assert saver.get_tuple({"configurable": {"thread_id": "drop"}}) is None
+
+    saver._conn.execute("UPDATE checkpoints SET created_at = 0 WHERE thread_id = 'old'")
+    assert saver.gc(3600) == 1
+    assert saver.get_tuple({"configurable": {"thread_id": "old"}}) is None
+    assert saver.get_tuple({"configurable": {"thread_id": "keep"}}) is not None
@@ -0,0 +1,126 @@
+import asyncio
+
+from src.cache.coalescer import RequestCoalescer
+
+
+def test_followers_get_the_leaders_result():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"blog": "shared"}
+
+    async def scenario():
+        return await asyncio.gather(*(coalescer.run("key", factory) for _ in range(5)))
+
+    results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert coalescer.stats()["executions"] == 1 and coalescer.stats()["coalesced"] == 4
+    assert coalescer.stats()["inflight"] == 0
+
+
+def test_followers_get_the_leaders_exception():
+    coalescer = RequestCoalescer()
+
+    async def factory():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("model down")
+
+    async def scenario():
+        return await asyncio.gather(*(coalescer.run("key", factory) for _ in range(3)), return_exceptions=True)
+
+    errors = asyncio.run(scenario())
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert coalescer.stats()["executions"] == 1
+
+
+def test_different_keys_and_later_calls_run_again():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return len(calls)
+
+    async def scenario():
+        both = await asyncio.gather(coalescer.run("a", factory), coalescer.run("b", factory))
+        return both, await coalescer.run("a", factory)
+
+    assert asyncio.run(scenario()) == ([1, 2], 3)
+
+
+def test_cancelled_follower_leaves_the_execution_running():
+    coalescer = RequestCoalescer()
+
+    async def factory():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def scenario():
+        leader = asyncio.ensure_future(coalescer.run("key", factory))
+        follower = asyncio.ensure_future(coalescer.run("key", factory))
+        await asyncio.sleep(0)
+        follower.cancel()
+        return await leader
+
+    assert asyncio.run(scenario()) == "done"
+
+
+def test_stream_fans_out_and_replays_to_late_subscribers():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        for i in range(4):
+            await asyncio.sleep(0.005)
+            yield i
+
+    async def consume(delay=0):
+        await asyncio.sleep(delay)
+        return [event async for event in coalescer.stream("key", factory)]
+
+    async def scenario():
+        return await asyncio.gather(consume(), consume(), consume(0.012))
+
+    assert asyncio.run(scenario()) == [[0, 1, 2, 3]] * 3
+    assert len(calls) == 1
+
+
+def test_stream_error_reaches_every_subscriber():
+    coalescer = RequestCoalescer()
+
+    async def factory():
+        yield "partial"
+        raise RuntimeError("stream broke")
+
+    async def consume(seen):
+        async for event in coalescer.stream("key", factory):
+            seen.append(event)
+
+    async def scenario():
+        seen = [[], []]
+        results = await asyncio.gather(consume(seen[0]), consume(seen[1]), return_exceptions=True)
+        return seen, results
+
+    seen, results = asyncio.run(scenario())
+    assert seen == [["partial"], ["partial"]]
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_disabled_coalescer_runs_every_call():
+    coalescer = RequestCoalescer(enabled=False)
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0)
+
+    async def scenario():
+        await asyncio.gather(*(coalescer.run("key", factory) for _ in range(3)))
+
+    asyncio.run(scenario())
+    assert len(calls) == 3
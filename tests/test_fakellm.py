@@ -0,0 +1,10 @@
+from src.llms.fakellm import FakeChatModel
+
+
+def test_title_prompts_get_the_title_line():
+    model = FakeChatModel(latency=0)
+    topic_prompt = "Write a title about Rust. Return only the title, nothing else."
+    transcript_prompt = "TRANSCRIPT:\nhello\n\nGenerate only the title, nothing else."
+    assert model.invoke(topic_prompt).content == "Fake Blog"
+    assert model.invoke(transcript_prompt).content == "Fake Blog"
+    assert model.invoke("Write a blog about Rust.").content.startswith("# Fake Blog\n")
@@ -0,0 +1,73 @@
+from src.utils.markdown import MarkdownSectionStream, split_markdown_sections, split_surrounding_whitespace
+
+BLOG = """Intro paragraph.
+
+## Setup
+
+Install it:
+
+```bash
+# not a heading
+pip install agents
+```
+
+### Details
+~~~
+## also not a heading
+~~~
+#hashtag is text
+
+## Wrap-up
+Done.
+"""
+
+
+def test_sections_start_at_headings():
+    sections = split_markdown_sections(BLOG)
+    assert [section.splitlines()[0] for section in sections] == ["Intro paragraph.", "## Setup", "### Details", "## Wrap-up"]
+    assert "".join(sections) == BLOG
+
+
+def test_headings_inside_code_fences_do_not_split():
+    sections = split_markdown_sections(BLOG)
+    assert "# not a heading" in sections[1]
+    assert "## also not a heading" in sections[2] and "#hashtag is text" in sections[2]
+
+
+def test_leading_blank_lines_stay_with_the_first_heading():
+    text = "\n\n# Title\nBody\n"
+    assert split_markdown_sections(text) == [text]
+    assert split_markdown_sections("") == []
+
+
+def test_unclosed_fence_swallows_later_headings():
+    text = "## One\n```\n## Two\n"
+    assert split_markdown_sections(text) == [text]
+
+
+def test_stream_matches_the_batch_split_for_any_chunking():
+    expected = split_markdown_sections(BLOG)
+    for size in (1, 3, 7, len(BLOG)):
+        stream = MarkdownSectionStream()
+        sections = []
+        for start in range(0, len(BLOG), size):
+            sections.extend(stream.feed(BLOG[start:start + size]))
+        sections.extend(stream.close())
+        assert sections == expected, size
+
+
+def test_stream_emits_a_section_once_the_next_heading_starts():
+    stream = MarkdownSectionStream()
+    assert stream.feed("## One\nbody\n") == []
+    assert stream.feed("## Two\n") == ["## One\nbody\n"]
+    assert stream.close() == ["## Two\n"]
+    assert MarkdownSectionStream().close() == []
+    # a final line without a newline is kept as is
+    stream = MarkdownSectionStream()
+    stream.feed("## One\nlast")
+    assert stream.close() == ["## One\nlast"]
+
+
+def test_surrounding_whitespace_round_trips():
+    assert split_surrounding_whitespace("\n## Setup\nText\n\n") == ("\n", "## Setup\nText", "\n\n")
+    assert split_surrounding_whitespace("  \n") == ("  \n", "", "")
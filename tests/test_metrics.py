@@ -0,0 +1,92 @@
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from src.observability.callbacks import MetricsCallbackHandler
+from src.observability.metrics import CACHE_REQUESTS, LLM_COST
+from src.observability.pricing import PriceTable
+
+
+def test_cache_requests_is_a_counter():
+    assert CACHE_REQUESTS.kind == "counter"
+    assert CACHE_REQUESTS.name == "blog_cache_requests_total"
+
+
+def test_price_table_cost():
+    prices = PriceTable({"model-a": (1.0, 2.0)})
+    assert prices.cost("model-a", 1_000_000, 500_000) == 2.0
+    assert prices.cost("unknown", 1000, 1000) == 0.0
+
+
+def test_llm_end_records_cost():
+    handler = MetricsCallbackHandler(timings={})
+    before = LLM_COST.value(model="llama-3.1-8b-instant")
+    handler.on_chat_model_start({}, [], run_id="run", metadata={"ls_model_name": "llama-3.1-8b-instant"})
+    message = AIMessage(content="hi", usage_metadata={"input_tokens": 1_000_000, "output_tokens": 0, "total_tokens": 1_000_000})
+    handler.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]), run_id="run")
+    assert abs(LLM_COST.value(model="llama-3.1-8b-instant") - before - 0.05) < 1e-9
+
+
+def test_streamed_request_stays_in_flight_until_sent(monkeypatch):
+    import asyncio
+    import json
+
+    monkeypatch.setenv("LLM_BACKEND", "fake")
+    monkeypatch.setenv("FAKE_LLM_LATENCY", "0")
+    import app as blog_app
+    from src.observability.metrics import REQUESTS_IN_FLIGHT
+
+    path = "/blogs/topic/stream"
+    body = json.dumps({"topic": "In flight gauge"}).encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"content-type", b"application/json"), (b"host", b"test")],
+        "client": ("127.0.0.1", 1), "server": ("test", 80),
+    }
+    in_flight = []
+    requests = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # the client stays connected
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("more_body"):
+            in_flight.append(REQUESTS_IN_FLIGHT.value(path=path))
+
+    before = REQUESTS_IN_FLIGHT.value(path=path)
+    asyncio.run(blog_app.app(scope, receive, send))
+    assert in_flight and all(value == before + 1 for value in in_flight)
+    assert REQUESTS_IN_FLIGHT.value(path=path) == before
+
+
+def test_job_stats_are_read_off_the_event_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    import httpx
+
+    import app as blog_app
+
+    threads = []
+
+    class StubQueue:
+        def stats(self):
+            threads.append(threading.get_ident())
+            return {"queued": 1}
+
+    monkeypatch.setattr(blog_app, "job_queue", StubQueue())
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=blog_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            stats = await client.get("/jobs/stats")
+            scrape = await client.get("/metrics")
+        return threading.get_ident(), stats, scrape
+
+    loop_thread, stats, scrape = asyncio.run(scenario())
+    assert stats.json() == {"queued": 1}
+    assert 'blog_jobs{status="queued"} 1' in scrape.text
+    assert len(threads) == 2 and loop_thread not in threads
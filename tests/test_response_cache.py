@@ -0,0 +1,41 @@
+import asyncio
+
+from src.cache.response_cache import ResponseCache
+from src.llms.fakellm import FakeChatModel
+from src.observability.callbacks import MetricsCallbackHandler
+
+
+def test_uncacheable_value_is_returned_but_not_cached():
+    async def scenario():
+        cache = ResponseCache()
+        calls = []
+
+        async def produce():
+            calls.append(1)
+            return {"blog": len(calls), "models": ["fallback"]}
+
+        cacheable = lambda state: set(state["models"]) <= {"primary"}
+        first = await cache.get_or_create("key", produce, cacheable=cacheable)
+        second = await cache.get_or_create("key", produce, cacheable=cacheable)
+        return first, second, await cache.get("key")
+
+    first, second, cached = asyncio.run(scenario())
+    assert (first["blog"], second["blog"], cached) == (1, 2, None)
+
+
+def test_callback_records_the_models_that_answered():
+    handler = MetricsCallbackHandler()
+    FakeChatModel(model_name="fake-fallback", latency=0).invoke("hi", config={"callbacks": [handler]})
+    assert handler.models == {"fake-fallback"}
+
+
+def test_router_is_on_for_groq_only_with_configured_quotas(monkeypatch):
+    from src.llms.router import router_enabled
+
+    monkeypatch.delenv("MODEL_ROUTER_ENABLED", raising=False)
+    monkeypatch.delenv("GROQ_MODEL_ROUTES", raising=False)
+    assert not router_enabled("groq")
+    monkeypatch.setenv("GROQ_MODEL_ROUTES", '[{"model": "m", "rpm": 1, "tpm": 1}]')
+    assert router_enabled("groq") and not router_enabled("fake")
+    monkeypatch.setenv("MODEL_ROUTER_ENABLED", "false")
+    assert not router_enabled("groq")
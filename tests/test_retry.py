@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from src.llms import retry
+from src.llms.fakellm import FakeRateLimitError
+from src.llms.retry import ResilientInvoker, RetryPolicy, get_retry_after
+
+
+class ScriptedModel:
+    """
+    Raises the queued errors in order, then answers with its name
+    """
+
+    def __init__(self, model_name, errors=()):
+        self.model_name = model_name
+        self.errors = list(errors)
+        self.calls = 0
+
+    def invoke(self, messages, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.model_name
+
+    async def ainvoke(self, messages, **kwargs):
+        return self.invoke(messages, **kwargs)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+
+    async def fake_async_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(retry.time, "sleep", delays.append)
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_async_sleep)
+    return delays
+
+
+def test_backoff_doubles_up_to_max_delay():
+    policy = RetryPolicy(base_delay=0.5, max_delay=3, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(5)] == [0.5, 1.0, 2.0, 3, 3]
+    jittered = RetryPolicy(base_delay=0.5, max_delay=3)
+    assert all(0 <= jittered.backoff(2) <= 2.0 for _ in range(50))
+
+
+def test_next_delay_gives_up_on_non_retryable_errors_and_exhausted_attempts():
+    policy = RetryPolicy(max_attempts=3, jitter=False)
+    assert policy.next_delay(ValueError("bad prompt"), 0) is None
+    assert policy.next_delay(RuntimeError("connection reset"), 0) == 0.5
+    assert policy.next_delay(RuntimeError("connection reset"), 2) is None
+
+
+def test_retry_after_hint_replaces_the_backoff():
+    policy = RetryPolicy(max_delay=20, jitter=False)
+    assert policy.next_delay(FakeRateLimitError(2), 0) == 2.0
+    # asked to wait longer than max_delay: move on instead
+    assert policy.next_delay(FakeRateLimitError(60), 0) is None
+    assert get_retry_after(RuntimeError("Rate limit reached. Please try again in 7m12.5s")) == 432.5
+    assert get_retry_after(RuntimeError("429: try again in 850ms")) == 0.85
+    assert get_retry_after(RuntimeError("boom")) is None
+
+
+def test_transient_errors_are_retried_on_the_same_model(sleeps):
+    model = ScriptedModel("primary", [RuntimeError("503 temporarily unavailable")] * 2)
+    invoker = ResilientInvoker(model, policy=RetryPolicy(max_attempts=3, jitter=False))
+    assert invoker.invoke([]) == "primary"
+    assert model.calls == 3 and sleeps == [0.5, 1.0]
+
+
+def test_non_retryable_errors_are_raised_at_once(sleeps):
+    model = ScriptedModel("primary", [ValueError("bad prompt")])
+    fallback = ScriptedModel("fallback")
+    invoker = ResilientInvoker(model, [fallback], policy=RetryPolicy(jitter=False))
+    with pytest.raises(ValueError):
+        invoker.invoke([])
+    assert model.calls == 1 and fallback.calls == 0 and sleeps == []
+
+
+def test_falls_back_when_attempts_run_out(sleeps):
+    model = ScriptedModel("primary", [FakeRateLimitError(1)] * 3)
+    fallback = ScriptedModel("fallback")
+    invoker = ResilientInvoker(model, [None, fallback], policy=RetryPolicy(max_attempts=2, jitter=False))
+    assert asyncio.run(invoker.ainvoke([])) == "fallback"
+    assert model.calls == 2 and fallback.calls == 1 and sleeps == [1.0]
+
+
+def test_falls_back_at_once_on_a_long_retry_after(sleeps):
+    model = ScriptedModel("primary", [FakeRateLimitError(600)])
+    fallback = ScriptedModel("fallback")
+    invoker = ResilientInvoker(model, [fallback], policy=RetryPolicy(max_delay=20, jitter=False))
+    assert invoker.invoke([]) == "fallback"
+    assert model.calls == 1 and sleeps == []
+
+
+def test_last_model_raises_when_it_keeps_failing(sleeps):
+    model = ScriptedModel("primary", [RuntimeError("timed out")] * 2)
+    invoker = ResilientInvoker(model, policy=RetryPolicy(max_attempts=2, jitter=False))
+    with pytest.raises(RuntimeError, match="timed out"):
+        invoker.invoke([])
+    assert model.calls == 2
@@ -0,0 +1,34 @@
+from src.cache.topic_index import TopicIndex, guard_tokens, topic_tokens
+
+
+def make_index(*topics):
+    index = TopicIndex()
+    for topic in topics:
+        index.add(topic)
+    return index
+
+
+def test_paraphrase_reuses_stored_topic():
+    match = make_index("Agentic AI").lookup("What is Agentic AI?")
+    assert match is not None and match.subject == "Agentic AI"
+
+
+def test_different_numbers_do_not_match():
+    assert make_index("World War 2").lookup("World War 1") is None
+    assert make_index("Python 3 tutorial").lookup("Python 2 tutorial") is None
+
+
+def test_negation_does_not_match():
+    assert make_index("How not to bake bread").lookup("How to bake bread") is None
+    assert make_index("How to bake bread").lookup("How not to bake bread") is None
+
+
+def test_guard_tokens():
+    assert guard_tokens(topic_tokens("Why you shouldn't use Python 3.12")) == ("12", "3", "shouldnt")
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("TOPIC_INDEX_ENABLED", raising=False)
+    index = TopicIndex.from_env()
+    index.add("Agentic AI")
+    assert not index.enabled and index.lookup("Agentic AI") is None
@@ -0,0 +1,50 @@
+import sys
+
+import pytest
+from youtube_transcript_api import TranscriptsDisabled, YouTubeRequestFailed
+
+from src.llms.fakellm import FakeChatModel
+from src.nodes.blog_node import BlogNode
+from src.transcripts.store import TranscriptFetchError, TranscriptStore
+
+VIDEO_ID = "dQw4w9WgXcQ"
+STATE = {"youtube_url": f"https://www.youtube.com/watch?v={VIDEO_ID}"}
+
+
+class FailingFetcher:
+    def __init__(self, error):
+        self.error = error
+        self.calls = 0
+
+    def fetch_transcript_lines(self, video_id):
+        self.calls += 1
+        raise self.error
+
+
+def make_node(error, monkeypatch):
+    # no yt-dlp fallback: the youtube-transcript-api error decides
+    monkeypatch.setitem(sys.modules, "yt_dlp", None)
+    fetcher = FailingFetcher(error)
+    node = BlogNode(FakeChatModel(latency=0), transcript_store=TranscriptStore(), transcript_fetcher=fetcher)
+    return node, fetcher
+
+
+def extract_twice(node):
+    for _ in range(2):
+        with pytest.raises(TranscriptFetchError):
+            node.extract_youtube_transcript(STATE)
+
+
+def test_transient_request_failure_is_not_cached(monkeypatch):
+    error = YouTubeRequestFailed(VIDEO_ID, Exception("503 Server Error: Service Unavailable"))
+    node, fetcher = make_node(error, monkeypatch)
+    extract_twice(node)
+    assert fetcher.calls == 2
+    assert node.transcript_store.get_failure(VIDEO_ID) is None
+
+
+def test_disabled_captions_are_cached(monkeypatch):
+    node, fetcher = make_node(TranscriptsDisabled(VIDEO_ID), monkeypatch)
+    extract_twice(node)
+    assert fetcher.calls == 1
+    assert node.transcript_store.get_failure(VIDEO_ID) is not None
@@ -0,0 +1,21 @@
+from src.transcripts.normalizer import DEFAULT_MAX_TOKENS, TranscriptNormalizer
+
+
+def test_default_budget_truncates_long_transcripts(monkeypatch):
+    monkeypatch.delenv("TRANSCRIPT_MAX_TOKENS", raising=False)
+    normalizer = TranscriptNormalizer.from_env()
+    assert normalizer.max_tokens == DEFAULT_MAX_TOKENS
+
+    normalizer.count_tokens = lambda text: len(text.split())
+    lines = [f"sentence number {i} of a very long talk" for i in range(DEFAULT_MAX_TOKENS)]
+    text, stats = normalizer.normalize(lines)
+    assert stats["truncated"]
+    assert stats["output_tokens"] <= DEFAULT_MAX_TOKENS
+    assert len(text.split()) == stats["output_tokens"]
+
+
+def test_zero_budget_keeps_everything():
+    normalizer = TranscriptNormalizer(max_tokens=0)
+    text, stats = normalizer.normalize(["[Music] um hello there", "hello there", "general kenobi"])
+    assert text == "hello there general kenobi"
+    assert not stats["truncated"]
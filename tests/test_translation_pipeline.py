@@ -0,0 +1,90 @@
+import asyncio
+
+from src.llms.fakellm import FakeChatModel
+from src.nodes.blog_node import BlogNode, TranslationConfig
+from src.nodes.translation_pipeline import TranslationPipeline, _SectionStreamHandler
+
+BLOG = "# Title\n\n## First\n\nOne.\n\n## Second\n\nTwo.\n\n## Third\n\nThree.\n"
+
+
+async def stream_attempt(handler, text):
+    await handler.on_chat_model_start({}, [])
+    for token in text.split(" "):
+        await handler.on_llm_new_token(token + " ")
+    await asyncio.sleep(0.05)
+
+
+def test_retry_does_not_reemit_sections():
+    async def scenario():
+        node = BlogNode(FakeChatModel(latency=0), translation_config=TranslationConfig(max_concurrency=2))
+        pipeline = TranslationPipeline(node, ["french"])
+        events = []
+        pipeline._writer = events.append
+        handler = _SectionStreamHandler(pipeline)
+
+        await stream_attempt(handler, BLOG)
+        await stream_attempt(handler, BLOG)
+        await pipeline.finish({"title": "Title", "content": BLOG})
+        return events
+
+    events = asyncio.run(scenario())
+    indexes = [event["index"] for event in events if event["event"] == "translated_section"]
+    assert len(indexes) == len(set(indexes))
+    assert [event["attempt"] for event in events if event["event"] == "generation_restarted"] == [2]
+
+
+def test_failed_unwanted_translation_is_retrieved():
+    async def scenario():
+        node = BlogNode(FakeChatModel(latency=0))
+        pipeline = TranslationPipeline(node, ["french"])
+
+        async def failing(kind, text, language):
+            # the title is still pending, so in-order emission never looks at the failed section
+            if kind == "title":
+                await asyncio.sleep(10)
+            raise RuntimeError("translation failed")
+
+        pipeline._run = failing
+        pipeline.feed("# Draft\n\n## Old section\n\nold\n\n## Next\n\nmore\n\n## ")
+        await asyncio.sleep(0.01)
+        pipeline._run = lambda kind, text, language: asyncio.sleep(0, result=text)
+        await pipeline.finish({"title": "Final", "content": "## New\n\nnew\n"})
+        # asyncio logs "Task exception was never retrieved" for tasks still flagged here
+        return [key for key, task in pipeline._tasks.items() if not task.done() or task._log_traceback]
+
+    assert asyncio.run(scenario()) == []
+
+
+class FlakySectionModel(FakeChatModel):
+    """
+    Fails the French translation of the "Details" section on its first
+    `failures` calls, which outlasts the pipeline's own retries
+    """
+
+    failures: int = 3
+
+    def _text(self, messages):
+        prompt = str(messages[-1].content) if messages else ""
+        if "SECTION:" in prompt and "into french" in prompt and "## Details" in prompt and self.failures:
+            self.failures -= 1
+            raise RuntimeError("bad section")
+        return super()._text(messages)
+
+
+def test_failed_section_leaves_the_language_to_the_translation_node():
+    from src.graphs.registry import GraphRegistry
+    from src.llms.fakellm import FakeLLM
+
+    class FlakyLLM(FakeLLM):
+        def get_llm(self, use_fallback=False, model=None):
+            with self._lock:
+                if "flaky" not in self._clients:
+                    self._clients["flaky"] = FlakySectionModel(model_name="fake-primary", latency=0)
+                return self._clients["flaky"]
+
+    graph = GraphRegistry(lambda: FlakyLLM(latency=0)).get("topic")
+    state = asyncio.run(graph.ainvoke({"topic": "Rust", "current_language": "english", "languages": ["french", "hindi"]}))
+
+    assert state["blog"]["title"] == "Fake Blog"
+    assert sorted(state["translations"]) == ["french", "hindi"]
+    assert "## Details" in state["translations"]["french"]["content"]